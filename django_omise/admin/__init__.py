@@ -1,7 +1,9 @@
+from .actions import export_as_csv, export_as_jsonl, reload_from_omise
 from .admin import (
     CardInline,
     ChargeScheduleInline,
     ChargeInline,
+    EventInline,
     CustomerAdmin,
     CardAdmin,
     RefundAdmin,
@@ -13,4 +15,18 @@ from .admin import (
     ScheduleAdmin,
     OccurrenceAdmin,
     ChargeScheduleAdmin,
+    ChargeDailyTotalAdmin,
+    TransactionAdmin,
+    BalanceAdmin,
+    DisputeInline,
+    DisputeAdmin,
+    TransferInline,
+    RecipientAdmin,
+    TransferAdmin,
 )
+from .paginator import (
+    EstimatedCountAdminMixin,
+    EstimatedCountChangeList,
+    EstimatedCountPaginator,
+)
+from .users import OmiseUserAdminMixin
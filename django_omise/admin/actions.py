@@ -0,0 +1,87 @@
+from django.contrib import admin, messages
+from django.contrib.admin.utils import model_ngettext
+from django.db.models.query import QuerySet
+from django.http import HttpRequest, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.translation import gettext as _
+from django.utils.translation import gettext_lazy
+
+from django_omise.utils.core_utils import setting
+from django_omise.utils.export_utils import EXPORT_CONTENT_TYPES, iter_export
+
+
+@admin.action(
+    description=gettext_lazy("Reload selected %(verbose_name_plural)s from Omise")
+)
+def reload_from_omise(
+    modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet
+) -> None:
+    """
+    Admin action to reload the selected objects from Omise's server with bulk queries.
+
+    The objects are retrieved concurrently, up to setting OMISE_ADMIN_RELOAD_MAX_WORKERS
+    at a time, and the successes and failures are reported in one message.
+    """
+    reloaded_objects, errors = queryset.model.bulk_reload_from_omise(
+        objects=queryset,
+        max_workers=setting("OMISE_ADMIN_RELOAD_MAX_WORKERS", 8),
+    )
+
+    message = _("Reloaded %(count)d %(items)s from Omise.") % {
+        "count": len(reloaded_objects),
+        "items": model_ngettext(queryset.model._meta, len(reloaded_objects)),
+    }
+
+    if errors:
+        message += " " + _("Failed to reload %(count)d: %(errors)s") % {
+            "count": len(errors),
+            "errors": "; ".join(
+                f"{object_id} ({error!r})" for object_id, error in errors.items()
+            ),
+        }
+
+    modeladmin.message_user(
+        request, message, messages.WARNING if errors else messages.SUCCESS
+    )
+
+
+def export_response(queryset: QuerySet, export_format: str) -> StreamingHttpResponse:
+    """
+    Stream the objects of a queryset as a file attachment, in constant memory.
+
+    :param queryset: The queryset to export.
+    :param export_format: csv or jsonl.
+
+    :returns: An instance of StreamingHttpResponse.
+    """
+    response = StreamingHttpResponse(
+        iter_export(
+            queryset,
+            export_format=export_format,
+            chunk_size=setting("OMISE_EXPORT_CHUNK_SIZE", 2000),
+        ),
+        content_type=EXPORT_CONTENT_TYPES[export_format],
+    )
+
+    filename = f"{queryset.model._meta.verbose_name_plural}-{timezone.localdate():%Y%m%d}.{export_format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    return response
+
+
+@admin.action(
+    description=gettext_lazy("Export selected %(verbose_name_plural)s as CSV")
+)
+def export_as_csv(
+    modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet
+) -> StreamingHttpResponse:
+    return export_response(queryset, export_format="csv")
+
+
+@admin.action(
+    description=gettext_lazy("Export selected %(verbose_name_plural)s as JSON lines")
+)
+def export_as_jsonl(
+    modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet
+) -> StreamingHttpResponse:
+    return export_response(queryset, export_format="jsonl")
@@ -1,6 +1,8 @@
 import json
 
 from django.contrib import admin
+from django.contrib.contenttypes.admin import GenericTabularInline
+from django.db.models import Sum
 from django.db.models.query import QuerySet
 from django.http import HttpRequest
 from django.utils.html import format_html
@@ -9,8 +11,16 @@ from django_omise.models.choices import ChargeStatus, ScheduleStatus
 
 # Register your models here.
 from django_omise.models.core import Card, Charge, Customer, Refund, Source
+from django_omise.models.dispute import Dispute
 from django_omise.models.event import Event
+from django_omise.models.report import ChargeDailyTotal
 from django_omise.models.schedule import ChargeSchedule, Occurrence, Schedule
+from django_omise.models.settlement import Balance, Transaction
+from django_omise.models.transfer import Recipient, Transfer
+
+from .actions import export_as_csv, export_as_jsonl, reload_from_omise
+from .paginator import EstimatedCountAdminMixin
+from .users import OmiseUserAdminMixin
 
 
 class CardInline(admin.TabularInline):
@@ -199,8 +209,30 @@ class ChargeInline(admin.TabularInline):
         return False
 
 
+class EventInline(GenericTabularInline):
+    """
+    The timeline of the webhook events of an Omise object.
+    """
+
+    model = Event
+    extra = 0
+    can_delete = False
+
+    show_change_link = True
+
+    fields = ["id", "event_type", "livemode", "date_created"]
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(Customer)
-class CustomerAdmin(admin.ModelAdmin):
+class CustomerAdmin(OmiseUserAdminMixin, admin.ModelAdmin):
+    actions = [reload_from_omise, export_as_csv, export_as_jsonl]
 
     search_fields = (
         "user__email",
@@ -223,6 +255,7 @@ class CustomerAdmin(admin.ModelAdmin):
         CardInline,
         ChargeScheduleInline,
         ChargeInline,
+        EventInline,
     ]
 
     list_filter = (
@@ -234,14 +267,16 @@ class CustomerAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[Customer]:
         qs = super().get_queryset(request)
-        qs = qs.select_related(
-            "user",
-        )
+        qs = self.select_related_user(qs)
         return qs
 
 
 @admin.register(Card)
-class CardAdmin(admin.ModelAdmin):
+class CardAdmin(OmiseUserAdminMixin, EstimatedCountAdminMixin, admin.ModelAdmin):
+    actions = [reload_from_omise]
+
+    user_lookup = "customer__user"
+
     list_display = (
         "customer",
         "id",
@@ -275,12 +310,14 @@ class CardAdmin(admin.ModelAdmin):
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[Card]:
         qs = super().get_queryset(request)
-        qs = qs.select_related("customer", "customer__user")
+        qs = self.select_related_user(qs.select_related("customer"))
         return qs
 
 
 @admin.register(Refund)
 class RefundAdmin(admin.ModelAdmin):
+    actions = [reload_from_omise, export_as_csv, export_as_jsonl]
+
     list_display = (
         "id",
         "livemode",
@@ -314,7 +351,9 @@ class RefundAdmin(admin.ModelAdmin):
 
 
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
+class EventAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
+    actions = [reload_from_omise, export_as_csv, export_as_jsonl]
+
     list_display = (
         "id",
         "livemode",
@@ -361,8 +400,26 @@ class RefundInline(admin.TabularInline):
     show_change_link = True
 
 
+class DisputeInline(admin.TabularInline):
+    model = Dispute
+
+    extra = 0
+
+    fields = ["id", "livemode", "status", "human_amount", "currency", "reason_code"]
+    readonly_fields = ("human_amount",)
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    show_change_link = True
+
+
 @admin.register(Charge)
-class ChargeAdmin(admin.ModelAdmin):
+class ChargeAdmin(OmiseUserAdminMixin, EstimatedCountAdminMixin, admin.ModelAdmin):
+    actions = [reload_from_omise, export_as_csv, export_as_jsonl]
+
+    user_lookup = "customer__user"
+
     search_fields = (
         "id",
         "customer__user__email",
@@ -412,6 +469,8 @@ class ChargeAdmin(admin.ModelAdmin):
 
     inlines = [
         RefundInline,
+        DisputeInline,
+        EventInline,
     ]
 
     readonly_fields = ("uid", "source_type", "colorized_status")
@@ -466,6 +525,8 @@ class ChargeAdmin(admin.ModelAdmin):
 
 @admin.register(Source)
 class SourceAdmin(admin.ModelAdmin):
+    actions = [reload_from_omise]
+
     list_display = (
         "id",
         "amount",
@@ -510,7 +571,11 @@ class OccurrenceInline(admin.TabularInline):
 
 
 @admin.register(Schedule)
-class ScheduleAdmin(admin.ModelAdmin):
+class ScheduleAdmin(OmiseUserAdminMixin, admin.ModelAdmin):
+    actions = [reload_from_omise]
+
+    user_lookup = "charge__customer__user"
+
     list_display = (
         "id",
         "colorized_status",
@@ -545,6 +610,7 @@ class ScheduleAdmin(admin.ModelAdmin):
         "every",
         "in_words",
         "next_occurrences_on",
+        "on",
         "period",
         "start_on",
         "status",
@@ -608,6 +674,8 @@ class ScheduleAdmin(admin.ModelAdmin):
 
 @admin.register(Occurrence)
 class OccurrenceAdmin(admin.ModelAdmin):
+    actions = [reload_from_omise]
+
     list_display = (
         "id",
         "livemode",
@@ -665,3 +733,261 @@ class ChargeScheduleAdmin(admin.ModelAdmin):
 
     def has_change_permission(self, request, obj=None):
         return False
+
+
+@admin.register(ChargeDailyTotal)
+class ChargeDailyTotalAdmin(admin.ModelAdmin):
+    """
+    Revenue dashboard, reading only from the daily totals of charges.
+    """
+
+    list_display = (
+        "date",
+        "currency",
+        "status",
+        "source_type",
+        "count",
+        "human_amount",
+        "human_net",
+        "human_refunded_amount",
+    )
+    list_filter = (
+        "date",
+        "currency",
+        "status",
+        "source_type",
+    )
+    date_hierarchy = "date"
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[ChargeDailyTotal]:
+        qs = super().get_queryset(request)
+        qs = qs.exclude(count=0)
+        return qs
+
+    def changelist_view(self, request, extra_context=None):
+        response = super().changelist_view(request, extra_context=extra_context)
+
+        changelist = getattr(response, "context_data", {}).get("cl")
+
+        if changelist is not None:
+            response.context_data["totals"] = [
+                ChargeDailyTotal(currency=row.pop("currency"), **row)
+                for row in changelist.queryset.order_by("currency")
+                .values("currency")
+                .annotate(
+                    count=Sum("count"),
+                    amount=Sum("amount"),
+                    net=Sum("net"),
+                    refunded_amount=Sum("refunded_amount"),
+                )
+            ]
+
+        return response
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Transaction)
+class TransactionAdmin(EstimatedCountAdminMixin, admin.ModelAdmin):
+    actions = [reload_from_omise, export_as_csv, export_as_jsonl]
+
+    list_display = (
+        "id",
+        "livemode",
+        "created_at",
+        "direction",
+        "key",
+        "human_amount",
+        "currency",
+        "origin",
+        "transferable_at",
+    )
+    list_filter = (
+        "livemode",
+        "created_at",
+        "direction",
+        "currency",
+        "key",
+    )
+    search_fields = [
+        "id",
+        "origin",
+    ]
+    readonly_fields = ("uid",)
+    date_hierarchy = "created_at"
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Balance)
+class BalanceAdmin(admin.ModelAdmin):
+    list_display = (
+        "date_created",
+        "livemode",
+        "currency",
+        "human_total",
+        "human_transferable",
+        "reserve",
+        "on_hold",
+    )
+    list_filter = (
+        "livemode",
+        "date_created",
+        "currency",
+    )
+    date_hierarchy = "date_created"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Dispute)
+class DisputeAdmin(OmiseUserAdminMixin, admin.ModelAdmin):
+    actions = [reload_from_omise, export_as_csv, export_as_jsonl]
+
+    user_lookup = "charge__customer__user"
+
+    list_display = (
+        "id",
+        "livemode",
+        "date_created",
+        "status",
+        "charge",
+        "human_amount",
+        "currency",
+        "reason_code",
+        "closed_at",
+    )
+    list_filter = (
+        "livemode",
+        "date_created",
+        "date_updated",
+        "status",
+        "reason_code",
+    )
+    search_fields = [
+        "id",
+        "charge__id",
+        "charge__customer__user__username",
+        "charge__customer__user__email",
+    ]
+    readonly_fields = ("uid",)
+
+    inlines = [
+        EventInline,
+    ]
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Dispute]:
+        qs = super().get_queryset(request)
+        qs = self.select_related_user(qs.select_related("charge"))
+        return qs
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+class TransferInline(admin.TabularInline):
+    model = Transfer
+
+    extra = 0
+
+    fields = ["id", "livemode", "human_amount", "currency", "sent", "paid"]
+    readonly_fields = ("human_amount",)
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    show_change_link = True
+
+
+@admin.register(Recipient)
+class RecipientAdmin(admin.ModelAdmin):
+    actions = [reload_from_omise, export_as_csv, export_as_jsonl]
+
+    list_display = (
+        "id",
+        "livemode",
+        "date_created",
+        "name",
+        "email",
+        "type",
+        "verified",
+        "active",
+        "deleted",
+    )
+    list_filter = (
+        "livemode",
+        "date_created",
+        "type",
+        "verified",
+        "active",
+        "deleted",
+    )
+    search_fields = [
+        "id",
+        "name",
+        "email",
+    ]
+    readonly_fields = ("uid",)
+
+    inlines = [
+        TransferInline,
+        EventInline,
+    ]
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Transfer)
+class TransferAdmin(admin.ModelAdmin):
+    actions = [reload_from_omise, export_as_csv, export_as_jsonl]
+
+    list_display = (
+        "id",
+        "livemode",
+        "date_created",
+        "recipient",
+        "human_amount",
+        "currency",
+        "net",
+        "sent",
+        "paid",
+        "paid_at",
+    )
+    list_filter = (
+        "livemode",
+        "date_created",
+        "sent",
+        "paid",
+        "deleted",
+    )
+    search_fields = [
+        "id",
+        "recipient__id",
+        "recipient__name",
+    ]
+    readonly_fields = ("uid",)
+
+    inlines = [
+        EventInline,
+    ]
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Transfer]:
+        qs = super().get_queryset(request)
+        qs = qs.select_related("recipient")
+        return qs
+
+    def has_change_permission(self, request, obj=None):
+        return False
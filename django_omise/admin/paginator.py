@@ -0,0 +1,119 @@
+import hashlib
+import json
+
+from django.contrib.admin.views.main import ChangeList
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from django_omise.utils.core_utils import setting
+
+from typing import Optional
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator which counts large querysets from the database planner estimates.
+
+    Enabled with setting OMISE_ADMIN_ESTIMATED_COUNT_THRESHOLD. When the planner
+    estimates at least this many rows, the estimate is used as the count. Otherwise,
+    or when the database cannot estimate, the exact count is cached for
+    OMISE_ADMIN_COUNT_CACHE_TIMEOUT seconds.
+    """
+
+    estimated = False
+
+    @cached_property
+    def count(self) -> int:
+        threshold = setting("OMISE_ADMIN_ESTIMATED_COUNT_THRESHOLD")
+
+        if threshold is None:
+            return self.object_list.count()
+
+        estimated_count = self.get_estimated_count()
+
+        if estimated_count is not None and estimated_count >= threshold:
+            self.estimated = True
+            return estimated_count
+
+        return self.get_cached_count()
+
+    def get_estimated_count(self) -> Optional[int]:
+        """
+        Get the number of rows of the queryset estimated by the database planner.
+
+        :returns: The estimated number of rows, None if the database is not PostgreSQL.
+        """
+        connection = connections[self.object_list.db]
+
+        if connection.vendor != "postgresql":
+            return None
+
+        sql, params = self.object_list.query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def get_cached_count(self) -> int:
+        """
+        Get the exact number of rows of the queryset, cached for OMISE_ADMIN_COUNT_CACHE_TIMEOUT seconds.
+
+        :returns: The number of rows.
+        """
+        timeout = setting("OMISE_ADMIN_COUNT_CACHE_TIMEOUT", 60)
+
+        if not timeout:
+            return self.object_list.count()
+
+        sql, params = self.object_list.query.sql_with_params()
+        query_hash = hashlib.md5(
+            f"{self.object_list.db}:{sql}:{params}".encode()
+        ).hexdigest()
+
+        return cache.get_or_set(
+            f"django_omise:admin_count:{query_hash}",
+            self.object_list.count,
+            timeout,
+        )
+
+
+class EstimatedCountChangeList(ChangeList):
+    """
+    ChangeList which hides the "Show all" link when the count is estimated.
+
+    A "Show all" request of an estimated changelist shows its first page instead.
+    """
+
+    def get_results(self, request):
+        super().get_results(request)
+
+        if self.paginator.estimated:
+            self.can_show_all = False
+
+            if self.show_all and self.multi_page:
+                self.show_all = False
+                self.result_list = self.paginator.page(1).object_list
+
+
+class EstimatedCountAdminMixin:
+    """
+    ModelAdmin mixin to paginate large changelists with EstimatedCountPaginator.
+
+    The count of the unfiltered changelist is skipped when the paginator is enabled.
+    """
+
+    paginator = EstimatedCountPaginator
+
+    @property
+    def show_full_result_count(self) -> bool:
+        return setting("OMISE_ADMIN_ESTIMATED_COUNT_THRESHOLD") is None
+
+    def get_changelist(self, request, **kwargs):
+        return EstimatedCountChangeList
@@ -0,0 +1,103 @@
+import operator
+
+from functools import reduce
+
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.db.models.query import QuerySet
+from django.utils.text import smart_split, unescape_string_literal
+
+from django_omise.routers import uses_separate_database
+
+from typing import List
+
+
+class OmiseUserAdminMixin:
+    """
+    ModelAdmin mixin for Omise objects related to users, e.g. through their customer.
+
+    When the Omise models are stored in another database than the users, see setting
+    OMISE_DATABASE, the users are prefetched instead of joined, and the search fields
+    of the users are searched in the database of the users first.
+    """
+
+    user_lookup = "user"
+    user_search_limit = 1000
+
+    def select_related_user(self, queryset: QuerySet) -> QuerySet:
+        """
+        Load the users of the objects with the queryset.
+
+        :param queryset: The queryset of the admin.
+
+        :returns: The queryset.
+        """
+        if uses_separate_database():
+            return queryset.prefetch_related(self.user_lookup)
+
+        return queryset.select_related(self.user_lookup)
+
+    def get_user_search_fields(self, request) -> List[str]:
+        """
+        Get the search fields of the users, without the user_lookup prefix.
+        """
+        prefix = f"{self.user_lookup}__"
+
+        return [
+            field[len(prefix) :]
+            for field in super().get_search_fields(request)
+            if field.startswith(prefix)
+        ]
+
+    def get_search_fields(self, request):
+        search_fields = super().get_search_fields(request)
+
+        if not uses_separate_database():
+            return search_fields
+
+        prefix = f"{self.user_lookup}__"
+        return [field for field in search_fields if not field.startswith(prefix)]
+
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+
+        user_search_fields = self.get_user_search_fields(request)
+
+        if not search_term or not user_search_fields or not uses_separate_database():
+            return results, may_have_duplicates
+
+        if not self.get_search_fields(request):
+            results = queryset.none()
+
+        user_ids = self.get_user_ids(user_search_fields, search_term)
+        results = results | queryset.filter(**{f"{self.user_lookup}__in": user_ids})
+
+        return results, may_have_duplicates
+
+    def get_user_ids(self, search_fields: List[str], search_term: str) -> List:
+        """
+        Search the users in their database.
+
+        Every word of the search term must be found in one of the search fields.
+
+        :param search_fields: The search fields of the user model.
+        :param search_term: The search term of the changelist.
+
+        :returns: List of the primary keys of at most user_search_limit users.
+        """
+        users = get_user_model()._default_manager.all()
+
+        for bit in smart_split(search_term):
+            if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+                bit = unescape_string_literal(bit)
+
+            users = users.filter(
+                reduce(
+                    operator.or_,
+                    [Q(**{f"{field}__icontains": bit}) for field in search_fields],
+                )
+            )
+
+        return list(users.values_list("pk", flat=True)[: self.user_search_limit])
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class DjangoOmiseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'django_omise'
+
+    def ready(self):
+        from .payment_methods import get_enabled_payment_methods
+
+        get_enabled_payment_methods()
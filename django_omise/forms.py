@@ -3,14 +3,72 @@ from django.conf import settings
 
 from .models.core import Customer, Card
 from .models.choices import Currency, ChargeSourceType
-from .omise import omise
-from .utils.core_utils import get_payment_methods_for_form
+from .omise import omise, retrieve
+from .payment_methods import PAYMENT_METHODS, get_enabled_payment_methods
 
 from django.utils.translation import gettext_lazy as _
 
 from typing import Optional, List, Dict
 
 
+class PrefetchedModelChoiceIterator(forms.models.ModelChoiceIterator):
+    def __iter__(self):
+        if self.field.objects is None:
+            yield from super().__iter__()
+            return
+
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+
+        for obj in self.field.objects:
+            yield self.choice(obj)
+
+    def __len__(self):
+        if self.field.objects is None:
+            return super().__len__()
+
+        return len(self.field.objects) + (
+            1 if self.field.empty_label is not None else 0
+        )
+
+
+class PrefetchedModelChoiceField(forms.ModelChoiceField):
+    """
+    A ModelChoiceField which can be given a list of already loaded objects.
+
+    When ``objects`` is set, the choices are rendered and validated against the
+    list instead of querying the queryset again.
+    """
+
+    iterator = PrefetchedModelChoiceIterator
+
+    def __init__(self, *args, **kwargs):
+        self.objects = None
+        super().__init__(*args, **kwargs)
+
+    def to_python(self, value):
+        if self.objects is None:
+            return super().to_python(value)
+
+        if value in self.empty_values:
+            return None
+
+        key = self.to_field_name or "pk"
+
+        if isinstance(value, self.queryset.model):
+            value = getattr(value, key)
+
+        for obj in self.objects:
+            if str(getattr(obj, key)) == str(value):
+                return obj
+
+        raise forms.ValidationError(
+            self.error_messages["invalid_choice"],
+            code="invalid_choice",
+            params={"value": value},
+        )
+
+
 class IssueRefundForm(forms.Form):
     def __init__(self, charge, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -82,7 +140,7 @@ class AddCardForm(forms.Form):
         Check that the credit card token is valid.
         """
         try:
-            omise_token = omise.Token.retrieve(self.cleaned_data["omise_token"])
+            omise_token = retrieve(omise.Token, self.cleaned_data["omise_token"])
         except omise.errors.NotFoundError:
             raise forms.ValidationError(
                 _("Error processing the card. Please try again.")
@@ -196,7 +254,7 @@ class PayWithNewCardForm(forms.Form):
             return None
 
         try:
-            omise_token = omise.Token.retrieve(self.cleaned_data["omise_token"])
+            omise_token = retrieve(omise.Token, self.cleaned_data["omise_token"])
         except omise.errors.NotFoundError:
             raise forms.ValidationError(
                 _("Error processing the card. Please try again.")
@@ -218,7 +276,7 @@ class PayWithNewCardForm(forms.Form):
 
 class PayWithExistingCardForm(forms.Form):
 
-    card = forms.ModelChoiceField(
+    card = PrefetchedModelChoiceField(
         queryset=None,
         widget=forms.RadioSelect,
         required=False,
@@ -277,6 +335,7 @@ class CheckoutForm(
         amount: int,
         currency: Currency,
         payment_methods: Optional[List[str]] = None,
+        omise_customer: Optional[Customer] = None,
         *args,
         **kwargs
     ):
@@ -286,79 +345,63 @@ class CheckoutForm(
         self.amount = amount
         self.currency = currency
 
-        all_payment_methods = {
-            "old_card": _("Pay with your card"),
-            "new_card": _("Pay with a new card"),
-            "internet_banking": _("Internet banking"),
-            "truemoney_wallet": _("TrueMoney Wallet"),
-            ChargeSourceType.PROMPTPAY: ChargeSourceType.PROMPTPAY.label,
-            ChargeSourceType.RABBIT_LINEPAY: ChargeSourceType.RABBIT_LINEPAY.label,
-        }
-
-        payment_methods = {
-            key: value
-            for key, value in all_payment_methods.items()
-            if key in get_payment_methods_for_form(payment_methods)
-        }
+        if payment_methods is not None:
+            payment_methods = tuple(payment_methods)
+
+        enabled_payment_methods = get_enabled_payment_methods(payment_methods)
+        excluded_payment_methods = []
 
         if user is None or user.is_authenticated == False:
 
             del self.fields["keep_card"]
             del self.fields["card"]
 
-            del payment_methods["old_card"]
+            excluded_payment_methods.append("old_card")
 
         else:
 
-            self.omise_customer, created = Customer.get_or_create(user=user)
+            if omise_customer is None:
+                omise_customer, created = Customer.get_or_create_with_live_cards(
+                    user=user
+                )
+
+            self.omise_customer = omise_customer
 
-            if self.omise_customer.cards.live().exists():
+            live_cards = getattr(self.omise_customer, "live_cards", None)
+
+            if live_cards is None:
+                live_cards = list(self.omise_customer.cards.live())
+
+            if live_cards:
 
                 self.fields["payment_method"].initial = "old_card"
                 self.fields["card"].queryset = self.omise_customer.cards.live()
-                self.fields["card"].initial = self.omise_customer.cards.live().first()
+                self.fields["card"].objects = live_cards
+                self.fields["card"].initial = live_cards[0]
 
             else:
 
-                del payment_methods["old_card"]
+                excluded_payment_methods.append("old_card")
                 del self.fields["card"]
 
-        payment_method_choices = []
-        for key, value in payment_methods.items():
-            payment_method_choices.append((key, value))
-        self.fields["payment_method"].choices = payment_method_choices
+        self.fields["payment_method"].choices = [
+            (payment_method.key, payment_method.label)
+            for payment_method in enabled_payment_methods
+            if payment_method.key not in excluded_payment_methods
+        ]
 
     def clean(self):
         cleaned_data = super().clean()
-        payment_method = cleaned_data["payment_method"]
-        omise_token = cleaned_data.get("omise_token")
-        card = cleaned_data.get("card")
-        bank = cleaned_data.get("bank")
-
-        if payment_method == "new_card" and omise_token is None:
-            raise forms.ValidationError(
-                {"card_number": _("You need to provide a new card details")}
-            )
+        payment_method = PAYMENT_METHODS.get(cleaned_data.get("payment_method"))
 
-        if payment_method == "old_card" and card is None:
-            raise forms.ValidationError(
-                {"card": _("You need to select at least one card")}
-            )
-
-        if payment_method == "internet_banking" and not bank:
-            raise forms.ValidationError(
-                {"bank": _("You need to select at least one bank")}
-            )
+        if payment_method is None:
+            return cleaned_data
 
-        phone_number = cleaned_data.get("phone_number")
-        if payment_method == "truemoney_wallet" and not phone_number:
-            raise forms.ValidationError(
-                {
-                    "phone_number": _(
-                        "Mobile number is required for TrueMoney Wallet payment"
-                    )
-                }
-            )
+        for field_name in payment_method.required_fields:
+            if cleaned_data.get(field_name) in (None, ""):
+                raise forms.ValidationError(
+                    {payment_method.error_field: payment_method.error_message}
+                )
 
     def get_charge_type_details(self) -> Dict:
         """
@@ -371,6 +414,7 @@ class CheckoutForm(
         """
 
         payment_method = self.cleaned_data["payment_method"]
+        source_type = PAYMENT_METHODS[payment_method].source_type
         charge_details = {}
 
         if payment_method == "new_card":
@@ -387,17 +431,11 @@ class CheckoutForm(
         if payment_method == "internet_banking":
             charge_details["source"] = {"type": self.cleaned_data["bank"]}
 
-        if payment_method == "truemoney_wallet":
-            charge_details["source"] = {
-                "type": ChargeSourceType.TRUEMONEY_WALLET,
-                "phone_number": self.cleaned_data["phone_number"],
-            }
+        if source_type is not None:
+            charge_details["source"] = {"type": source_type}
 
-        if payment_method in [
-            ChargeSourceType.PROMPTPAY,
-            ChargeSourceType.RABBIT_LINEPAY,
-        ]:
-            charge_details["source"] = {"type": payment_method}
+            for field_name in PAYMENT_METHODS[payment_method].required_fields:
+                charge_details["source"][field_name] = self.cleaned_data[field_name]
 
         return charge_details
 
@@ -414,15 +452,7 @@ class CheckoutForm(
     @property
     def new_card_fields(self) -> List[forms.fields.Field]:
 
-        new_card_field_names = [
-            "omise_token",
-            "card_number",
-            "name_on_card",
-            "expiration_year",
-            "expiration_month",
-            "security_number",
-            "keep_card",
-        ]
+        new_card_field_names = PAYMENT_METHODS["new_card"].form_fields
 
         return [
             field
@@ -433,9 +463,7 @@ class CheckoutForm(
     @property
     def truemoney_fields(self) -> List[forms.fields.Field]:
 
-        fields = [
-            "phone_number",
-        ]
+        fields = PAYMENT_METHODS["truemoney_wallet"].form_fields
 
         return [field for field in self if field.name in fields and not field.is_hidden]
 
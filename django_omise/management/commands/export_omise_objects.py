@@ -0,0 +1,71 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_omise.utils.export_utils import (
+    EXPORT_FORMATS,
+    EXPORT_MODELS,
+    filter_export_queryset,
+    get_export_model,
+    iter_export,
+)
+
+
+class Command(BaseCommand):
+    help = "Export charges, refunds, events or customers as CSV or JSON lines, in constant memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument("object", choices=list(EXPORT_MODELS))
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+        parser.add_argument(
+            "--date-from",
+            type=datetime.date.fromisoformat,
+            help="Only export objects created on or after this date, in ISO 8601 format.",
+        )
+        parser.add_argument(
+            "--date-to",
+            type=datetime.date.fromisoformat,
+            help="Only export objects created on or before this date, in ISO 8601 format.",
+        )
+        parser.add_argument(
+            "--status",
+            action="append",
+            help="Only export objects with this status, or event type for events. Can be repeated.",
+        )
+        parser.add_argument(
+            "--output",
+            help="The file to write to. Default to the standard output.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="The number of rows fetched from the database at a time.",
+        )
+
+    def handle(self, *args, **options):
+        model = get_export_model(options["object"])
+
+        try:
+            queryset = filter_export_queryset(
+                model.objects.order_by("date_created", "pk"),
+                date_from=options["date_from"],
+                date_to=options["date_to"],
+                statuses=options["status"],
+            )
+        except ValueError as e:
+            raise CommandError(e)
+
+        lines = iter_export(
+            queryset,
+            export_format=options["format"],
+            chunk_size=options["chunk_size"],
+        )
+
+        if options["output"] is None:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        with open(options["output"], "w", newline="") as output:
+            output.writelines(lines)
@@ -0,0 +1,72 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from django_omise.models.settlement import Balance, Transaction
+
+
+class Command(BaseCommand):
+    help = (
+        "Import the transactions created on Omise in a date range, and optionally "
+        "save a snapshot of the current balance."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date-from",
+            type=datetime.date.fromisoformat,
+            help="The first day to import, in ISO 8601 format. Default to yesterday.",
+        )
+        parser.add_argument(
+            "--date-to",
+            type=datetime.date.fromisoformat,
+            help="The last day to import, in ISO 8601 format. Default to today.",
+        )
+        parser.add_argument(
+            "--window-days",
+            type=int,
+            default=1,
+            help="The number of days listed per window of requests to Omise.",
+        )
+        parser.add_argument(
+            "--rate-limit",
+            type=float,
+            help="The maximum number of requests to Omise per second.",
+        )
+        parser.add_argument(
+            "--balance",
+            action="store_true",
+            help="Save a snapshot of the current balance after the import.",
+        )
+
+    def handle(self, *args, **options):
+        if options["window_days"] < 1:
+            raise CommandError("--window-days must be at least 1")
+
+        today = timezone.localdate()
+        date_from = options["date_from"] or today - datetime.timedelta(days=1)
+        date_to = options["date_to"] or max(date_from, today)
+
+        count = Transaction.import_from_omise(
+            date_from=date_from,
+            date_to=date_to,
+            window_days=options["window_days"],
+            rate_limit=options["rate_limit"],
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {count} transactions from {date_from} to {date_to}."
+            )
+        )
+
+        if options["balance"]:
+            balance = Balance.create_snapshot()
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Saved the balance: {balance.human_total} {balance.currency}, "
+                    f"{balance.human_transferable} transferable."
+                )
+            )
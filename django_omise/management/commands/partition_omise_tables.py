@@ -0,0 +1,183 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from django_omise.utils.partition_utils import (
+    PARTITION_KEY,
+    PARTITIONED_MODELS,
+    add_months,
+    get_convert_sql,
+    get_create_partition_sql,
+    get_detach_partition_sql,
+    get_first_month,
+    get_ids_table_name,
+    get_partition_months,
+    get_partitioned_model,
+    get_referencing_constraints,
+    has_default_rows,
+    is_partitioned,
+    iter_months,
+    month_start,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Partition the tables of Omise charges and events by month of creation on "
+        "PostgreSQL, create the partitions of the upcoming months and detach old ones. "
+        "Opt-in: converting a table with --convert changes its primary key to "
+        "(id, date_created) and its unique columns to be unique with date_created. "
+        "Its ids stay unique in a table of ids, which the foreign key constraints "
+        "referencing it, e.g. of refunds to charges, reference instead."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--table",
+            action="append",
+            dest="tables",
+            choices=list(PARTITIONED_MODELS),
+            help="The table to partition, can be repeated. Default to all tables.",
+        )
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help=(
+                "Convert the tables which are not partitioned yet. The rows are copied "
+                "to the partitions and the tables are locked meanwhile. Their primary keys "
+                "become (id, date_created), and the foreign key constraints referencing "
+                "them reference their tables of ids instead."
+            ),
+        )
+        parser.add_argument(
+            "--noinput",
+            "--no-input",
+            action="store_false",
+            dest="interactive",
+            help="Convert the tables without asking for confirmation.",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="The number of months after the current month to create partitions for.",
+        )
+        parser.add_argument(
+            "--detach-before",
+            type=datetime.date.fromisoformat,
+            help="Detach the partitions of the months before this date, in ISO 8601 format.",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop the detached partitions instead of keeping them as tables.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the SQL statements instead of running them.",
+        )
+
+    def handle(self, *args, **options):
+        for name in options["tables"] or list(PARTITIONED_MODELS):
+            model = get_partitioned_model(name)
+            using = router.db_for_write(model)
+            connection = connections[using]
+
+            if connection.vendor != "postgresql":
+                raise CommandError(
+                    f"Partitioning requires PostgreSQL, the database {using} is {connection.vendor}"
+                )
+
+            if options["convert"] and not is_partitioned(
+                connection, model._meta.db_table
+            ):
+                self.confirm_convert(connection, model, options)
+
+            statements = self.get_statements(model, using, options)
+
+            if options["dry_run"]:
+                for statement in statements:
+                    self.stdout.write(f"{statement};")
+                continue
+
+            with transaction.atomic(using=using):
+                with connection.cursor() as cursor:
+                    for statement in statements:
+                        cursor.execute(statement)
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Ran {len(statements)} statements on {model._meta.db_table}."
+                )
+            )
+
+    def confirm_convert(self, connection, model, options):
+        """
+        Print what converting the table of a model changes, and ask for confirmation.
+        """
+        table = model._meta.db_table
+        constraints = ", ".join(
+            f"{name} of {referencing_table}"
+            for referencing_table, name, column in get_referencing_constraints(
+                connection, table
+            )
+        )
+        warning = (
+            f"Converting {table} changes its primary key to "
+            f"({model._meta.pk.column}, {PARTITION_KEY}) and makes its unique columns "
+            f"unique with {PARTITION_KEY}. Its ids stay unique in "
+            f"{get_ids_table_name(table)}, which the foreign key constraints "
+            f"referencing it ({constraints or 'none'}) reference instead."
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(f"-- {warning}")
+            return
+
+        self.stdout.write(self.style.WARNING(warning))
+
+        if options["interactive"] and input("Type 'yes' to continue: ") != "yes":
+            raise CommandError(f"The conversion of {table} was cancelled")
+
+    def get_statements(self, model, using, options):
+        connection = connections[using]
+        table = model._meta.db_table
+        current_month = month_start(timezone.localdate())
+        last_month = add_months(current_month, options["months_ahead"])
+
+        if is_partitioned(connection, table):
+            existing_months = get_partition_months(connection, table)
+            statements = [
+                statement
+                for month in iter_months(current_month, last_month)
+                if month not in existing_months
+                for statement in get_create_partition_sql(
+                    connection,
+                    model,
+                    month,
+                    move_rows=has_default_rows(connection, model, month),
+                )
+            ]
+        elif options["convert"]:
+            existing_months = list(
+                iter_months(get_first_month(model, using) or current_month, last_month)
+            )
+            statements = get_convert_sql(connection, model, existing_months)
+        else:
+            raise CommandError(
+                f"The table {table} is not partitioned, run the command with --convert first"
+            )
+
+        if options["detach_before"] is not None:
+            detach_before = month_start(options["detach_before"])
+
+            for month in existing_months:
+                if add_months(month, 1) <= detach_before:
+                    statements += get_detach_partition_sql(
+                        connection, model, month, drop=options["drop"]
+                    )
+
+        return statements
@@ -0,0 +1,31 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+
+from django_omise.models.report import ChargeDailyTotal
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the daily totals of charges of the revenue dashboard from the charges."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date-from",
+            type=datetime.date.fromisoformat,
+            help="The first day to rebuild, in ISO 8601 format. Default to the first charge.",
+        )
+        parser.add_argument(
+            "--date-to",
+            type=datetime.date.fromisoformat,
+            help="The last day to rebuild, in ISO 8601 format. Default to the last charge.",
+        )
+
+    def handle(self, *args, **options):
+        count = ChargeDailyTotal.rebuild(
+            date_from=options["date_from"],
+            date_to=options["date_to"],
+        )
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} daily totals."))
@@ -0,0 +1,111 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from django_omise.utils.reconcile_utils import (
+    CHECKSUM_DAYS,
+    RECONCILED_RESOURCES,
+    reconcile,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the charges and refunds created on Omise with the database day by day, "
+        "and save the objects of the days which differ. The recent days are listed and "
+        "compared by checksums. The older days are counted first, and only the days "
+        "whose counts differ are listed, unless --checksums is set."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resource",
+            action="append",
+            dest="resources",
+            choices=list(RECONCILED_RESOURCES),
+            help="The object to reconcile, can be repeated. Default to all objects.",
+        )
+        parser.add_argument(
+            "--date-from",
+            type=datetime.date.fromisoformat,
+            help="The first day to reconcile, in ISO 8601 format. Default to yesterday.",
+        )
+        parser.add_argument(
+            "--date-to",
+            type=datetime.date.fromisoformat,
+            help="The last day to reconcile, in ISO 8601 format. Default to yesterday.",
+        )
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=4,
+            help="The maximum number of concurrent requests to Omise.",
+        )
+        parser.add_argument(
+            "--rate-limit",
+            type=float,
+            help="The maximum number of requests to Omise per second.",
+        )
+        parser.add_argument(
+            "--checksums",
+            action="store_true",
+            help=(
+                "List every day and compare the statuses and amounts of the objects, "
+                "not only their counts. Finds objects which changed on Omise."
+            ),
+        )
+        parser.add_argument(
+            "--checksum-days",
+            type=int,
+            default=CHECKSUM_DAYS,
+            help=(
+                "The number of recent days, up to today, to list and compare by "
+                "checksums. The older days are counted first."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the differing days without saving the objects.",
+        )
+
+    def handle(self, *args, **options):
+        yesterday = timezone.localdate() - datetime.timedelta(days=1)
+        date_from = options["date_from"] or yesterday
+        date_to = options["date_to"] or max(date_from, yesterday)
+
+        for name in options["resources"] or list(RECONCILED_RESOURCES):
+            results = reconcile(
+                name,
+                date_from=date_from,
+                date_to=date_to,
+                fix=not options["dry_run"],
+                max_workers=options["max_workers"],
+                rate_limit=options["rate_limit"],
+                checksums=options["checksums"],
+                checksum_days=options["checksum_days"],
+            )
+
+            for result in results:
+                if result.error is not None:
+                    self.stderr.write(f"{name} {result.day}: {result.error}")
+                elif not result.matched:
+                    self.stdout.write(
+                        f"{name} {result.day}: {result.remote_count} on Omise, "
+                        f"{result.local_count} on the database, "
+                        f"{len(result.fixed)} differing, "
+                        f"{len(result.unmatched)} not on Omise"
+                    )
+
+            differing = sum(len(result.fixed) for result in results)
+            verb = "Found" if options["dry_run"] else "Saved"
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Reconciled {len(results)} days of {name}s: "
+                    f"{sum(result.matched for result in results)} matched, "
+                    f"{sum(result.listed for result in results)} listed. "
+                    f"{verb} {differing} differing {name}s."
+                )
+            )
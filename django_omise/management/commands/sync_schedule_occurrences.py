@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from django_omise.models.schedule import Schedule
+
+
+class Command(BaseCommand):
+    help = "Sync the occurrences of all active schedules with Omise."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=4,
+            help="The maximum number of concurrent requests to Omise.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of schedules fetched per batch.",
+        )
+
+    def handle(self, *args, **options):
+        count = Schedule.objects.sync_occurrences(
+            max_workers=options["max_workers"],
+            batch_size=options["batch_size"],
+        )
+
+        self.stdout.write(self.style.SUCCESS(f"Synced {count} occurrences."))
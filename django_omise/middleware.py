@@ -0,0 +1,57 @@
+from .omise import omise_object_cache
+from .routers import (
+    PIN_COOKIE_NAME,
+    get_sticky_seconds,
+    has_written,
+    pin_to_primary,
+    reset_pinning,
+)
+
+
+class OmiseObjectCacheMiddleware:
+    """
+    Reuse the read-only Omise objects retrieved while handling a request.
+    e.g. The token checked by a form is not fetched again when the card is added.
+    Other objects, e.g. reloaded charges, are always fetched from Omise.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with omise_object_cache():
+            return self.get_response(request)
+
+
+class OmiseReplicaPinningMiddleware:
+    """
+    Keep the reads of a client on the primary database after it wrote django_omise models.
+    e.g. The charge status polled after a checkout is not read from a lagging replica.
+
+    Used with OmiseRouter and setting OMISE_DATABASE_REPLICAS. A cookie pins the client for OMISE_DATABASE_STICKY_SECONDS.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        reset_pinning()
+
+        if PIN_COOKIE_NAME in request.COOKIES:
+            pin_to_primary()
+
+        try:
+            response = self.get_response(request)
+
+            if has_written():
+                response.set_cookie(
+                    PIN_COOKIE_NAME,
+                    "1",
+                    max_age=get_sticky_seconds(),
+                    httponly=True,
+                    samesite="Lax",
+                )
+
+            return response
+        finally:
+            reset_pinning()
@@ -0,0 +1,20 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_omise", "0005_alter_charge_options"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="customer",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted", False)),
+                fields=("user", "livemode"),
+                name="django_omise_unique_live_customer_per_user",
+            ),
+        ),
+    ]
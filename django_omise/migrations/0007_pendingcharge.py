@@ -0,0 +1,43 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_omise", "0006_customer_unique_live_user"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingCharge",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("uid", models.UUIDField(editable=False, unique=True)),
+                (
+                    "idempotency_key",
+                    models.CharField(
+                        help_text="The Idempotency-Key header sent with the charge request.",
+                        max_length=255,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "parameters",
+                    models.JSONField(
+                        default=dict,
+                        help_text="The parameters the charge was requested with.",
+                    ),
+                ),
+                ("date_created", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_omise", "0007_pendingcharge"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="card",
+            name="fingerprint",
+            field=models.CharField(blank=True, db_index=True, max_length=255),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_omise", "0008_card_fingerprint_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="schedule",
+            name="on",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Days the schedule runs on: weekdays, days_of_month or weekday_of_month.",
+            ),
+        ),
+    ]
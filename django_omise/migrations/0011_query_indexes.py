@@ -0,0 +1,80 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_omise", "0010_pendingschedule"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="card",
+            index=models.Index(fields=["-date_created"], name="omise_card_created"),
+        ),
+        migrations.AddIndex(
+            model_name="card",
+            index=models.Index(
+                condition=models.Q(("deleted", False)),
+                fields=["customer"],
+                name="omise_card_live_customer",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="charge",
+            index=models.Index(fields=["-date_created"], name="omise_charge_created"),
+        ),
+        migrations.AddIndex(
+            model_name="charge",
+            index=models.Index(
+                fields=["status", "-date_created"], name="omise_charge_status_created"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="chargeschedule",
+            index=models.Index(
+                fields=["-date_created"], name="omise_chargeschedule_created"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customer",
+            index=models.Index(fields=["-date_created"], name="omise_customer_created"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["-date_created"], name="omise_event_created"),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["event_type", "-date_created"], name="omise_event_type_created"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="occurrence",
+            index=models.Index(
+                fields=["-date_created"], name="omise_occurrence_created"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="refund",
+            index=models.Index(fields=["-date_created"], name="omise_refund_created"),
+        ),
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(fields=["-date_created"], name="omise_schedule_created"),
+        ),
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(
+                condition=models.Q(("active", True), ("deleted", False)),
+                fields=["start_on", "end_on"],
+                name="omise_schedule_live_active",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="source",
+            index=models.Index(fields=["-date_created"], name="omise_source_created"),
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_omise", "0011_query_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChargeDailyTotal",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "date",
+                    models.DateField(help_text="The day the charges were created."),
+                ),
+                (
+                    "currency",
+                    models.CharField(
+                        choices=[
+                            ("USD", "United States Dollar"),
+                            ("THB", "Thai Baht"),
+                            ("SGD", "Singapore Dollar"),
+                            ("JPY", "Japanese Yen"),
+                            ("GBP", "Pound Sterling"),
+                            ("EUR", "Euro"),
+                            ("CNY", "Chinese Yuan"),
+                            ("AUD", "Australian Dollar"),
+                        ],
+                        max_length=3,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("failed", "Failed"),
+                            ("expired", "Expired"),
+                            ("pending", "Pending"),
+                            ("reversed", "Reversed"),
+                            ("successful", "Successful"),
+                            ("unknown", "Unknown"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "source_type",
+                    models.CharField(
+                        help_text="The type of source of the charges, card for card charges.",
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "count",
+                    models.IntegerField(default=0, help_text="The number of charges."),
+                ),
+                (
+                    "amount",
+                    models.BigIntegerField(
+                        default=0,
+                        help_text="Sum of charge amounts in smallest unit of currency.",
+                    ),
+                ),
+                (
+                    "net",
+                    models.BigIntegerField(
+                        default=0,
+                        help_text="Sum of net amounts in smallest unit of currency.",
+                    ),
+                ),
+                (
+                    "refunded_amount",
+                    models.BigIntegerField(
+                        default=0,
+                        help_text="Sum of refunded amounts in smallest unit of currency.",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-date", "currency", "status", "source_type"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="chargedailytotal",
+            constraint=models.UniqueConstraint(
+                fields=("date", "currency", "status", "source_type"),
+                name="django_omise_unique_charge_daily_total",
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 3.2.25 on 2026-10-19 17:40
+
+import copy
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+from django_omise.routers import allows_user_constraint
+
+
+def get_user_fields(apps, db_constraint):
+    Customer = apps.get_model("django_omise", "Customer")
+    field = Customer._meta.get_field("user")
+    other_field = copy.copy(field)
+    other_field.db_constraint = db_constraint
+
+    return Customer, field, other_field
+
+
+def drop_user_constraint(apps, schema_editor):
+    """
+    Drop the user constraint of the customers on a database without the users.
+    """
+    if allows_user_constraint(schema_editor.connection.alias):
+        return
+
+    Customer, field, new_field = get_user_fields(apps, db_constraint=False)
+    schema_editor.alter_field(Customer, field, new_field)
+
+
+def restore_user_constraint(apps, schema_editor):
+    if allows_user_constraint(schema_editor.connection.alias):
+        return
+
+    Customer, field, old_field = get_user_fields(apps, db_constraint=False)
+    schema_editor.alter_field(Customer, old_field, field)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("django_omise", "0012_chargedailytotal"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="customer",
+            name="user",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="omise_customers",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(drop_user_constraint, restore_user_constraint),
+    ]
@@ -0,0 +1,178 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:56
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_omise", "0013_customer_user_by_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Balance",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("livemode", models.BooleanField()),
+                (
+                    "currency",
+                    models.CharField(
+                        choices=[
+                            ("USD", "United States Dollar"),
+                            ("THB", "Thai Baht"),
+                            ("SGD", "Singapore Dollar"),
+                            ("JPY", "Japanese Yen"),
+                            ("GBP", "Pound Sterling"),
+                            ("EUR", "Euro"),
+                            ("CNY", "Chinese Yuan"),
+                            ("AUD", "Australian Dollar"),
+                        ],
+                        max_length=3,
+                    ),
+                ),
+                (
+                    "total",
+                    models.BigIntegerField(
+                        help_text="Total balance in smallest unit of currency."
+                    ),
+                ),
+                (
+                    "transferable",
+                    models.BigIntegerField(
+                        help_text="Balance which can be transferred, in smallest unit of currency."
+                    ),
+                ),
+                (
+                    "reserve",
+                    models.BigIntegerField(
+                        default=0,
+                        help_text="Balance held as reserve, in smallest unit of currency.",
+                    ),
+                ),
+                (
+                    "on_hold",
+                    models.BigIntegerField(
+                        default=0,
+                        help_text="Balance on hold, in smallest unit of currency.",
+                    ),
+                ),
+                ("data", models.JSONField(blank=True, default=dict)),
+                ("date_created", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["-date_created"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Transaction",
+            fields=[
+                (
+                    "id",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("livemode", models.BooleanField()),
+                ("data", models.JSONField(blank=True, default=dict)),
+                ("date_created", models.DateTimeField(auto_now_add=True)),
+                ("date_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "uid",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                (
+                    "amount",
+                    models.IntegerField(
+                        help_text="Transaction amount in smallest unit of currency."
+                    ),
+                ),
+                (
+                    "currency",
+                    models.CharField(
+                        choices=[
+                            ("USD", "United States Dollar"),
+                            ("THB", "Thai Baht"),
+                            ("SGD", "Singapore Dollar"),
+                            ("JPY", "Japanese Yen"),
+                            ("GBP", "Pound Sterling"),
+                            ("EUR", "Euro"),
+                            ("CNY", "Chinese Yuan"),
+                            ("AUD", "Australian Dollar"),
+                        ],
+                        max_length=3,
+                    ),
+                ),
+                (
+                    "direction",
+                    models.CharField(
+                        choices=[("credit", "Credit"), ("debit", "Debit")],
+                        help_text="Whether the transaction added to or removed from the balance.",
+                        max_length=6,
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        blank=True,
+                        help_text="The kind of transaction, e.g. charge.payment or transfer.payment.",
+                        max_length=100,
+                    ),
+                ),
+                (
+                    "origin",
+                    models.CharField(
+                        blank=True,
+                        help_text="The id of the object which made the transaction, e.g. a charge.",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "transferable_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="The time the amount can be transferred from the balance.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="The time the transaction was created on Omise.",
+                        null=True,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+                "abstract": False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["-date_created"], name="omise_transaction_created"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["-created_at"], name="omise_transaction_created_at"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(fields=["origin"], name="omise_transaction_origin"),
+        ),
+        migrations.AddIndex(
+            model_name="balance",
+            index=models.Index(fields=["-date_created"], name="omise_balance_created"),
+        ),
+    ]
@@ -0,0 +1,339 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:56
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+from django_omise.utils.partition_utils import AddPartitionedForeignKey
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_omise", "0014_transaction_balance"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Dispute",
+            fields=[
+                (
+                    "metadata",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Custom metadata for this object.",
+                    ),
+                ),
+                (
+                    "id",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("livemode", models.BooleanField()),
+                ("data", models.JSONField(blank=True, default=dict)),
+                ("date_created", models.DateTimeField(auto_now_add=True)),
+                ("date_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "uid",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("open", "Open"),
+                            ("pending", "Pending"),
+                            ("won", "Won"),
+                            ("lost", "Lost"),
+                            ("closed", "Closed"),
+                        ],
+                        help_text="Status of this dispute.",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "amount",
+                    models.IntegerField(
+                        help_text="Disputed amount in smallest unit of charge currency."
+                    ),
+                ),
+                (
+                    "currency",
+                    models.CharField(
+                        choices=[
+                            ("USD", "United States Dollar"),
+                            ("THB", "Thai Baht"),
+                            ("SGD", "Singapore Dollar"),
+                            ("JPY", "Japanese Yen"),
+                            ("GBP", "Pound Sterling"),
+                            ("EUR", "Euro"),
+                            ("CNY", "Chinese Yuan"),
+                            ("AUD", "Australian Dollar"),
+                        ],
+                        max_length=3,
+                    ),
+                ),
+                (
+                    "funding_amount",
+                    models.IntegerField(
+                        blank=True,
+                        help_text="For multi-currency charges, amount after exchange into account funding currency.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "funding_currency",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("USD", "United States Dollar"),
+                            ("THB", "Thai Baht"),
+                            ("SGD", "Singapore Dollar"),
+                            ("JPY", "Japanese Yen"),
+                            ("GBP", "Pound Sterling"),
+                            ("EUR", "Euro"),
+                            ("CNY", "Chinese Yuan"),
+                            ("AUD", "Australian Dollar"),
+                        ],
+                        max_length=3,
+                    ),
+                ),
+                (
+                    "reason_code",
+                    models.CharField(
+                        blank=True,
+                        help_text="The reason of the cardholder for the dispute.",
+                        max_length=100,
+                    ),
+                ),
+                ("reason_message", models.TextField(blank=True)),
+                (
+                    "message",
+                    models.TextField(
+                        blank=True,
+                        help_text="The response of the merchant to the dispute.",
+                    ),
+                ),
+                ("admin_message", models.TextField(blank=True)),
+                ("closed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ["-date_created"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Recipient",
+            fields=[
+                (
+                    "metadata",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Custom metadata for this object.",
+                    ),
+                ),
+                (
+                    "id",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("livemode", models.BooleanField()),
+                ("data", models.JSONField(blank=True, default=dict)),
+                ("date_created", models.DateTimeField(auto_now_add=True)),
+                ("date_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "uid",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                (
+                    "deleted",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether this object is marked as deleted on Omise's server",
+                    ),
+                ),
+                ("name", models.CharField(blank=True, max_length=255)),
+                ("email", models.CharField(blank=True, max_length=255)),
+                ("description", models.TextField(blank=True)),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("individual", "Individual"),
+                            ("corporation", "Corporation"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("tax_id", models.CharField(blank=True, max_length=255)),
+                (
+                    "bank_account",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="The bank account receiving the transfers.",
+                    ),
+                ),
+                (
+                    "verified",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether the recipient was verified by Omise.",
+                    ),
+                ),
+                (
+                    "active",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether the recipient can receive transfers.",
+                    ),
+                ),
+                (
+                    "default",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether this is the default recipient of the account.",
+                    ),
+                ),
+                ("failure_code", models.CharField(blank=True, max_length=255)),
+                ("verified_at", models.DateTimeField(blank=True, null=True)),
+                ("activated_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ["-date_created"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Transfer",
+            fields=[
+                (
+                    "metadata",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Custom metadata for this object.",
+                    ),
+                ),
+                (
+                    "id",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("livemode", models.BooleanField()),
+                ("data", models.JSONField(blank=True, default=dict)),
+                ("date_created", models.DateTimeField(auto_now_add=True)),
+                ("date_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "uid",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                (
+                    "deleted",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether this object is marked as deleted on Omise's server",
+                    ),
+                ),
+                (
+                    "bank_account",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="The bank account of the recipient at the time of the transfer.",
+                    ),
+                ),
+                (
+                    "amount",
+                    models.IntegerField(
+                        help_text="Transfer amount in smallest unit of currency."
+                    ),
+                ),
+                (
+                    "currency",
+                    models.CharField(
+                        choices=[
+                            ("USD", "United States Dollar"),
+                            ("THB", "Thai Baht"),
+                            ("SGD", "Singapore Dollar"),
+                            ("JPY", "Japanese Yen"),
+                            ("GBP", "Pound Sterling"),
+                            ("EUR", "Euro"),
+                            ("CNY", "Chinese Yuan"),
+                            ("AUD", "Australian Dollar"),
+                        ],
+                        max_length=3,
+                    ),
+                ),
+                ("fee", models.IntegerField(blank=True, null=True)),
+                ("fee_vat", models.IntegerField(blank=True, null=True)),
+                ("net", models.IntegerField(blank=True, null=True)),
+                ("total_fee", models.IntegerField(blank=True, null=True)),
+                (
+                    "sendable",
+                    models.BooleanField(
+                        default=False, help_text="Whether the transfer can be sent."
+                    ),
+                ),
+                (
+                    "sent",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether the transfer was sent to the bank.",
+                    ),
+                ),
+                (
+                    "paid",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether the transfer was paid to the recipient.",
+                    ),
+                ),
+                ("failure_code", models.CharField(blank=True, max_length=255)),
+                ("failure_message", models.TextField(blank=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                ("paid_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "recipient",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="transfers",
+                        to="django_omise.recipient",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-date_created"],
+                "abstract": False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name="recipient",
+            index=models.Index(
+                fields=["-date_created"], name="omise_recipient_created"
+            ),
+        ),
+        AddPartitionedForeignKey(
+            model_name="dispute",
+            name="charge",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="disputes",
+                to="django_omise.charge",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(fields=["-date_created"], name="omise_transfer_created"),
+        ),
+        migrations.AddIndex(
+            model_name="dispute",
+            index=models.Index(fields=["-date_created"], name="omise_dispute_created"),
+        ),
+        migrations.AddIndex(
+            model_name="dispute",
+            index=models.Index(
+                fields=["status", "-date_created"], name="omise_dispute_status_created"
+            ),
+        ),
+    ]
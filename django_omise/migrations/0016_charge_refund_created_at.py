@@ -0,0 +1,38 @@
+# Generated by Django 3.2.25 on 2026-10-19 17:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_omise", "0015_dispute_recipient_transfer"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="charge",
+            name="created_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="The time the charge was created on Omise.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="refund",
+            name="created_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="The time the refund was created on Omise.",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="charge",
+            index=models.Index(fields=["-created_at"], name="omise_charge_created_at"),
+        ),
+        migrations.AddIndex(
+            model_name="refund",
+            index=models.Index(fields=["-created_at"], name="omise_refund_created_at"),
+        ),
+    ]
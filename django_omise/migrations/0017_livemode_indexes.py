@@ -0,0 +1,90 @@
+# Generated by Django 3.2.25 on 2026-10-19 17:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("django_omise", "0016_charge_refund_created_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="card",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_card_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="charge",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_charge_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="chargeschedule",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_chargeschedule_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customer",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_customer_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dispute",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_dispute_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_event_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="occurrence",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_occurrence_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recipient",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_recipient_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="refund",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_refund_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_schedule_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="source",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_source_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_transaction_live"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(
+                fields=["livemode", "-date_created"], name="omise_transfer_live"
+            ),
+        ),
+    ]
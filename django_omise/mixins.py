@@ -50,6 +50,7 @@ class CheckoutMixin(FormView):
         """
         kwargs = super().get_form_kwargs(*args, **kwargs)
         kwargs["user"] = self.request.user
+        kwargs["omise_customer"] = self.get_omise_customer()
         return {**kwargs, **self.get_charge_details()}
 
     def get_charge_details(self) -> Dict[int, Currency]:
@@ -67,6 +68,9 @@ class CheckoutMixin(FormView):
         Get the user to charge. Neccessary for charging with existing card.
         Overwrite this method to provide different way to obtain the customer instance.
 
+        The customer is loaded with its live cards once and cached on the request,
+        so the checkout form can reuse them for rendering and validation.
+
         :returns: An instance of Customer if the user is logged in. None otherwise.
         """
         user = self.request.user
@@ -74,8 +78,13 @@ class CheckoutMixin(FormView):
         if user.is_authenticated == False:
             return None
 
-        customer, created = Customer.get_or_create(user=self.request.user)
-        return customer
+        if not hasattr(self.request, "_omise_customer"):
+            customer, created = Customer.get_or_create_with_live_cards(
+                user=self.request.user
+            )
+            self.request._omise_customer = customer
+
+        return self.request._omise_customer
 
     def get_charge_kwargs(self) -> Dict:
         """
@@ -1,3 +1,7 @@
 from .core import *
 from .event import *
 from .schedule import *
+from .report import *
+from .settlement import *
+from .dispute import *
+from .transfer import *
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import uuid
+
+from concurrent.futures import ThreadPoolExecutor
 from django.apps import apps
-from django.db import models
+from django.contrib.contenttypes.fields import GenericRelation
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS, models, router, transaction
+from django.utils import timezone
 
 from django_omise.omise import omise
 from django_omise.utils.core_utils import (
+    get_model_from_omise_object,
     update_or_create_from_omise_object,
 )
 
@@ -14,7 +20,7 @@ from django.utils.translation import gettext_lazy as _
 from typing import Optional, Dict
 from .managers import DeletableManager
 
-from typing import List
+from typing import Iterable, List, Tuple
 
 
 class OmiseMetadata(models.Model):
@@ -76,6 +82,12 @@ class OmiseBaseModel(models.Model):
         ordering = [
             "-date_created",
         ]
+        indexes = [
+            models.Index(fields=["-date_created"], name="omise_%(class)s_created"),
+            models.Index(
+                fields=["livemode", "-date_created"], name="omise_%(class)s_live"
+            ),
+        ]
 
     def get_omise_object(self) -> omise.Base:
         """Fetch the object from Omise's server."""
@@ -89,12 +101,44 @@ class OmiseBaseModel(models.Model):
 
         :param ignore_fields: List of field names to ignore.
         """
-        omise_object = self.omise_class.retrieve(self.id)
+        omise_object = self.get_omise_object()
         return self.__class__.update_or_create_from_omise_object(
             omise_object=omise_object,
             ignore_fields=ignore_fields,
         )
 
+    @classmethod
+    def bulk_reload_from_omise(
+        cls,
+        objects: Iterable[OmiseBaseModel],
+        max_workers: int = 4,
+    ) -> Tuple[List[OmiseBaseModel], Dict[str, Exception]]:
+        """
+        Reload many objects from Omise's server and save them with bulk queries.
+
+        The objects are retrieved from a bounded pool of threads and saved with
+        bulk_update_or_create_from_omise_objects on the calling thread.
+        An object failing to be retrieved does not stop the other objects.
+
+        :param objects: Iterable of instances of the current class.
+        :param max_workers: The maximum number of concurrent requests to Omise.
+
+        :returns: Tuple of the list of reloaded objects and a dictionary of errors by object id.
+        """
+        omise_objects = []
+        errors = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(obj, executor.submit(obj.get_omise_object)) for obj in objects]
+
+            for obj, future in futures:
+                try:
+                    omise_objects.append(future.result())
+                except Exception as e:
+                    errors[obj.id] = e
+
+        return cls.bulk_update_or_create_from_omise_objects(omise_objects), errors
+
     @classmethod
     def update_or_create_from_omise_object(
         cls,
@@ -105,6 +149,9 @@ class OmiseBaseModel(models.Model):
         """
         Update existing charge or create a new charge from Omise Charge object.
 
+        An existing object is only written when one of its values changed, and
+        only the changed fields are updated.
+
         :param omise_object: An instance of Omise object
         :param ignore_fields optional: List of field names to ignore
         :param uuid optional: A unique id for new object.
@@ -117,13 +164,249 @@ class OmiseBaseModel(models.Model):
             uid=uid,
         )
 
-        new_object, created = cls.objects.update_or_create(
-            pk=omise_object.id,
-            defaults=defaults,
-        )
+        with transaction.atomic(using=router.db_for_write(cls)):
+            new_object, created = cls.get_or_create_for_update(
+                pk=omise_object.id,
+                defaults=defaults,
+            )
+
+            if not created:
+                cls.update_changed_fields(instance=new_object, values=defaults)
 
         return new_object
 
+    @classmethod
+    def get_or_create_for_update(
+        cls, pk: str, defaults: Dict
+    ) -> Tuple[OmiseBaseModel, bool]:
+        """
+        Get and lock the object with a primary key, or create it.
+
+        When a concurrent transaction creates the object first, the object it
+        created is returned, locked, and created is False.
+
+        :param pk: The primary key of the object.
+        :param defaults: Dictionary of the values of a new object.
+
+        :returns: Tuple of the object and whether it was created.
+        """
+        return cls.objects.select_for_update().get_or_create(pk=pk, defaults=defaults)
+
+    @classmethod
+    def update_changed_fields(cls, instance: OmiseBaseModel, values: Dict) -> List[str]:
+        """
+        Update the fields of an existing object whose values differ from new values.
+
+        :param instance: An object locked by get_or_create_for_update.
+        :param values: Dictionary of new values by field name.
+
+        :returns: List of the names of the updated fields.
+        """
+        changed_fields = cls.get_changed_fields(instance=instance, values=values)
+
+        if changed_fields:
+            for name in changed_fields:
+                setattr(instance, name, values[name])
+
+            instance.save(update_fields=changed_fields + ["date_updated"])
+
+        return changed_fields
+
+    @staticmethod
+    def get_changed_fields(instance: models.Model, values: Dict) -> List[str]:
+        """
+        Get the fields of an instance whose values differ from new values.
+
+        :param instance: A model instance.
+        :param values: Dictionary of new values by field name or attribute name.
+            Related objects can be given as instances or primary keys.
+
+        :returns: List of the names of the changed fields, in the order of values.
+        """
+        changed_fields = []
+
+        for name, value in values.items():
+            field = instance._meta.get_field(name)
+
+            if isinstance(value, models.Model):
+                value = value.pk
+
+            try:
+                value = field.to_python(value)
+            except ValidationError:
+                pass
+
+            if value != getattr(instance, field.attname):
+                changed_fields.append(name)
+
+        return changed_fields
+
+    @classmethod
+    def bulk_update_or_create_from_omise_objects(
+        cls,
+        omise_objects: Iterable[omise.Base],
+        ignore_fields: Optional[List[str]] = None,
+        uids: Optional[List[Optional[uuid.UUID]]] = None,
+        defaults: Optional[Dict] = None,
+    ) -> List[OmiseBaseModel]:
+        """
+        Update existing objects or create new objects from Omise objects with bulk queries.
+
+        Existing objects are only written when one of their values changed.
+        Related objects embedded in the Omise objects are only created when they
+        do not exist on the database yet. Existing related objects are not reloaded.
+        The objects of embedded lists, e.g. the refunds of charges, are saved with
+        bulk queries per model after the objects.
+
+        The before and after update_or_create_from_omise_object_action hooks are not
+        run, e.g. the stale schedules of customers are not reloaded. Models which
+        need them in bulk override this method, see Charge and Dispute.
+
+        :param omise_objects: Iterable of Omise objects of the current class.
+        :param ignore_fields optional: List of field names to ignore
+        :param uids optional: List of unique ids for new objects, in the same order as omise_objects.
+        :param defaults optional: Dictionary of field names and values to set on every object.
+
+        :returns: List of instances of current class in the same order as omise_objects.
+        """
+        omise_objects = list(omise_objects)
+
+        if not omise_objects:
+            return []
+
+        if uids is None:
+            uids = [None] * len(omise_objects)
+
+        ignore_fields = [] if ignore_fields is None else ignore_fields
+
+        extra_defaults = {}
+
+        for name, value in (defaults or {}).items():
+            field = cls._meta.get_field(name)
+
+            if field.is_relation and isinstance(value, models.Model):
+                value = value.pk
+
+            extra_defaults[field.attname] = value
+
+        related_fields = [
+            field
+            for field in cls.get_field_names(ignore_fields=ignore_fields)
+            if field.concrete
+            and type(field) in [models.ForeignKey, models.OneToOneField]
+            and field.name not in cls.NON_DEFAULT_FIELDS
+        ]
+
+        for field in related_fields:
+            related_objects = {}
+
+            for omise_object in omise_objects:
+                value = getattr(omise_object, field.name, None)
+
+                if callable(value) or value is None or type(value) is str:
+                    continue
+
+                related_objects[value.id] = value
+
+            existing_ids = set(
+                field.related_model.objects.filter(
+                    pk__in=related_objects.keys()
+                ).values_list("pk", flat=True)
+            )
+
+            for related_id, value in related_objects.items():
+                if related_id not in existing_ids:
+                    update_or_create_from_omise_object(omise_object=value)
+
+        list_fields = [
+            field.name
+            for field in cls.get_field_names(ignore_fields=ignore_fields)
+            if not field.concrete
+        ]
+        nested_objects = {}
+
+        for omise_object in omise_objects:
+            for name in list_fields:
+                values = getattr(omise_object, name, None)
+
+                if getattr(values, "object", None) != "list":
+                    continue
+
+                for value in values:
+                    model = get_model_from_omise_object(omise_object=value)
+
+                    if model is not None:
+                        nested_objects.setdefault(model, {})[value.id] = value
+
+        existing_objects = cls.objects.in_bulk(
+            [omise_object.id for omise_object in omise_objects]
+        )
+
+        new_objects = []
+        updated_objects = []
+        updated_fields = set()
+        saved_ids = set()
+        saved_objects = []
+
+        for omise_object, uid in zip(omise_objects, uids):
+            object_defaults = cls.build_defaults_from_omise_object(
+                omise_object=omise_object,
+                ignore_fields=ignore_fields
+                + list_fields
+                + [field.name for field in related_fields],
+                uid=uid,
+            )
+
+            for field in related_fields:
+                value = getattr(omise_object, field.name, None)
+
+                if callable(value):
+                    continue
+
+                object_defaults[field.attname] = (
+                    value if value is None or type(value) is str else value.id
+                )
+
+            object_defaults.update(extra_defaults)
+
+            instance = existing_objects.get(omise_object.id)
+
+            if omise_object.id in saved_ids:
+                pass
+            elif instance is None:
+                instance = cls(id=omise_object.id, **object_defaults)
+                existing_objects[omise_object.id] = instance
+                new_objects.append(instance)
+            else:
+                changed_fields = cls.get_changed_fields(
+                    instance=instance, values=object_defaults
+                )
+
+                for name in changed_fields:
+                    setattr(instance, name, object_defaults[name])
+
+                if changed_fields:
+                    instance.date_updated = timezone.now()
+                    updated_objects.append(instance)
+                    updated_fields.update(changed_fields)
+
+            saved_ids.add(omise_object.id)
+            saved_objects.append(instance)
+
+        cls.objects.bulk_create(new_objects)
+
+        if updated_objects:
+            cls.objects.bulk_update(
+                updated_objects, fields=sorted(updated_fields) + ["date_updated"]
+            )
+
+        for model, values in nested_objects.items():
+            model.bulk_update_or_create_from_omise_objects(
+                omise_objects=values.values()
+            )
+
+        return saved_objects
+
     @classmethod
     def build_defaults_from_omise_object(
         cls,
@@ -162,6 +445,12 @@ class OmiseBaseModel(models.Model):
             if callable(getattr(omise_object, field.name, None)):
                 continue
 
+            if isinstance(field, models.JSONField) and isinstance(
+                getattr(omise_object, field.name, None), omise.Base
+            ):
+                defaults[field.name] = getattr(omise_object, field.name)._attributes
+                continue
+
             if (
                 getattr(getattr(omise_object, field.name, None), "object", None)
                 == "list"
@@ -236,3 +525,34 @@ class OmiseDeletableModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class EventRelation(GenericRelation):
+    """
+    GenericRelation to the webhook events of Omise objects.
+
+    Unlike GenericRelation, the events are kept when the object is deleted.
+    """
+
+    def bulk_related_objects(self, objs, using=DEFAULT_DB_ALIAS):
+        return []
+
+
+class OmiseEventTimeline(models.Model):
+    """
+    Omise objects whose webhook events are linked with Event.event_object.
+
+    The events are available as ``events`` and can be prefetched for many objects
+    with prefetch_related("events"). Events can be filtered by their object, e.g.
+    Event.objects.filter(charge__status="failed").
+    """
+
+    events = EventRelation(
+        "django_omise.Event",
+        content_type_field="content_type",
+        object_id_field="object_id",
+        related_query_name="%(class)s",
+    )
+
+    class Meta:
+        abstract = True
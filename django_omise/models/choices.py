@@ -80,3 +80,21 @@ class OccurrenceStatus(models.TextChoices):
     SKIPPED = "skipped", _("Skipped")
     FAILED = "failed", _("Failed")
     SUCCESSFUL = "successful", _("Successful")
+
+
+class TransactionDirection(models.TextChoices):
+    CREDIT = "credit", _("Credit")
+    DEBIT = "debit", _("Debit")
+
+
+class DisputeStatus(models.TextChoices):
+    OPEN = "open", _("Open")
+    PENDING = "pending", _("Pending")
+    WON = "won", _("Won")
+    LOST = "lost", _("Lost")
+    CLOSED = "closed", _("Closed")
+
+
+class RecipientType(models.TextChoices):
+    INDIVIDUAL = "individual", _("Individual")
+    CORPORATION = "corporation", _("Corporation")
@@ -1,30 +1,55 @@
-from .base import OmiseBaseModel, OmiseMetadata
+from .base import OmiseBaseModel, OmiseEventTimeline, OmiseMetadata
 from .choices import Currency, ChargeStatus, ChargeSourceType, SourceFlow
-from .managers import NotDeletedManager
+from .managers import CardManager, CustomerManager
+from .report import ChargeDailyTotal
 
 import datetime
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 from django.apps import apps
-from django_omise.omise import omise
-from django_omise.utils.core_utils import update_or_create_from_omise_object
+from django_omise.omise import omise, create, retrieve
+from django_omise.utils.core_utils import (
+    update_or_create_from_omise_object,
+    setting,
+    RateLimiter,
+)
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.http import HttpRequest
 
-from django.db import models
+from django.db import models, router, transaction, IntegrityError
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
 
 from django.urls import reverse_lazy, reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from typing import TYPE_CHECKING, Optional, Dict, Union
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Tuple,
+    Union,
+)
 
 if TYPE_CHECKING:
     User = get_user_model()
 
 
-class Customer(OmiseBaseModel, OmiseMetadata):
+# The metadata key of the uid of a charge, to find the charge of a PendingCharge on Omise.
+CHARGE_UID_METADATA_KEY = "django_omise_uid"
+
+
+class Customer(OmiseBaseModel, OmiseMetadata, OmiseEventTimeline):
 
     """
     A card representing Omise Customer object.
@@ -38,11 +63,14 @@ class Customer(OmiseBaseModel, OmiseMetadata):
 
     omise_class = omise.Customer
 
+    # Removed from the customers by unlink_deleted_user_customers, as Django cannot
+    # set it to null across databases. Migration 0013 drops the constraint on the
+    # databases the router does not migrate the users on, see allows_user_constraint.
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         blank=True,
         null=True,
-        on_delete=models.SET_NULL,
+        on_delete=models.DO_NOTHING,
         related_name="omise_customers",
     )
 
@@ -58,36 +86,58 @@ class Customer(OmiseBaseModel, OmiseMetadata):
 
     email = models.EmailField(blank=True)
 
-    objects = NotDeletedManager()
+    objects = CustomerManager()
+
+    class Meta(OmiseBaseModel.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "livemode"],
+                condition=models.Q(deleted=False),
+                name="django_omise_unique_live_customer_per_user",
+            ),
+        ]
 
     def __str__(self) -> str:
         if self.user:
             return f"Omise{self.__class__.__name__}: {str(self.user)}"
         return f"Omise{self.__class__.__name__}: {self.id}"
 
-    def add_card(self, token: Union[omise.Token, str]) -> "Card":
+    def add_card(
+        self, token: Union[omise.Token, str], allow_duplicate: bool = False
+    ) -> "Card":
         """
         Add a new card to the user
 
+        If the customer already has a live card with the same fingerprint and expiration
+        date, that card is returned and Omise is not called, unless allow_duplicate is
+        True. A renewed card, with the same fingerprint and a new expiration date, is added.
+
         :param token: The token retrieved from Omise API or a token id as string.
+        :param allow_duplicate: Whether to add the card even if the customer already has it.
 
-        :returns: A new card instance.
+        :returns: A new card instance, or the existing card.
         """
-        omise_customer = omise.Customer.retrieve(self.id)
-
         if type(token) == str:
-            token = omise.Token.retrieve(token)
+            token = retrieve(omise.Token, token)
 
-        omise_customer.update(card=token.id)
+        if not allow_duplicate:
+            existing_card = Card.objects.find_duplicates(
+                fingerprint=token.card.fingerprint,
+                customer=self,
+                expiration_month=token.card.expiration_month,
+                expiration_year=token.card.expiration_year,
+            ).first()
 
-        card = token.card
+            if existing_card is not None:
+                return existing_card
 
-        new_card = Card.update_or_create_from_omise_object(
-            omise_object=card,
-        )
+        omise_customer = omise.Customer.from_data({"object": "customer", "id": self.id})
+        omise_customer.update(card=token.id)
 
-        new_card.customer = self
-        new_card.save()
+        new_card, *_ = Card.bulk_update_or_create_from_omise_objects(
+            omise_objects=[token.card],
+            defaults={"customer": self, "deleted": False},
+        )
 
         return new_card
 
@@ -103,6 +153,39 @@ class Customer(OmiseBaseModel, OmiseMetadata):
         schedules = schedule_model.objects.filter(pk__in=schedule_ids)
         return schedules
 
+    def get_stale_schedules(self) -> List["Schedule"]:
+        """
+        Get the active schedules of this customer whose local copy is out of date.
+
+        A schedule is stale when the customer was deleted, when it charges the
+        customer's default card and the customer changed since the schedule was
+        synced while the cards differ, or when its next occurrence has passed.
+
+        :returns: A list of django_omise.models.schedule.Schedule
+        """
+        today = timezone.localdate().isoformat()
+        stale_schedules = []
+
+        for schedule in self.schedules.filter(active=True).select_related("charge"):
+            charge_schedule = schedule.charge
+
+            if (
+                self.deleted
+                or (
+                    charge_schedule is not None
+                    and charge_schedule.default_card
+                    and charge_schedule.card_id != self.default_card_id
+                    and charge_schedule.date_updated < self.date_updated
+                )
+                or (
+                    schedule.next_occurrences_on
+                    and schedule.next_occurrences_on[0] < today
+                )
+            ):
+                stale_schedules.append(schedule)
+
+        return stale_schedules
+
     def remove_card(self, card: "Card") -> None:
         """
         Remove the card from the customer.
@@ -154,25 +237,21 @@ class Customer(OmiseBaseModel, OmiseMetadata):
 
         """
 
-        charge = {
-            "customer": self.id,
-            "amount": amount,
-            "currency": currency,
-        }
-
-        if card is not None:
-            charge["card"] = card.id
-
-        if description is not None:
-            charge["description"] = description
+        schedule_model = apps.get_model(app_label="django_omise", model_name="Schedule")
 
         schedule = omise.Schedule.create(
-            every=every,
-            period=period,
-            start_date=str(start_date),
-            end_date=str(end_date),
-            charge=charge,
-            on=on,
+            **schedule_model.build_schedule_parameters(
+                customer=self,
+                amount=amount,
+                currency=currency,
+                every=every,
+                period=period,
+                start_date=start_date,
+                end_date=end_date,
+                card=card,
+                on=on,
+                description=description,
+            )
         )
 
         return update_or_create_from_omise_object(
@@ -192,10 +271,13 @@ class Customer(OmiseBaseModel, OmiseMetadata):
         metadata: dict = None,
         capture: bool = True,
         description: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> "Charge":
         """
         Charge the customer with provided card.
 
+        :param idempotency_key optional: Key to safely retry the same charge. See Charge.charge.
+
         :returns: An instace of Charge object.
         """
         return Charge.charge(
@@ -207,58 +289,213 @@ class Customer(OmiseBaseModel, OmiseMetadata):
             metadata=metadata,
             capture=capture,
             description=description,
+            idempotency_key=idempotency_key,
         )
 
-    def sync_cards(self) -> None:
+    def sync_cards(self, omise_customer: Optional[omise.Customer] = None) -> None:
         """
         Sync the customer's cards on the database with Omise's server.
+
+        The card list is fetched once and compared with the cards on the database.
+        New cards are inserted, changed cards are updated and cards removed on Omise
+        are marked as deleted, with bulk queries in one transaction.
+
+        :param omise_customer optional: The customer already retrieved from Omise.
         """
-        omise_customer = self.get_omise_object()
+        if omise_customer is None:
+            omise_customer = self.get_omise_object()
+
         cards = omise_customer.cards
-        for card in cards:
-            card = update_or_create_from_omise_object(omise_object=card)
-            card.customer = self
-            card.save()
+
+        if cards._attributes.get("total", len(cards)) > len(cards):
+            omise_cards = list(omise_customer.list_cards())
+        else:
+            omise_cards = list(cards)
+
+        with transaction.atomic(using=router.db_for_write(Card)):
+            Card.bulk_update_or_create_from_omise_objects(
+                omise_objects=omise_cards,
+                defaults={"customer": self, "deleted": False},
+            )
+
+            self.cards.live().exclude(
+                id__in=[omise_card.id for omise_card in omise_cards]
+            ).update(deleted=True, date_updated=timezone.now())
 
     @classmethod
-    def get_or_create(cls, user: "User") -> "Customer":
+    def get_or_create(cls, user: "User") -> Tuple["Customer", bool]:
         """
-        Get or create django_omise customer.o
+        Get or create django_omise customer.
+
+        The customer is memoized on the user instance for the rest of the request
+        and cached for OMISE_CUSTOMER_CACHE_TIMEOUT seconds. Creation is serialized
+        with a lock on the user row, backed by a unique constraint on user and
+        livemode, so concurrent requests do not create duplicate Omise customers.
 
         :param user: The user model instance to create a customer.
         :returns: A tuple of Customer instance and whether the object is newly created.
         """
         livemode = settings.OMISE_LIVE_MODE
 
-        try:
-            return (
-                Customer.objects.get(user=user, livemode=livemode, deleted=False),
-                False,
-            )
-        except Customer.DoesNotExist:
-            customer_attributes = {}
+        memoized_customers = getattr(user, "_omise_customers", None)
 
-            if user.email:
-                customer_attributes["email"] = user.email
+        if memoized_customers is None:
+            memoized_customers = {}
+            user._omise_customers = memoized_customers
 
-            omise_customer = cls.omise_class.create(**customer_attributes)
+        customer = memoized_customers.get(livemode)
 
-            if omise_customer.livemode != livemode:
-                raise ValueError(
-                    f"The API livemode inconsistent. API livemode: {omise_customer.livemode}. settings.OMISE_LIVE_MODE: {livemode}"
+        if customer is not None and not customer.deleted:
+            return customer, False
+
+        cache_key = cls.get_cache_key(user_id=user.pk, livemode=livemode)
+        customer = cache.get(cache_key)
+        created = False
+
+        if customer is None:
+            customer = Customer.objects.filter(
+                user=user, livemode=livemode, deleted=False
+            ).first()
+
+            if customer is None:
+                customer, created = cls.create_for_user(user=user)
+
+            cache_timeout = setting("OMISE_CUSTOMER_CACHE_TIMEOUT", 60)
+
+            if cache_timeout:
+                transaction.on_commit(
+                    lambda: cache.set(cache_key, customer, cache_timeout),
+                    using=customer._state.db,
                 )
 
-            return (
-                Customer.objects.create(
-                    id=omise_customer.id,
-                    user=user,
-                    livemode=omise_customer.livemode,
-                ),
-                True,
+        memoized_customers[livemode] = customer
+
+        return customer, created
+
+    @classmethod
+    def create_for_user(cls, user: "User") -> Tuple["Customer", bool]:
+        """
+        Create a new customer on Omise and in the database for the user.
+
+        The customer is created on Omise first, then the user row is locked only
+        while the database is checked and written. If another request created the
+        customer in the meantime, the existing customer is returned and the newly
+        created Omise customer is destroyed.
+
+        :param user: The user model instance to create a customer.
+        :returns: A tuple of Customer instance and whether the object is newly created.
+        """
+        livemode = settings.OMISE_LIVE_MODE
+
+        User = get_user_model()
+
+        customer_attributes = {}
+
+        if user.email:
+            customer_attributes["email"] = user.email
+
+        omise_customer = cls.omise_class.create(**customer_attributes)
+
+        if omise_customer.livemode != livemode:
+            raise ValueError(
+                f"The API livemode inconsistent. API livemode: {omise_customer.livemode}. settings.OMISE_LIVE_MODE: {livemode}"
+            )
+
+        with transaction.atomic(using=router.db_for_write(User)):
+            User.objects.select_for_update().filter(pk=user.pk).first()
+
+            customer = Customer.objects.filter(
+                user=user, livemode=livemode, deleted=False
+            ).first()
+
+            if customer is None:
+                try:
+                    with transaction.atomic(using=router.db_for_write(Customer)):
+                        customer = Customer.objects.create(
+                            id=omise_customer.id,
+                            user_id=user.pk,
+                            livemode=omise_customer.livemode,
+                        )
+                except IntegrityError:
+                    customer = Customer.objects.get(
+                        user=user, livemode=livemode, deleted=False
+                    )
+
+        if customer.id != omise_customer.id:
+            omise_customer.destroy()
+            return customer, False
+
+        return customer, True
+
+    @staticmethod
+    def get_cache_key(user_id: int, livemode: bool) -> str:
+        """
+        Get the cache key of the user to customer mapping.
+
+        :param user_id: The primary key of the user.
+        :param livemode: Whether the customer is in live mode.
+
+        :returns: The cache key as a string.
+        """
+        return f"django_omise:customer:{user_id}:{int(livemode)}"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        if self.user_id is not None:
+            cache.delete(
+                self.get_cache_key(user_id=self.user_id, livemode=self.livemode)
+            )
+
+    @classmethod
+    def get_or_create_with_live_cards(cls, user: "User") -> Tuple["Customer", bool]:
+        """
+        Get or create django_omise customer together with its live cards.
+
+        The live cards are fetched with the customer in a single query and kept
+        on the instance as ``live_cards``, so callers such as the checkout form
+        do not have to query them again.
+
+        :param user: The user model instance to create a customer.
+        :returns: A tuple of Customer instance and whether the object is newly created.
+        """
+        livemode = settings.OMISE_LIVE_MODE
+
+        cards = list(
+            Card.objects.live()
+            .filter(
+                customer__user=user,
+                customer__livemode=livemode,
+                customer__deleted=False,
             )
+            .select_related("customer")
+        )
+
+        if cards:
+            customer = cards[0].customer
+            customer.live_cards = [
+                card for card in cards if card.customer_id == customer.id
+            ]
 
+            for card in customer.live_cards:
+                card.customer = customer
 
-class Card(OmiseBaseModel):
+            return customer, False
+
+        customer, created = cls.get_or_create(user=user)
+        customer.live_cards = []
+        return customer, created
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def unlink_deleted_user_customers(sender, instance, **kwargs) -> None:
+    """
+    Remove the user from its customers before it is deleted, in the database of the customers.
+    """
+    Customer.objects.filter(user_id=instance.pk).update(user=None)
+
+
+class Card(OmiseBaseModel, OmiseEventTimeline):
     """
     A class representing Omise's Card object.
 
@@ -297,7 +534,7 @@ class Card(OmiseBaseModel):
     expiration_month = models.CharField(max_length=2, blank=True)
     expiration_year = models.CharField(max_length=4, blank=True)
 
-    fingerprint = models.TextField(blank=True)
+    fingerprint = models.CharField(max_length=255, blank=True, db_index=True)
 
     financing = models.CharField(max_length=10, blank=True)
 
@@ -305,21 +542,39 @@ class Card(OmiseBaseModel):
         default=False, help_text=_("Whethe this card was deleted.")
     )
 
-    objects = NotDeletedManager()
+    objects = CardManager()
+
+    class Meta(OmiseBaseModel.Meta):
+        indexes = OmiseBaseModel.Meta.indexes + [
+            models.Index(
+                fields=["customer"],
+                condition=models.Q(deleted=False),
+                name="omise_card_live_customer",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Omise{self.__class__.__name__}: {self.last_digits}"
 
+    def get_omise_object(self) -> omise.Card:
+        """Fetch the card from Omise's server, through its customer."""
+        return self.omise_class.retrieve(self.customer_id, self.id)
+
     def delete(self):
-        omise_customer = self.customer.get_omise_object()
-        card = omise_customer.cards.retrieve(self.id)
+        card = omise.Card.from_data(
+            {
+                "object": "card",
+                "id": self.id,
+                "location": f"/customers/{self.customer_id}/cards/{self.id}",
+            }
+        )
         card.destroy()
 
         self.deleted = True
-        self.save()
+        self.save(update_fields=["deleted", "date_updated"])
 
 
-class Charge(OmiseBaseModel, OmiseMetadata):
+class Charge(OmiseBaseModel, OmiseMetadata, OmiseEventTimeline):
     """
     A class representing Omise Charge object.
 
@@ -330,6 +585,12 @@ class Charge(OmiseBaseModel, OmiseMetadata):
         permissions = [
             ("issue_refund", "Can issue refunds"),
         ]
+        indexes = OmiseBaseModel.Meta.indexes + [
+            models.Index(
+                fields=["status", "-date_created"], name="omise_charge_status_created"
+            ),
+            models.Index(fields=["-created_at"], name="omise_charge_created_at"),
+        ]
 
     omise_class = omise.Charge
 
@@ -371,6 +632,12 @@ class Charge(OmiseBaseModel, OmiseMetadata):
         help_text=_("Card that was charged (if card was charged)."),
     )
 
+    created_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text=_("The time the charge was created on Omise."),
+    )
+
     currency = models.CharField(
         max_length=3,
         choices=Currency.choices,
@@ -516,6 +783,125 @@ class Charge(OmiseBaseModel, OmiseMetadata):
             return f"{self.amount:,.2f}"
         return f"{self.amount / 100:,.2f}"
 
+    @classmethod
+    def get_or_create_for_update(cls, pk: str, defaults: Dict) -> Tuple["Charge", bool]:
+        """
+        Get and lock the charge, or create it and count it in the daily totals.
+
+        The charge is only counted when this transaction created it, so concurrent
+        first saves of a charge count it once.
+        See OmiseBaseModel.get_or_create_for_update.
+        """
+        charge, created = super().get_or_create_for_update(pk=pk, defaults=defaults)
+
+        if created:
+            ChargeDailyTotal.record_changes(
+                previous_charges={},
+                charges=ChargeDailyTotal.get_charge_values(charge_ids=[pk]),
+            )
+
+        return charge, created
+
+    @classmethod
+    def update_changed_fields(cls, instance: "Charge", values: Dict) -> List[str]:
+        """
+        Update the changed fields of an existing charge and the daily totals.
+
+        See OmiseBaseModel.update_changed_fields.
+        """
+        previous_charges = ChargeDailyTotal.get_charge_values(charge_ids=[instance.pk])
+        changed_fields = super().update_changed_fields(instance=instance, values=values)
+
+        if changed_fields:
+            ChargeDailyTotal.record_changes(
+                previous_charges=previous_charges,
+                charges=ChargeDailyTotal.get_charge_values(charge_ids=[instance.pk]),
+            )
+
+        return changed_fields
+
+    @classmethod
+    def bulk_update_or_create_from_omise_objects(
+        cls,
+        omise_objects: Iterable[omise.Base],
+        ignore_fields: Optional[List[str]] = None,
+        uids: Optional[List[Optional[uuid.UUID]]] = None,
+        defaults: Optional[Dict] = None,
+    ) -> List["Charge"]:
+        """
+        Update existing charges or create new charges from Omise Charge objects with bulk queries.
+
+        The daily totals of charges are updated in the same transaction. The schedules
+        of the charges which are not on the database yet are retrieved first, in place
+        of the after_update_or_create_from_omise_object_action hook.
+        See OmiseBaseModel.bulk_update_or_create_from_omise_objects.
+
+        :returns: List of Charge in the same order as omise_objects.
+        """
+        omise_objects = list(omise_objects)
+        schedule_ids = cls.save_missing_schedules(omise_objects=omise_objects)
+        charge_ids = {omise_object.id for omise_object in omise_objects}
+
+        with transaction.atomic(using=router.db_for_write(cls)):
+            previous_charges = ChargeDailyTotal.get_charge_values(
+                charge_ids=charge_ids, lock=True
+            )
+
+            charges = super().bulk_update_or_create_from_omise_objects(
+                omise_objects=omise_objects,
+                ignore_fields=ignore_fields,
+                uids=uids,
+                defaults=defaults,
+            )
+
+            scheduled_charges = []
+
+            for charge in {charge.pk: charge for charge in charges}.values():
+                if charge.schedule_id != schedule_ids[charge.pk]:
+                    charge.schedule_id = schedule_ids[charge.pk]
+                    charge.date_updated = timezone.now()
+                    scheduled_charges.append(charge)
+
+            cls.objects.bulk_update(
+                scheduled_charges, fields=["schedule", "date_updated"]
+            )
+
+            ChargeDailyTotal.record_changes(
+                previous_charges=previous_charges,
+                charges=ChargeDailyTotal.get_charge_values(charge_ids=charge_ids),
+            )
+
+        return charges
+
+    @staticmethod
+    def save_missing_schedules(omise_objects: List[omise.Charge]) -> Dict[str, str]:
+        """
+        Retrieve and save the schedules of charges which are not on the database yet.
+
+        :param omise_objects: List of omise.Charge.
+
+        :returns: Dictionary of schedule ids, or None, by charge id.
+        """
+        Schedule = apps.get_model(app_label="django_omise", model_name="Schedule")
+        schedule_ids = {
+            omise_object.id: omise_object._attributes.get("schedule") or None
+            for omise_object in omise_objects
+        }
+        existing_ids = set(
+            Schedule._base_manager.filter(pk__in=schedule_ids.values()).values_list(
+                "pk", flat=True
+            )
+        )
+
+        missing_ids = set(filter(None, schedule_ids.values())) - existing_ids
+
+        for schedule_id in sorted(missing_ids):
+            update_or_create_from_omise_object(
+                omise_object=omise.Schedule.retrieve(schedule_id)
+            )
+
+        return schedule_ids
+
     @classmethod
     def charge(
         cls,
@@ -529,10 +915,15 @@ class Charge(OmiseBaseModel, OmiseMetadata):
         metadata: Optional[dict] = None,
         capture: Optional[bool] = True,
         description: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> "Charge":
         """
         Charge the customer with provided payment_method.
 
+        A PendingCharge is saved before calling Omise and the charge is created with
+        an Idempotency-Key header, so a charge whose request timed out can be safely
+        retried by calling this method again with the same idempotency_key.
+
         :param amount: The amount to charge in the smallest unit.
         :param currency: The currency to charge.
         :param token: The token to charge.
@@ -544,17 +935,222 @@ class Charge(OmiseBaseModel, OmiseMetadata):
         :param metadata optional: The charge metadata.
         :param capture: Whether to capture this charge immediately.
         :param description: The charge description.
+        :param idempotency_key optional: The idempotency key of the charge. Default to the uid of the new charge.
+            If a charge was already requested with this key, that charge is returned instead.
 
         :returns: An instace of Charge object.
         """
+        if idempotency_key is not None:
+            pending_charge = PendingCharge.objects.filter(
+                idempotency_key=idempotency_key
+            ).first()
+
+            if pending_charge is not None:
+                return pending_charge.resolve()
+
+        uid = uuid.uuid4()
+
+        parameters = cls.build_charge_parameters(
+            uid=uid,
+            amount=amount,
+            currency=currency,
+            token=token,
+            card=card,
+            source=source,
+            return_uri=return_uri,
+            request=request,
+            metadata=metadata,
+            capture=capture,
+            description=description,
+        )
+
+        if idempotency_key is None:
+            idempotency_key = str(uid)
+
+        try:
+            with transaction.atomic(using=router.db_for_write(PendingCharge)):
+                pending_charge = PendingCharge.objects.create(
+                    uid=uid,
+                    idempotency_key=idempotency_key,
+                    parameters=parameters,
+                )
+        except IntegrityError:
+            pending_charge = PendingCharge.objects.get(idempotency_key=idempotency_key)
+            return pending_charge.resolve()
+
+        return pending_charge.create_charge()
+
+    @classmethod
+    def charge_many(
+        cls,
+        charges: Iterable[Dict],
+        max_workers: int = 4,
+        rate_limit: Optional[float] = None,
+        batch_size: int = 500,
+    ) -> List["ChargeResult"]:
+        """
+        Create many charges, calling Omise from a bounded pool of threads.
+
+        Each charge is described by a dictionary of the keyword arguments of
+        Charge.charge. The charges are processed in batches: the PendingCharge
+        objects of a batch are saved with one bulk query, the batch is sent to Omise
+        concurrently, and the created charges are saved with bulk queries.
+        A charge failing does not stop the other charges.
+
+        :param charges: Iterable of dictionaries of Charge.charge keyword arguments.
+        :param max_workers: The maximum number of concurrent requests to Omise.
+        :param rate_limit optional: The maximum number of requests to Omise per second.
+        :param batch_size: The number of charges to save per batch.
+
+        :returns: List of ChargeResult in the same order as charges.
+        """
+        charges = iter(charges)
+        rate_limiter = RateLimiter(rate=rate_limit)
+        results = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch in iter(lambda: list(islice(charges, batch_size)), []):
+                results += cls.charge_batch(
+                    charges=batch, executor=executor, rate_limiter=rate_limiter
+                )
+
+        return results
+
+    @classmethod
+    def charge_batch(
+        cls,
+        charges: List[Dict],
+        executor: ThreadPoolExecutor,
+        rate_limiter: RateLimiter,
+    ) -> List["ChargeResult"]:
+        """
+        Create a batch of charges for Charge.charge_many.
+
+        :param charges: List of dictionaries of Charge.charge keyword arguments.
+        :param executor: The pool of threads to call Omise with.
+        :param rate_limiter: The RateLimiter shared by the requests to Omise.
+
+        :returns: List of ChargeResult in the same order as charges.
+        """
+        results = [None] * len(charges)
+        new_pending_charges = {}
+
+        for index, charge_details in enumerate(charges):
+            charge_details = dict(charge_details)
+            idempotency_key = charge_details.pop("idempotency_key", None)
+            uid = uuid.uuid4()
+
+            try:
+                parameters = cls.build_charge_parameters(uid=uid, **charge_details)
+            except (TypeError, ValueError) as e:
+                results[index] = ChargeResult(
+                    idempotency_key=idempotency_key, charge=None, error=e
+                )
+                continue
+
+            if idempotency_key is None:
+                idempotency_key = str(uid)
+
+            new_pending_charges[index] = PendingCharge(
+                uid=uid,
+                idempotency_key=idempotency_key,
+                parameters=parameters,
+            )
+
+        PendingCharge.objects.bulk_create(
+            new_pending_charges.values(), ignore_conflicts=True
+        )
+
+        pending_charges = PendingCharge.objects.in_bulk(
+            [
+                pending_charge.idempotency_key
+                for pending_charge in new_pending_charges.values()
+            ],
+            field_name="idempotency_key",
+        )
+
+        existing_charges = cls.objects.in_bulk(
+            [pending_charge.uid for pending_charge in pending_charges.values()],
+            field_name="uid",
+        )
+
+        omise_requests = {}
+
+        for index, new_pending_charge in new_pending_charges.items():
+            pending_charge = pending_charges[new_pending_charge.idempotency_key]
+            charge = existing_charges.get(pending_charge.uid)
+
+            if charge is not None:
+                results[index] = ChargeResult(
+                    idempotency_key=pending_charge.idempotency_key,
+                    charge=charge,
+                    error=None,
+                )
+                continue
+
+            omise_requests[index] = (
+                pending_charge,
+                executor.submit(
+                    pending_charge.create_omise_charge, rate_limiter=rate_limiter
+                ),
+            )
+
+        omise_charges = {}
+
+        for index, (pending_charge, future) in omise_requests.items():
+            try:
+                omise_charges[index] = future.result()
+            except Exception as e:
+                results[index] = ChargeResult(
+                    idempotency_key=pending_charge.idempotency_key,
+                    charge=None,
+                    error=e,
+                )
+
+        saved_charges = cls.bulk_update_or_create_from_omise_objects(
+            omise_objects=omise_charges.values(),
+            uids=[omise_requests[index][0].uid for index in omise_charges],
+        )
+
+        for index, charge in zip(omise_charges, saved_charges):
+            results[index] = ChargeResult(
+                idempotency_key=omise_requests[index][0].idempotency_key,
+                charge=charge,
+                error=None,
+            )
+
+        return results
+
+    @classmethod
+    def build_charge_parameters(
+        cls,
+        uid: uuid.UUID,
+        amount: int,
+        currency: Currency,
+        token: Optional[omise.Token] = None,
+        card: Optional[Card] = None,
+        source: Optional[Dict] = None,
+        return_uri: Optional[str] = None,
+        request: Optional[HttpRequest] = None,
+        metadata: Optional[dict] = None,
+        capture: Optional[bool] = True,
+        description: Optional[str] = None,
+    ) -> Dict:
+        """
+        Build the parameters of omise.Charge.create for a new charge.
+
+        :param uid: The uid of the new charge, used in the default return_uri.
+
+        See Charge.charge for the other parameters.
+
+        :returns: Dictionary of omise.Charge.create keyword arguments.
+        """
         if [token, card, source].count(None) == 3:
             raise ValueError("At least a token, a card, or a source is required")
 
         if [token, card, source].count(None) != 2:
             raise ValueError("Only one of token, card, or source must be specified")
 
-        uid = uuid.uuid4()
-
         if return_uri is None:
             path = reverse("django_omise:return_uri", kwargs={"uid": uid})
             host = getattr(settings, "OMISE_CHARGE_RETURN_HOST", None)
@@ -569,8 +1165,7 @@ class Charge(OmiseBaseModel, OmiseMetadata):
                     "set OMISE_CHARGE_RETURN_HOST, or pass request."
                 )
 
-        if metadata is None:
-            metadata = {}
+        metadata = {**(metadata or {}), CHARGE_UID_METADATA_KEY: str(uid)}
 
         charge_details = {}
 
@@ -582,12 +1177,12 @@ class Charge(OmiseBaseModel, OmiseMetadata):
 
         if card is not None:
             charge_details["card"] = card.id
-            charge_details["customer"] = card.customer.id
+            charge_details["customer"] = card.customer_id
 
         if source is not None:
             charge_details["source"] = source
 
-        charge = omise.Charge.create(
+        return dict(
             amount=int(amount),
             currency=currency,
             metadata=metadata,
@@ -597,7 +1192,121 @@ class Charge(OmiseBaseModel, OmiseMetadata):
             **charge_details,
         )
 
-        return cls.update_or_create_from_omise_object(omise_object=charge, uid=uid)
+
+class ChargeResult(NamedTuple):
+    """
+    The result of a charge created with Charge.charge_many.
+
+    :param idempotency_key: The idempotency key of the charge.
+    :param charge: The saved charge, None if the charge failed.
+    :param error: The error raised while creating the charge, None if the charge succeeded.
+    """
+
+    idempotency_key: Optional[str]
+    charge: Optional[Charge]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class PendingCharge(models.Model):
+    """
+    A charge request saved before the charge is created on Omise.
+
+    The charge created from this request shares its uid, so a request whose
+    response was lost can be resolved to its charge.
+    """
+
+    uid = models.UUIDField(unique=True, editable=False)
+
+    idempotency_key = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text=_("The Idempotency-Key header sent with the charge request."),
+    )
+
+    parameters = models.JSONField(
+        default=dict,
+        help_text=_("The parameters the charge was requested with."),
+    )
+
+    date_created = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"Omise{self.__class__.__name__}: {self.idempotency_key}"
+
+    def create_charge(self) -> "Charge":
+        """
+        Create the charge on Omise with the idempotency key of this request.
+
+        Omise returns the charge created by an earlier request with the same key
+        instead of creating a new one.
+
+        :returns: An instance of Charge object.
+        """
+        charge = self.create_omise_charge()
+
+        return Charge.update_or_create_from_omise_object(
+            omise_object=charge, uid=self.uid
+        )
+
+    def create_omise_charge(
+        self, rate_limiter: Optional[RateLimiter] = None
+    ) -> omise.Charge:
+        """
+        Send the charge request to Omise without saving the charge.
+
+        :param rate_limiter optional: A RateLimiter to wait for before sending the request.
+
+        :returns: An instance of omise.Charge.
+        """
+        if rate_limiter is not None:
+            rate_limiter.wait()
+
+        return create(
+            omise.Charge,
+            headers={"Idempotency-Key": self.idempotency_key},
+            **self.parameters,
+        )
+
+    def find_charge(self) -> Optional["Charge"]:
+        """
+        Get the charge of this request without creating it on Omise.
+
+        If the charge was not saved, Omise is searched once for the charges with the
+        uid of this request, which is in their metadata.
+
+        :returns: An instance of Charge object, or None if Omise has no such charge.
+        """
+        charge = Charge.objects.filter(uid=self.uid).first()
+
+        if charge is not None:
+            return charge
+
+        for omise_charge in omise.Search.execute("charge", query=str(self.uid)):
+            metadata = omise_charge._attributes.get("metadata") or {}
+
+            if metadata.get(CHARGE_UID_METADATA_KEY) == str(self.uid):
+                return Charge.update_or_create_from_omise_object(
+                    omise_object=omise_charge, uid=self.uid
+                )
+
+        return None
+
+    def resolve(self) -> "Charge":
+        """
+        Get the charge of this request, creating it on Omise if it was not saved.
+
+        :returns: An instance of Charge object.
+        """
+        charge = Charge.objects.filter(uid=self.uid).first()
+
+        if charge is not None:
+            return charge
+
+        return self.create_charge()
 
 
 class Source(OmiseBaseModel):
@@ -690,13 +1399,26 @@ class Source(OmiseBaseModel):
         return f"{self.amount / 100:,.2f}"
 
 
-class Refund(OmiseBaseModel, OmiseMetadata):
+class Refund(OmiseBaseModel, OmiseMetadata, OmiseEventTimeline):
+    omise_class = omise.Refund
+
+    class Meta(OmiseBaseModel.Meta):
+        indexes = OmiseBaseModel.Meta.indexes + [
+            models.Index(fields=["-created_at"], name="omise_refund_created_at"),
+        ]
+
     charge = models.ForeignKey(
         Charge,
         related_name="refunds",
         on_delete=models.PROTECT,
     )
 
+    created_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text=_("The time the refund was created on Omise."),
+    )
+
     amount = models.IntegerField(
         help_text="Refund amount in smallest unit of charge currency.",
     )
@@ -721,6 +1443,17 @@ class Refund(OmiseBaseModel, OmiseMetadata):
 
     voided = models.BooleanField()
 
+    def get_omise_object(self) -> omise.Refund:
+        """Fetch the refund from Omise's server, through its charge."""
+        refund = omise.Refund.from_data(
+            {
+                "object": "refund",
+                "id": self.id,
+                "location": f"/charges/{self.charge_id}/refunds/{self.id}",
+            }
+        )
+        return refund.reload()
+
     @property
     def human_amount(self) -> str:
         if self.amount is None:
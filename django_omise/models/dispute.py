@@ -0,0 +1,115 @@
+import uuid
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_omise.omise import omise
+from django_omise.utils.core_utils import save_missing_related_objects
+
+from .base import OmiseBaseModel, OmiseEventTimeline, OmiseMetadata
+from .choices import Currency, DisputeStatus
+from .core import Charge
+from .report import format_amount
+
+from typing import Dict, Iterable, List, Optional
+
+
+class Dispute(OmiseBaseModel, OmiseMetadata, OmiseEventTimeline):
+    """
+    A class representing Omise Dispute object, a chargeback of a charge.
+
+    Official documentation: https://www.omise.co/disputes-api
+    """
+
+    omise_class = omise.Dispute
+
+    charge = models.ForeignKey(
+        Charge,
+        related_name="disputes",
+        on_delete=models.PROTECT,
+    )
+
+    status = models.CharField(
+        max_length=10,
+        choices=DisputeStatus.choices,
+        help_text=_("Status of this dispute."),
+    )
+
+    amount = models.IntegerField(
+        help_text=_("Disputed amount in smallest unit of charge currency."),
+    )
+
+    currency = models.CharField(
+        max_length=3,
+        choices=Currency.choices,
+    )
+
+    funding_amount = models.IntegerField(
+        blank=True,
+        null=True,
+        help_text=_(
+            "For multi-currency charges, amount after exchange into account funding currency."
+        ),
+    )
+
+    funding_currency = models.CharField(
+        max_length=3,
+        blank=True,
+        choices=Currency.choices,
+    )
+
+    reason_code = models.CharField(
+        max_length=100,
+        blank=True,
+        help_text=_("The reason of the cardholder for the dispute."),
+    )
+
+    reason_message = models.TextField(blank=True)
+
+    message = models.TextField(
+        blank=True,
+        help_text=_("The response of the merchant to the dispute."),
+    )
+
+    admin_message = models.TextField(blank=True)
+
+    closed_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta(OmiseBaseModel.Meta):
+        indexes = OmiseBaseModel.Meta.indexes + [
+            models.Index(
+                fields=["status", "-date_created"], name="omise_dispute_status_created"
+            ),
+        ]
+
+    @property
+    def human_amount(self) -> str:
+        return format_amount(amount=self.amount, currency=self.currency)
+
+    @classmethod
+    def bulk_update_or_create_from_omise_objects(
+        cls,
+        omise_objects: Iterable[omise.Base],
+        ignore_fields: Optional[List[str]] = None,
+        uids: Optional[List[Optional[uuid.UUID]]] = None,
+        defaults: Optional[Dict] = None,
+    ) -> List["Dispute"]:
+        """
+        Update existing disputes or create new disputes from Omise Dispute objects with bulk queries.
+
+        The charges of the disputes which are not on the database yet are retrieved first.
+        See OmiseBaseModel.bulk_update_or_create_from_omise_objects.
+
+        :returns: List of Dispute in the same order as omise_objects.
+        """
+        omise_objects = list(omise_objects)
+        save_missing_related_objects(
+            model=cls, omise_objects=omise_objects, field_name="charge"
+        )
+
+        return super().bulk_update_or_create_from_omise_objects(
+            omise_objects=omise_objects,
+            ignore_fields=ignore_fields,
+            uids=uids,
+            defaults=defaults,
+        )
@@ -79,6 +79,9 @@ class Event(OmiseBaseModel):
     event_object = GenericForeignKey("content_type", "object_id")
 
     class Meta:
-        indexes = [
+        indexes = OmiseBaseModel.Meta.indexes + [
             models.Index(fields=["content_type", "object_id"]),
+            models.Index(
+                fields=["event_type", "-date_created"], name="omise_event_type_created"
+            ),
         ]
@@ -1,5 +1,14 @@
+import datetime
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from django.apps import apps
+from django.core.cache import cache
 from django.db import models
 
+from typing import Iterator, List, Tuple
+
 
 class DeletedStatusQueryset(models.QuerySet):
     def live(self):
@@ -12,6 +21,155 @@ class DeletedStatusQueryset(models.QuerySet):
         return self.filter(deleted=False)
 
 
+class CustomerQueryset(DeletedStatusQueryset):
+    def get_cache_keys(self) -> List[str]:
+        """
+        Get the cache keys of the user to customer mappings of the customers.
+        """
+        return [
+            self.model.get_cache_key(user_id=user_id, livemode=livemode)
+            for user_id, livemode in self.filter(user__isnull=False)
+            .values_list("user_id", "livemode")
+            .distinct()
+        ]
+
+    def update(self, **kwargs):
+        """
+        Update the customers and clear their cached user to customer mappings.
+
+        bulk_update updates through this method as well.
+        """
+        cache_keys = self.get_cache_keys()
+        pks = None
+
+        if "user" in kwargs or "user_id" in kwargs or "livemode" in kwargs:
+            pks = list(self.values_list("pk", flat=True))
+
+        rows = super().update(**kwargs)
+
+        if pks is not None:
+            cache_keys += (
+                self.model.objects.using(self.db).filter(pk__in=pks).get_cache_keys()
+            )
+
+        cache.delete_many(cache_keys)
+
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+
+        cache.delete_many(
+            [
+                self.model.get_cache_key(user_id=obj.user_id, livemode=obj.livemode)
+                for obj in objs
+                if obj.user_id is not None
+            ]
+        )
+
+        return objs
+
+
+class CardQueryset(DeletedStatusQueryset):
+    def find_duplicates(
+        self,
+        fingerprint,
+        customer=None,
+        expiration_month=None,
+        expiration_year=None,
+    ):
+        """
+        Get the live cards with the given fingerprint.
+
+        :param fingerprint: The fingerprint of the card.
+        :param customer optional: Only find the cards of this customer.
+        :param expiration_month optional: Only find the cards expiring in this month.
+        :param expiration_year optional: Only find the cards expiring in this year.
+        """
+        if not fingerprint:
+            return self.none()
+
+        cards = self.live().filter(fingerprint=fingerprint)
+
+        if customer is not None:
+            cards = cards.filter(customer=customer)
+
+        if expiration_month is not None:
+            cards = cards.filter(expiration_month=expiration_month)
+
+        if expiration_year is not None:
+            cards = cards.filter(expiration_year=expiration_year)
+
+        return cards
+
+
+class ScheduleQueryset(DeletedStatusQueryset):
+    def occurrences_between(
+        self, date_from: datetime.date, date_to: datetime.date
+    ) -> Iterator[Tuple["Schedule", datetime.date]]:
+        """
+        Compute the occurrences of the active schedules in a date range, without calling Omise.
+
+        The schedules are loaded with one query, with their scheduled charge.
+
+        :param date_from: The first date of the range, inclusive.
+        :param date_to: The last date of the range, inclusive.
+
+        :returns: Iterator of schedule and date tuples, ordered by schedule start date.
+        """
+        schedules = (
+            self.live()
+            .filter(active=True, start_on__lte=date_to, end_on__gte=date_from)
+            .select_related("charge")
+            .order_by("start_on", "pk")
+        )
+
+        for schedule in schedules.iterator(chunk_size=2000):
+            for date in schedule.get_occurrences_between(
+                date_from=date_from, date_to=date_to
+            ):
+                yield schedule, date
+
+    def sync_occurrences(self, max_workers: int = 4, batch_size: int = 100) -> int:
+        """
+        Sync the occurrences of the active schedules with Omise's server.
+
+        The occurrences of a batch of schedules are fetched concurrently from a
+        bounded pool of threads, then saved with bulk queries on the calling thread.
+
+        :param max_workers: The maximum number of concurrent requests to Omise.
+        :param batch_size: The number of schedules fetched per batch.
+
+        :returns: The number of occurrences synced.
+        """
+        Occurrence = apps.get_model(app_label="django_omise", model_name="Occurrence")
+
+        schedules = (
+            self.live()
+            .filter(active=True)
+            .order_by("pk")
+            .iterator(chunk_size=batch_size)
+        )
+        count = 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch in iter(lambda: list(islice(schedules, batch_size)), []):
+                omise_occurrences = [
+                    omise_occurrence
+                    for occurrences in executor.map(
+                        lambda schedule: schedule.get_omise_occurrences(), batch
+                    )
+                    for omise_occurrence in occurrences
+                ]
+
+                Occurrence.bulk_update_or_create_from_omise_objects(
+                    omise_objects=omise_occurrences
+                )
+                count += len(omise_occurrences)
+
+        return count
+
+
 class NotDeletedManager(models.Manager):
     def get_queryset(self):
         return DeletedStatusQueryset(self.model, using=self._db)
@@ -38,3 +196,44 @@ class DeletableManager(models.Manager):
 
     def deleted(self):
         return self.get_queryset().deleted()
+
+
+class CustomerManager(NotDeletedManager):
+    def get_queryset(self):
+        return CustomerQueryset(self.model, using=self._db)
+
+
+class CardManager(NotDeletedManager):
+    def get_queryset(self):
+        return CardQueryset(self.model, using=self._db)
+
+    def find_duplicates(
+        self,
+        fingerprint,
+        customer=None,
+        expiration_month=None,
+        expiration_year=None,
+    ):
+        return self.get_queryset().find_duplicates(
+            fingerprint=fingerprint,
+            customer=customer,
+            expiration_month=expiration_month,
+            expiration_year=expiration_year,
+        )
+
+
+class ScheduleManager(DeletableManager):
+    def get_queryset(self):
+        return ScheduleQueryset(self.model, using=self._db)
+
+    def occurrences_between(
+        self, date_from: datetime.date, date_to: datetime.date
+    ) -> Iterator[Tuple["Schedule", datetime.date]]:
+        return self.get_queryset().occurrences_between(
+            date_from=date_from, date_to=date_to
+        )
+
+    def sync_occurrences(self, max_workers: int = 4, batch_size: int = 100) -> int:
+        return self.get_queryset().sync_occurrences(
+            max_workers=max_workers, batch_size=batch_size
+        )
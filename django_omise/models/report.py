@@ -0,0 +1,246 @@
+import datetime
+
+from collections import defaultdict
+
+from django.apps import apps
+from django.db import models, router, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from .choices import ChargeStatus, Currency
+
+from django_omise.utils.core_utils import get_start_of_day
+
+from typing import Dict, Iterable, Optional
+
+
+class ChargeDailyTotal(models.Model):
+    """
+    The number and sum of charges per day, currency, status and source type.
+
+    The totals are updated when charges are saved from Omise objects, and can be
+    rebuilt from the charges with the rebuild_charge_totals command. Charges are
+    counted on the day they were created on Omise, or saved when it is unknown.
+    """
+
+    CARD_SOURCE_TYPE = "card"
+
+    KEY_FIELDS = ["date", "currency", "status", "source_type"]
+    SUM_FIELDS = ["count", "amount", "net", "refunded_amount"]
+
+    date = models.DateField(help_text=_("The day the charges were created."))
+
+    currency = models.CharField(max_length=3, choices=Currency.choices)
+
+    status = models.CharField(max_length=10, choices=ChargeStatus.choices)
+
+    source_type = models.CharField(
+        max_length=50,
+        help_text=_("The type of source of the charges, card for card charges."),
+    )
+
+    count = models.IntegerField(default=0, help_text=_("The number of charges."))
+
+    amount = models.BigIntegerField(
+        default=0, help_text=_("Sum of charge amounts in smallest unit of currency.")
+    )
+
+    net = models.BigIntegerField(
+        default=0, help_text=_("Sum of net amounts in smallest unit of currency.")
+    )
+
+    refunded_amount = models.BigIntegerField(
+        default=0,
+        help_text=_("Sum of refunded amounts in smallest unit of currency."),
+    )
+
+    class Meta:
+        ordering = ["-date", "currency", "status", "source_type"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "currency", "status", "source_type"],
+                name="django_omise_unique_charge_daily_total",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Omise{self.__class__.__name__}: {self.date} {self.currency} {self.status} {self.source_type}"
+
+    @property
+    def human_amount(self) -> str:
+        return format_amount(amount=self.amount, currency=self.currency)
+
+    @property
+    def human_net(self) -> str:
+        return format_amount(amount=self.net, currency=self.currency)
+
+    @property
+    def human_refunded_amount(self) -> str:
+        return format_amount(amount=self.refunded_amount, currency=self.currency)
+
+    @staticmethod
+    def get_charge_created() -> Coalesce:
+        """
+        Get the expression of the time charges are counted at: their creation on
+        Omise, or their first save when it is unknown.
+        """
+        return Coalesce("created_at", "date_created")
+
+    @classmethod
+    def get_charge_values(
+        cls, charge_ids: Iterable[str], lock: bool = False
+    ) -> Dict[str, Dict]:
+        """
+        Get the values of charges counted in the daily totals.
+
+        :param charge_ids: Iterable of charge ids.
+        :param lock optional: Whether to lock the charges until the end of the transaction.
+
+        :returns: Dictionary of the values of the existing charges by charge id.
+        """
+        queryset = apps.get_model(app_label="django_omise", model_name="Charge").objects
+
+        if lock:
+            queryset = queryset.select_for_update(of=("self",))
+
+        return {
+            charge["pk"]: charge
+            for charge in queryset.filter(pk__in=list(charge_ids))
+            .annotate(created=cls.get_charge_created())
+            .values(
+                "pk",
+                "created",
+                "currency",
+                "status",
+                "source__type",
+                "amount",
+                "net",
+                "refunded_amount",
+            )
+        }
+
+    @classmethod
+    def record_changes(
+        cls, previous_charges: Dict[str, Dict], charges: Dict[str, Dict]
+    ) -> None:
+        """
+        Update the daily totals with the changes of charges.
+
+        Missing totals are created with one query, then each changed total is
+        updated with one query, so concurrent updates add up.
+
+        :param previous_charges: The values of the charges before they were saved, see get_charge_values.
+        :param charges: The values of the charges after they were saved.
+        """
+        deltas = defaultdict(lambda: dict.fromkeys(cls.SUM_FIELDS, 0))
+
+        for charges_values, sign in [(previous_charges, -1), (charges, 1)]:
+            for charge in charges_values.values():
+                delta = deltas[
+                    (
+                        timezone.localdate(charge["created"]),
+                        charge["currency"],
+                        charge["status"],
+                        charge["source__type"] or cls.CARD_SOURCE_TYPE,
+                    )
+                ]
+                delta["count"] += sign
+                delta["amount"] += sign * (charge["amount"] or 0)
+                delta["net"] += sign * (charge["net"] or 0)
+                delta["refunded_amount"] += sign * (charge["refunded_amount"] or 0)
+
+        deltas = {
+            tuple(zip(cls.KEY_FIELDS, key)): delta
+            for key, delta in deltas.items()
+            if any(delta.values())
+        }
+
+        cls.objects.bulk_create(
+            [cls(**dict(key)) for key in deltas], ignore_conflicts=True
+        )
+
+        for key, delta in deltas.items():
+            cls.objects.filter(**dict(key)).update(
+                **{name: F(name) + value for name, value in delta.items()}
+            )
+
+    @classmethod
+    def rebuild(
+        cls,
+        date_from: Optional[datetime.date] = None,
+        date_to: Optional[datetime.date] = None,
+    ) -> int:
+        """
+        Rebuild the daily totals from the charges.
+
+        :param date_from optional: The first day to rebuild, inclusive. Default to the first charge.
+        :param date_to optional: The last day to rebuild, inclusive. Default to the last charge.
+
+        :returns: The number of daily totals.
+        """
+        charges = (
+            apps.get_model(app_label="django_omise", model_name="Charge")
+            .objects.order_by()
+            .annotate(created=cls.get_charge_created())
+        )
+        totals = cls.objects.all()
+
+        if date_from is not None:
+            charges = charges.filter(created__gte=get_start_of_day(date_from))
+            totals = totals.filter(date__gte=date_from)
+
+        if date_to is not None:
+            charges = charges.filter(
+                created__lt=get_start_of_day(date_to + datetime.timedelta(days=1))
+            )
+            totals = totals.filter(date__lte=date_to)
+
+        rows = (
+            charges.annotate(day=TruncDate("created"))
+            .values("day", "currency", "status", "source__type")
+            .annotate(
+                charge_count=Count("pk"),
+                total_amount=Sum("amount"),
+                total_net=Sum("net"),
+                total_refunded_amount=Sum("refunded_amount"),
+            )
+        )
+
+        with transaction.atomic(using=router.db_for_write(cls)):
+            new_totals = [
+                cls(
+                    date=row["day"],
+                    currency=row["currency"],
+                    status=row["status"],
+                    source_type=row["source__type"] or cls.CARD_SOURCE_TYPE,
+                    count=row["charge_count"],
+                    amount=row["total_amount"] or 0,
+                    net=row["total_net"] or 0,
+                    refunded_amount=row["total_refunded_amount"] or 0,
+                )
+                for row in rows.iterator()
+            ]
+
+            totals.delete()
+            cls.objects.bulk_create(new_totals, batch_size=1000)
+
+        return len(new_totals)
+
+
+def format_amount(amount: Optional[int], currency: str) -> str:
+    """
+    Format an amount in smallest unit of currency for display.
+
+    :param amount: The amount in smallest unit of currency.
+    :param currency: The currency of the amount.
+
+    :returns: The formatted amount.
+    """
+    if amount is None:
+        return f"{0:,.2f}"
+
+    if currency == Currency.JPY:
+        return f"{amount:,.2f}"
+    return f"{amount / 100:,.2f}"
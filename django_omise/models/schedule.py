@@ -1,15 +1,30 @@
-from typing import Optional
-from .base import OmiseBaseModel, OmiseMetadata, OmiseDeletableModel
+import datetime
+import uuid
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from .base import (
+    OmiseBaseModel,
+    OmiseDeletableModel,
+    OmiseEventTimeline,
+    OmiseMetadata,
+)
 from .choices import Currency, OccurrenceStatus, ScheduleStatus, SchedulePeriod
+from .managers import ScheduleManager
 
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from django.db import models
+from django.db import DatabaseError, models, router, transaction
 
-from django_omise.omise import omise
+from django_omise.omise import omise, create
+from django_omise.utils.core_utils import RateLimiter
+from django_omise.utils.schedule_utils import iter_occurrences, get_occurrences_between
 
 
-class Schedule(OmiseBaseModel, OmiseDeletableModel):
+class Schedule(OmiseBaseModel, OmiseDeletableModel, OmiseEventTimeline):
     omise_class = omise.Schedule
 
     active = models.BooleanField(
@@ -44,7 +59,14 @@ class Schedule(OmiseBaseModel, OmiseDeletableModel):
     in_words = models.TextField(blank=True)
     next_occurrences_on = models.JSONField(blank=True, default=list)
 
-    # Todo # on = models.SomeField
+    on = models.JSONField(
+        blank=True,
+        default=dict,
+        help_text=_(
+            "Days the schedule runs on: weekdays, days_of_month or weekday_of_month."
+        ),
+    )
+
     period = models.CharField(max_length=5, choices=SchedulePeriod.choices, blank=True)
 
     start_on = models.DateField(
@@ -58,8 +80,485 @@ class Schedule(OmiseBaseModel, OmiseDeletableModel):
 
     # Todo # transfer = models.ForeignKey("django_omise.Transfer")
 
+    objects = ScheduleManager()
+
+    class Meta(OmiseBaseModel.Meta):
+        indexes = OmiseBaseModel.Meta.indexes + [
+            models.Index(
+                fields=["start_on", "end_on"],
+                condition=models.Q(deleted=False, active=True),
+                name="omise_schedule_live_active",
+            ),
+        ]
+
+    @classmethod
+    def update_or_create_from_omise_object(
+        cls,
+        omise_object: omise.Base,
+        ignore_fields: Optional[List[str]] = None,
+        uid: Optional[uuid.UUID] = None,
+    ) -> "Schedule":
+        """
+        Update existing schedule or create a new schedule from Omise Schedule object.
+
+        The occurrences are saved with bulk queries after the schedule.
+
+        :param omise_object: An instance of omise.Schedule
+        :param ignore_fields optional: List of field names to ignore
+        :param uuid optional: A unique id for new object.
+
+        :returns: An instance of Schedule
+        """
+        ignore_fields = [] if ignore_fields is None else ignore_fields
+
+        schedule = super().update_or_create_from_omise_object(
+            omise_object=omise_object,
+            ignore_fields=ignore_fields + ["occurrences"],
+            uid=uid,
+        )
+
+        if "occurrences" not in ignore_fields:
+            schedule.sync_occurrences(omise_schedule=omise_object)
+
+        return schedule
+
+    @classmethod
+    def build_schedule_parameters(
+        cls,
+        customer: Union[models.Model, str],
+        amount: int,
+        currency: Currency,
+        every: int,
+        period: str,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        card: Optional[Union[models.Model, str]] = None,
+        on: Optional[Dict] = None,
+        description: Optional[str] = None,
+    ) -> Dict:
+        """
+        Build the parameters of omise.Schedule.create. See Customer.create_schedule.
+
+        :param customer: The customer to charge, or its id.
+        :param card optional: The card to charge, or its id. Default to the customer's default card.
+
+        :returns: Dictionary of parameters.
+        """
+        charge = {
+            "customer": customer if isinstance(customer, str) else customer.id,
+            "amount": amount,
+            "currency": currency,
+        }
+
+        if card is not None:
+            charge["card"] = card if isinstance(card, str) else card.id
+
+        if description is not None:
+            charge["description"] = description
+
+        return {
+            "every": every,
+            "period": period,
+            "start_date": str(start_date),
+            "end_date": str(end_date),
+            "charge": charge,
+            "on": on,
+        }
+
+    @classmethod
+    def create_many(
+        cls,
+        schedules: Iterable[Dict],
+        max_workers: int = 4,
+        rate_limit: Optional[float] = None,
+        batch_size: int = 500,
+    ) -> List["ScheduleResult"]:
+        """
+        Create many schedules, calling Omise from a bounded pool of threads.
+
+        Each schedule is described by a dictionary of the keyword arguments of
+        Schedule.build_schedule_parameters and an optional idempotency_key.
+        A PendingSchedule is saved for each key before calling Omise, and linked to
+        the schedule once it is saved, so running it again with the same keys
+        resumes where it stopped: created schedules are not sent again.
+        A schedule failing, on Omise or on the database, does not stop the other
+        schedules: when the bulk queries saving a batch fail, the batch is saved
+        again schedule by schedule.
+
+        :param schedules: Iterable of dictionaries of schedule details.
+        :param max_workers: The maximum number of concurrent requests to Omise.
+        :param rate_limit optional: The maximum number of requests to Omise per second.
+        :param batch_size: The number of schedules to save per batch.
+
+        :returns: List of ScheduleResult in the same order as schedules.
+        """
+        schedules = iter(schedules)
+        rate_limiter = RateLimiter(rate=rate_limit)
+        results = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch in iter(lambda: list(islice(schedules, batch_size)), []):
+                results += cls.create_batch(
+                    schedules=batch, executor=executor, rate_limiter=rate_limiter
+                )
+
+        return results
+
+    @classmethod
+    def create_batch(
+        cls,
+        schedules: List[Dict],
+        executor: ThreadPoolExecutor,
+        rate_limiter: RateLimiter,
+    ) -> List["ScheduleResult"]:
+        """
+        Create a batch of schedules for Schedule.create_many.
+
+        :param schedules: List of dictionaries of schedule details.
+        :param executor: The pool of threads to call Omise with.
+        :param rate_limiter: The RateLimiter shared by the requests to Omise.
+
+        :returns: List of ScheduleResult in the same order as schedules.
+        """
+        results = [None] * len(schedules)
+        new_pending_schedules = {}
+
+        for index, schedule_details in enumerate(schedules):
+            schedule_details = dict(schedule_details)
+            idempotency_key = schedule_details.pop("idempotency_key", None)
+
+            try:
+                parameters = cls.build_schedule_parameters(**schedule_details)
+            except (TypeError, ValueError) as e:
+                results[index] = ScheduleResult(
+                    idempotency_key=idempotency_key, schedule=None, error=e
+                )
+                continue
+
+            if idempotency_key is None:
+                idempotency_key = str(uuid.uuid4())
+
+            new_pending_schedules[index] = PendingSchedule(
+                idempotency_key=idempotency_key,
+                parameters=parameters,
+            )
+
+        PendingSchedule.objects.bulk_create(
+            new_pending_schedules.values(), ignore_conflicts=True
+        )
+
+        pending_schedules = PendingSchedule.objects.select_related("schedule").in_bulk(
+            [
+                pending_schedule.idempotency_key
+                for pending_schedule in new_pending_schedules.values()
+            ],
+            field_name="idempotency_key",
+        )
+
+        omise_requests = {}
+
+        for index, new_pending_schedule in new_pending_schedules.items():
+            pending_schedule = pending_schedules[new_pending_schedule.idempotency_key]
+
+            if pending_schedule.schedule is not None:
+                results[index] = ScheduleResult(
+                    idempotency_key=pending_schedule.idempotency_key,
+                    schedule=pending_schedule.schedule,
+                    error=None,
+                )
+                continue
+
+            omise_requests[index] = (
+                pending_schedule,
+                executor.submit(
+                    pending_schedule.create_omise_schedule, rate_limiter=rate_limiter
+                ),
+            )
+
+        omise_schedules = {}
+        failed_pending_schedules = []
+
+        for index, (pending_schedule, future) in omise_requests.items():
+            try:
+                omise_schedules[index] = future.result()
+            except Exception as e:
+                results[index] = ScheduleResult(
+                    idempotency_key=pending_schedule.idempotency_key,
+                    schedule=None,
+                    error=e,
+                )
+                pending_schedule.error = repr(e)
+                failed_pending_schedules.append(pending_schedule)
+
+        saved_schedules, errors = cls.save_batch(omise_schedules=omise_schedules)
+
+        for index, e in errors.items():
+            pending_schedule = omise_requests[index][0]
+            results[index] = ScheduleResult(
+                idempotency_key=pending_schedule.idempotency_key,
+                schedule=None,
+                error=e,
+            )
+            pending_schedule.error = repr(e)
+            failed_pending_schedules.append(pending_schedule)
+
+        saved_pending_schedules = []
+
+        for index, schedule in saved_schedules.items():
+            pending_schedule = omise_requests[index][0]
+            pending_schedule.schedule = schedule
+            pending_schedule.error = ""
+            saved_pending_schedules.append(pending_schedule)
+
+            results[index] = ScheduleResult(
+                idempotency_key=pending_schedule.idempotency_key,
+                schedule=schedule,
+                error=None,
+            )
+
+        PendingSchedule.objects.bulk_update(
+            saved_pending_schedules + failed_pending_schedules,
+            fields=["schedule", "error"],
+        )
+
+        return results
+
+    @classmethod
+    def save_batch(
+        cls, omise_schedules: Dict[int, omise.Schedule]
+    ) -> Tuple[Dict[int, "Schedule"], Dict[int, Exception]]:
+        """
+        Save a batch of schedules created on Omise for Schedule.create_many.
+
+        The schedules are saved with bulk queries. If the bulk queries fail, the
+        schedules are saved one by one, so a schedule failing to be saved does not
+        stop the other schedules.
+
+        :param omise_schedules: Dictionary of omise.Schedule by index.
+
+        :returns: Tuple of the dictionaries of the saved schedules and of the database errors, by index.
+        """
+        try:
+            with transaction.atomic(using=router.db_for_write(cls)):
+                saved_schedules = cls.save_omise_schedules(
+                    omise_schedules=omise_schedules.values()
+                )
+            return dict(zip(omise_schedules, saved_schedules)), {}
+        except DatabaseError:
+            pass
+
+        saved_schedules = {}
+        errors = {}
+
+        for index, omise_schedule in omise_schedules.items():
+            try:
+                with transaction.atomic(using=router.db_for_write(cls)):
+                    saved_schedules[index] = cls.save_omise_schedules(
+                        omise_schedules=[omise_schedule]
+                    )[0]
+            except DatabaseError as e:
+                errors[index] = e
+
+        return saved_schedules, errors
+
+    @classmethod
+    def save_omise_schedules(
+        cls, omise_schedules: Iterable[omise.Schedule]
+    ) -> List["Schedule"]:
+        """
+        Save schedules and their scheduled charges with bulk queries, without their occurrences.
+
+        :param omise_schedules: Iterable of omise.Schedule.
+
+        :returns: List of Schedule in the same order as omise_schedules.
+        """
+        omise_schedules = list(omise_schedules)
+
+        ChargeSchedule.bulk_update_or_create_from_omise_objects(
+            omise_objects=[
+                omise_schedule.charge
+                for omise_schedule in omise_schedules
+                if getattr(omise_schedule, "charge", None) is not None
+            ],
+        )
+
+        return cls.bulk_update_or_create_from_omise_objects(
+            omise_objects=omise_schedules,
+            ignore_fields=["occurrences"],
+        )
+
+    def get_omise_occurrences(
+        self, omise_schedule: Optional[omise.Schedule] = None
+    ) -> List[omise.Occurrence]:
+        """
+        Fetch all the occurrences of this schedule from Omise's server.
+
+        The occurrences embedded in omise_schedule are used when they are complete,
+        otherwise the occurrences are fetched page by page.
+
+        :param omise_schedule optional: The schedule already retrieved from Omise.
+
+        :returns: List of omise.Occurrence
+        """
+        if omise_schedule is not None:
+            occurrences = getattr(omise_schedule, "occurrences", None)
+
+            if occurrences is not None and occurrences._attributes.get(
+                "total", len(occurrences)
+            ) <= len(occurrences):
+                return list(occurrences)
+
+        return list(omise.LazyCollection(("schedules", self.id, "occurrences")))
+
+    def sync_occurrences(
+        self, omise_schedule: Optional[omise.Schedule] = None
+    ) -> List["Occurrence"]:
+        """
+        Sync the occurrences of this schedule with Omise's server, with bulk queries.
+
+        :param omise_schedule optional: The schedule already retrieved from Omise.
+
+        :returns: List of Occurrence
+        """
+        return Occurrence.bulk_update_or_create_from_omise_objects(
+            omise_objects=self.get_omise_occurrences(omise_schedule=omise_schedule),
+            defaults={"schedule": self},
+        )
+
+    def iter_occurrences(
+        self, date_from: Optional[datetime.date] = None
+    ) -> Iterator[datetime.date]:
+        """
+        Compute the occurrence dates of this schedule locally, without calling Omise.
+
+        :param date_from optional: Only compute the occurrences on or after this date.
+
+        :returns: Iterator of dates.
+        """
+        return iter_occurrences(
+            every=self.every,
+            period=self.period,
+            start_on=self.start_on,
+            end_on=self.end_on,
+            on=self.on,
+            date_from=date_from,
+        )
+
+    def get_occurrences_between(
+        self, date_from: datetime.date, date_to: datetime.date
+    ) -> List[datetime.date]:
+        """
+        Compute the occurrence dates of this schedule in a date range.
+
+        :param date_from: The first date of the range, inclusive.
+        :param date_to: The last date of the range, inclusive.
+
+        :returns: List of dates.
+        """
+        return get_occurrences_between(
+            every=self.every,
+            period=self.period,
+            start_on=self.start_on,
+            end_on=self.end_on,
+            on=self.on,
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+    def get_next_occurrences(
+        self, count: int = 5, date_from: Optional[datetime.date] = None
+    ) -> List[datetime.date]:
+        """
+        Compute the next occurrence dates of this schedule.
+
+        :param count: The maximum number of dates.
+        :param date_from optional: The first date to consider. Default to today.
+
+        :returns: List of dates.
+        """
+        if date_from is None:
+            date_from = timezone.localdate()
+
+        return list(islice(self.iter_occurrences(date_from=date_from), count))
+
+
+class ScheduleResult(NamedTuple):
+    """
+    The result of a schedule created with Schedule.create_many.
+
+    :param idempotency_key: The idempotency key of the schedule.
+    :param schedule: The saved schedule, None if the schedule failed.
+    :param error: The error raised while creating the schedule, None if the schedule succeeded.
+    """
+
+    idempotency_key: Optional[str]
+    schedule: Optional[Schedule]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class PendingSchedule(models.Model):
+    """
+    A schedule request saved before the schedule is created on Omise.
+
+    The request is linked to its schedule once the schedule is saved, so a batch
+    of schedules can be resumed without creating the same schedule twice.
+    """
+
+    idempotency_key = models.CharField(
+        max_length=255,
+        unique=True,
+        help_text=_("The Idempotency-Key header sent with the schedule request."),
+    )
+
+    parameters = models.JSONField(
+        default=dict,
+        help_text=_("The parameters the schedule was requested with."),
+    )
+
+    schedule = models.OneToOneField(
+        "django_omise.Schedule",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="pending_schedule",
+    )
+
+    error = models.TextField(
+        blank=True, help_text=_("The error of the last request, if it failed.")
+    )
+
+    date_created = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"Omise{self.__class__.__name__}: {self.idempotency_key}"
+
+    def create_omise_schedule(
+        self, rate_limiter: Optional[RateLimiter] = None
+    ) -> omise.Schedule:
+        """
+        Send the schedule request to Omise without saving the schedule.
+
+        :param rate_limiter optional: A RateLimiter to wait for before sending the request.
+
+        :returns: An instance of omise.Schedule.
+        """
+        if rate_limiter is not None:
+            rate_limiter.wait()
+
+        return create(
+            omise.Schedule,
+            headers={"Idempotency-Key": self.idempotency_key},
+            **self.parameters,
+        )
+
 
 class Occurrence(OmiseBaseModel):
+    omise_class = omise.Occurrence
+
     message = models.CharField(max_length=255, blank=True)
     processed_at = models.DateTimeField(blank=True, null=True)
 
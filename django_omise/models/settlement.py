@@ -0,0 +1,239 @@
+import datetime
+import uuid
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from django_omise.omise import omise
+from django_omise.utils.core_utils import RateLimiter, iter_omise_list_pages
+
+from .base import OmiseBaseModel
+from .choices import Currency, TransactionDirection
+from .report import format_amount
+
+from typing import Dict, List, Optional
+
+
+class Transaction(OmiseBaseModel):
+    """
+    A credit or debit of the Omise account balance, e.g. a captured charge or a transfer.
+
+    Transactions are not sent by webhooks. Import them with import_from_omise.
+    """
+
+    omise_class = omise.Transaction
+
+    amount = models.IntegerField(
+        help_text=_("Transaction amount in smallest unit of currency."),
+    )
+
+    currency = models.CharField(
+        max_length=3,
+        choices=Currency.choices,
+    )
+
+    direction = models.CharField(
+        max_length=6,
+        choices=TransactionDirection.choices,
+        help_text=_("Whether the transaction added to or removed from the balance."),
+    )
+
+    key = models.CharField(
+        max_length=100,
+        blank=True,
+        help_text=_(
+            "The kind of transaction, e.g. charge.payment or transfer.payment."
+        ),
+    )
+
+    origin = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text=_("The id of the object which made the transaction, e.g. a charge."),
+    )
+
+    transferable_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text=_("The time the amount can be transferred from the balance."),
+    )
+
+    created_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text=_("The time the transaction was created on Omise."),
+    )
+
+    class Meta(OmiseBaseModel.Meta):
+        ordering = [
+            "-created_at",
+        ]
+        indexes = OmiseBaseModel.Meta.indexes + [
+            models.Index(fields=["-created_at"], name="omise_transaction_created_at"),
+            models.Index(fields=["origin"], name="omise_transaction_origin"),
+        ]
+
+    @property
+    def human_amount(self) -> str:
+        return format_amount(amount=self.amount, currency=self.currency)
+
+    @classmethod
+    def build_defaults_from_omise_object(
+        cls,
+        omise_object: omise.Base,
+        ignore_fields: Optional[List[str]] = None,
+        uid: Optional[uuid.UUID] = None,
+    ) -> Dict:
+        """
+        Create a dictionary of fields and values from an Omise Transaction object.
+
+        Accounts on API versions before 2019-05-29 return the direction as type and
+        the transferable time as transferable.
+        See OmiseBaseModel.build_defaults_from_omise_object.
+        """
+        defaults = super().build_defaults_from_omise_object(
+            omise_object=omise_object,
+            ignore_fields=ignore_fields,
+            uid=uid,
+        )
+        attributes = omise_object._attributes
+
+        if not defaults.get("direction") and "type" in attributes:
+            defaults["direction"] = attributes["type"]
+
+        if defaults.get("transferable_at") is None and "transferable" in attributes:
+            defaults["transferable_at"] = attributes["transferable"]
+
+        return defaults
+
+    @classmethod
+    def import_from_omise(
+        cls,
+        date_from: datetime.date,
+        date_to: datetime.date,
+        window_days: int = 1,
+        rate_limit: Optional[float] = None,
+    ) -> int:
+        """
+        Import the transactions created on Omise in a date range.
+
+        The range is listed in windows of window_days days, one page of 100
+        transactions per request, and every page is saved with bulk queries before
+        the next one is requested. Transactions already on the database are only
+        written when they changed, so a range can be imported again.
+
+        :param date_from: The first day, inclusive, in the current time zone.
+        :param date_to: The last day, inclusive, in the current time zone.
+        :param window_days optional: The number of days listed per window.
+        :param rate_limit optional: The maximum number of requests to Omise per second.
+
+        :returns: The number of imported transactions.
+        """
+        if window_days < 1:
+            raise ValueError(f"window_days must be at least 1, got {window_days}")
+
+        rate_limiter = RateLimiter(rate=rate_limit)
+        end = timezone.make_aware(
+            datetime.datetime.combine(
+                date_to + datetime.timedelta(days=1), datetime.time.min
+            )
+        )
+        window_start = timezone.make_aware(
+            datetime.datetime.combine(date_from, datetime.time.min)
+        )
+        count = 0
+
+        while window_start < end:
+            window_end = min(window_start + datetime.timedelta(days=window_days), end)
+
+            for page in iter_omise_list_pages(
+                "transactions",
+                date_from=window_start,
+                date_to=window_end - datetime.timedelta(seconds=1),
+                rate_limiter=rate_limiter,
+            ):
+                cls.bulk_update_or_create_from_omise_objects(page)
+                count += len(page)
+
+            window_start = window_end
+
+        return count
+
+
+class Balance(models.Model):
+    """
+    A snapshot of the balance of the Omise account.
+
+    Omise only returns the current balance, so snapshots are taken with create_snapshot,
+    e.g. daily after importing the transactions.
+    """
+
+    livemode = models.BooleanField()
+
+    currency = models.CharField(
+        max_length=3,
+        choices=Currency.choices,
+    )
+
+    total = models.BigIntegerField(
+        help_text=_("Total balance in smallest unit of currency."),
+    )
+
+    transferable = models.BigIntegerField(
+        help_text=_("Balance which can be transferred, in smallest unit of currency."),
+    )
+
+    reserve = models.BigIntegerField(
+        default=0,
+        help_text=_("Balance held as reserve, in smallest unit of currency."),
+    )
+
+    on_hold = models.BigIntegerField(
+        default=0,
+        help_text=_("Balance on hold, in smallest unit of currency."),
+    )
+
+    data = models.JSONField(default=dict, blank=True)
+
+    date_created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = [
+            "-date_created",
+        ]
+        indexes = [
+            models.Index(fields=["-date_created"], name="omise_balance_created"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Omise{self.__class__.__name__}: {self.date_created}"
+
+    @property
+    def human_total(self) -> str:
+        return format_amount(amount=self.total, currency=self.currency)
+
+    @property
+    def human_transferable(self) -> str:
+        return format_amount(amount=self.transferable, currency=self.currency)
+
+    @classmethod
+    def create_snapshot(cls) -> "Balance":
+        """
+        Retrieve the current balance from Omise and save a snapshot of it.
+
+        Accounts on API versions before 2019-05-29 return the transferable balance as available.
+
+        :returns: The saved Balance.
+        """
+        attributes = omise.Balance.retrieve()._attributes
+
+        return cls.objects.create(
+            livemode=attributes["livemode"],
+            currency=attributes["currency"].upper(),
+            total=attributes["total"],
+            transferable=attributes.get("transferable", attributes.get("available")),
+            reserve=attributes.get("reserve") or 0,
+            on_hold=attributes.get("on_hold") or 0,
+            data=attributes,
+        )
@@ -0,0 +1,150 @@
+import uuid
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from django_omise.omise import omise
+from django_omise.utils.core_utils import save_missing_related_objects
+
+from .base import (
+    OmiseBaseModel,
+    OmiseDeletableModel,
+    OmiseEventTimeline,
+    OmiseMetadata,
+)
+from .choices import Currency, RecipientType
+from .report import format_amount
+
+from typing import Dict, Iterable, List, Optional
+
+
+class Recipient(OmiseBaseModel, OmiseMetadata, OmiseDeletableModel, OmiseEventTimeline):
+    """
+    A class representing Omise Recipient object, the owner of a bank account receiving transfers.
+
+    Official documentation: https://www.omise.co/recipients-api
+    """
+
+    omise_class = omise.Recipient
+
+    name = models.CharField(max_length=255, blank=True)
+    email = models.CharField(max_length=255, blank=True)
+    description = models.TextField(blank=True)
+
+    type = models.CharField(
+        max_length=20,
+        choices=RecipientType.choices,
+    )
+
+    tax_id = models.CharField(max_length=255, blank=True)
+
+    bank_account = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text=_("The bank account receiving the transfers."),
+    )
+
+    verified = models.BooleanField(
+        default=False, help_text=_("Whether the recipient was verified by Omise.")
+    )
+    active = models.BooleanField(
+        default=False, help_text=_("Whether the recipient can receive transfers.")
+    )
+    default = models.BooleanField(
+        default=False,
+        help_text=_("Whether this is the default recipient of the account."),
+    )
+
+    failure_code = models.CharField(max_length=255, blank=True)
+
+    verified_at = models.DateTimeField(blank=True, null=True)
+    activated_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self) -> str:
+        return f"Omise{self.__class__.__name__}: {self.name or self.id}"
+
+
+class Transfer(OmiseBaseModel, OmiseMetadata, OmiseDeletableModel, OmiseEventTimeline):
+    """
+    A class representing Omise Transfer object, a payout of the balance to a recipient.
+
+    Official documentation: https://www.omise.co/transfers-api
+    """
+
+    omise_class = omise.Transfer
+
+    recipient = models.ForeignKey(
+        Recipient,
+        blank=True,
+        null=True,
+        related_name="transfers",
+        on_delete=models.PROTECT,
+    )
+
+    bank_account = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text=_("The bank account of the recipient at the time of the transfer."),
+    )
+
+    amount = models.IntegerField(
+        help_text=_("Transfer amount in smallest unit of currency."),
+    )
+
+    currency = models.CharField(
+        max_length=3,
+        choices=Currency.choices,
+    )
+
+    fee = models.IntegerField(blank=True, null=True)
+    fee_vat = models.IntegerField(blank=True, null=True)
+    net = models.IntegerField(blank=True, null=True)
+    total_fee = models.IntegerField(blank=True, null=True)
+
+    sendable = models.BooleanField(
+        default=False, help_text=_("Whether the transfer can be sent.")
+    )
+    sent = models.BooleanField(
+        default=False, help_text=_("Whether the transfer was sent to the bank.")
+    )
+    paid = models.BooleanField(
+        default=False, help_text=_("Whether the transfer was paid to the recipient.")
+    )
+
+    failure_code = models.CharField(max_length=255, blank=True)
+    failure_message = models.TextField(blank=True)
+
+    sent_at = models.DateTimeField(blank=True, null=True)
+    paid_at = models.DateTimeField(blank=True, null=True)
+
+    @property
+    def human_amount(self) -> str:
+        return format_amount(amount=self.amount, currency=self.currency)
+
+    @classmethod
+    def bulk_update_or_create_from_omise_objects(
+        cls,
+        omise_objects: Iterable[omise.Base],
+        ignore_fields: Optional[List[str]] = None,
+        uids: Optional[List[Optional[uuid.UUID]]] = None,
+        defaults: Optional[Dict] = None,
+    ) -> List["Transfer"]:
+        """
+        Update existing transfers or create new transfers from Omise Transfer objects with bulk queries.
+
+        The recipients of the transfers which are not on the database yet are retrieved first.
+        See OmiseBaseModel.bulk_update_or_create_from_omise_objects.
+
+        :returns: List of Transfer in the same order as omise_objects.
+        """
+        omise_objects = list(omise_objects)
+        save_missing_related_objects(
+            model=cls, omise_objects=omise_objects, field_name="recipient"
+        )
+
+        return super().bulk_update_or_create_from_omise_objects(
+            omise_objects=omise_objects,
+            ignore_fields=ignore_fields,
+            uids=uids,
+            defaults=defaults,
+        )
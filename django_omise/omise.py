@@ -1,5 +1,88 @@
+import threading
+
+from contextlib import contextmanager
+
 import omise
 from .utils.core_utils import setting
 
+from typing import Dict, Optional, Type
+
 omise.api_secret = setting("OMISE_SECRET_KEY")
 omise.api_public = setting("OMISE_PUBLIC_KEY")
+
+_local = threading.local()
+
+
+def create(
+    omise_class: Type[omise.Base], headers: Optional[Dict[str, str]] = None, **kwargs
+) -> omise.Base:
+    """
+    Create an Omise object, sending additional headers with this request only.
+
+    The create method is called on a subclass of omise_class whose requests carry
+    the headers, so the Omise library is not changed for other requests or threads.
+
+    :param omise_class: The Omise class of the object. e.g. omise.Charge, omise.Schedule
+    :param headers optional: Dictionary of header names and values, e.g. Idempotency-Key.
+    :param kwargs: The arguments of the create method of omise_class.
+
+    :returns: An instance of omise_class.
+    """
+
+    def request(cls, *args, **request_kwargs):
+        return omise_class._request(
+            *args, headers=dict(headers or {}), **request_kwargs
+        )
+
+    request_class = type(
+        omise_class.__name__, (omise_class,), {"_request": classmethod(request)}
+    )
+
+    return request_class.create(**kwargs)
+
+
+# The Omise classes whose objects do not change once created, so they can be reused.
+CACHED_OMISE_CLASSES = (omise.Token,)
+
+
+@contextmanager
+def omise_object_cache():
+    """
+    Reuse the read-only Omise objects, e.g. tokens, fetched with retrieve() in this block.
+
+    The cache is kept per thread and is shared by nested blocks.
+    """
+    if getattr(_local, "objects", None) is not None:
+        yield
+        return
+
+    _local.objects = {}
+
+    try:
+        yield
+    finally:
+        _local.objects = None
+
+
+def retrieve(omise_class: Type[omise.Base], *ids: str) -> omise.Base:
+    """
+    Retrieve an Omise object, reusing it if it was fetched in the current omise_object_cache() block.
+
+    Only the objects of CACHED_OMISE_CLASSES are reused, other objects are always fetched.
+
+    :param omise_class: The Omise class of the object. e.g. omise.Token
+    :param ids: The arguments of the retrieve method of omise_class.
+
+    :returns: An instance of omise_class.
+    """
+    objects = getattr(_local, "objects", None)
+
+    if objects is None or omise_class not in CACHED_OMISE_CLASSES:
+        return omise_class.retrieve(*ids)
+
+    key = (omise_class, ids)
+
+    if key not in objects:
+        objects[key] = omise_class.retrieve(*ids)
+
+    return objects[key]
@@ -0,0 +1,124 @@
+from functools import lru_cache
+from types import MappingProxyType
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+from .models.choices import ChargeSourceType
+from .utils.core_utils import get_payment_methods, get_payment_methods_for_form
+
+from typing import Mapping, NamedTuple, Optional, Tuple
+
+
+class PaymentMethod(NamedTuple):
+    """
+    A payment method available on the checkout form.
+
+    :param key: The value of the payment method choice on the form.
+    :param label: The label of the payment method choice.
+    :param source_type optional: The Omise source type to charge, if the method is charged with a source.
+    :param required_fields: Form fields that must have a value when the method is selected.
+    :param error_field optional: The form field to attach the error to when a required field is missing.
+    :param error_message optional: The error message when a required field is missing.
+    :param form_fields: Form fields rendered in the section of the payment method.
+    """
+
+    key: str
+    label: str
+    source_type: Optional[str] = None
+    required_fields: Tuple[str, ...] = ()
+    error_field: Optional[str] = None
+    error_message: Optional[str] = None
+    form_fields: Tuple[str, ...] = ()
+
+
+ALL_PAYMENT_METHODS = (
+    PaymentMethod(
+        key="old_card",
+        label=_("Pay with your card"),
+        required_fields=("card",),
+        error_field="card",
+        error_message=_("You need to select at least one card"),
+        form_fields=("card",),
+    ),
+    PaymentMethod(
+        key="new_card",
+        label=_("Pay with a new card"),
+        required_fields=("omise_token",),
+        error_field="card_number",
+        error_message=_("You need to provide a new card details"),
+        form_fields=(
+            "omise_token",
+            "card_number",
+            "name_on_card",
+            "expiration_year",
+            "expiration_month",
+            "security_number",
+            "keep_card",
+        ),
+    ),
+    PaymentMethod(
+        key="internet_banking",
+        label=_("Internet banking"),
+        required_fields=("bank",),
+        error_field="bank",
+        error_message=_("You need to select at least one bank"),
+        form_fields=("bank",),
+    ),
+    PaymentMethod(
+        key="truemoney_wallet",
+        label=_("TrueMoney Wallet"),
+        source_type=ChargeSourceType.TRUEMONEY_WALLET,
+        required_fields=("phone_number",),
+        error_field="phone_number",
+        error_message=_("Mobile number is required for TrueMoney Wallet payment"),
+        form_fields=("phone_number",),
+    ),
+    PaymentMethod(
+        key=ChargeSourceType.PROMPTPAY.value,
+        label=ChargeSourceType.PROMPTPAY.label,
+        source_type=ChargeSourceType.PROMPTPAY,
+    ),
+    PaymentMethod(
+        key=ChargeSourceType.RABBIT_LINEPAY.value,
+        label=ChargeSourceType.RABBIT_LINEPAY.label,
+        source_type=ChargeSourceType.RABBIT_LINEPAY,
+    ),
+)
+
+PAYMENT_METHODS: Mapping[str, PaymentMethod] = MappingProxyType(
+    {payment_method.key: payment_method for payment_method in ALL_PAYMENT_METHODS}
+)
+
+
+@lru_cache(maxsize=None)
+def get_enabled_payment_methods(
+    payment_methods: Optional[Tuple[str, ...]] = None,
+) -> Tuple[PaymentMethod, ...]:
+    """
+    Get the payment methods enabled for the checkout form.
+
+    The result is computed once per set of payment methods. The default set, from
+    setting OMISE_PAYMENT_METHODS, is compiled when the app is ready.
+
+    :param payment_methods optional: Tuple of payment methods. Default to setting OMISE_PAYMENT_METHODS.
+
+    :returns: Tuple of PaymentMethod in the order they are displayed.
+    """
+    if payment_methods is None:
+        payment_methods = tuple(get_payment_methods())
+
+    keys = get_payment_methods_for_form(list(payment_methods))
+
+    return tuple(
+        payment_method
+        for payment_method in ALL_PAYMENT_METHODS
+        if payment_method.key in keys
+    )
+
+
+@receiver(setting_changed)
+def clear_enabled_payment_methods(setting, **kwargs):
+    if setting == "OMISE_PAYMENT_METHODS":
+        get_enabled_payment_methods.cache_clear()
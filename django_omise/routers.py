@@ -0,0 +1,246 @@
+import random
+import threading
+import time
+
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, router
+
+from .utils.core_utils import setting
+
+from typing import Dict, List, Optional
+
+_local = threading.local()
+
+APP_LABEL = "django_omise"
+
+# Bookkeeping of requests sent to Omise, always read from the primary database so a
+# retried request finds the previous attempt.
+PRIMARY_ONLY_MODELS = {"pendingcharge", "pendingschedule"}
+
+PIN_COOKIE_NAME = "omise_primary"
+
+
+def get_primary_database() -> str:
+    """
+    Get the alias of the database django_omise writes to, from setting OMISE_DATABASE.
+
+    :returns: The database alias.
+    """
+    return setting("OMISE_DATABASE", None) or DEFAULT_DB_ALIAS
+
+
+def get_replica_databases() -> List[str]:
+    """
+    Get the aliases of the read replicas of the primary database, from setting OMISE_DATABASE_REPLICAS.
+
+    :returns: List of database aliases, empty when replicas are not used.
+    """
+    return list(setting("OMISE_DATABASE_REPLICAS", None) or [])
+
+
+def has_dedicated_database() -> bool:
+    """
+    Check if django_omise models are stored in another database than the default database.
+    """
+    return get_primary_database() != DEFAULT_DB_ALIAS
+
+
+def is_routed() -> bool:
+    """
+    Check if django_omise models are routed to a dedicated database or to replicas.
+    """
+    return has_dedicated_database() or bool(get_replica_databases())
+
+
+def uses_separate_database() -> bool:
+    """
+    Check if django_omise models are stored in another database than the users.
+
+    The users are then referenced by id, and cannot be joined in queries.
+    """
+    return get_primary_database() != router.db_for_write(
+        apps.get_model(settings.AUTH_USER_MODEL)
+    )
+
+
+def allows_user_constraint(db: str) -> bool:
+    """
+    Check if the users are migrated on a database, so django_omise models stored
+    there can reference them with a foreign key constraint.
+
+    :param db: The database alias.
+    """
+    return router.allow_migrate_model(db, apps.get_model(settings.AUTH_USER_MODEL))
+
+
+def get_sticky_seconds() -> float:
+    """
+    Get the number of seconds reads stay on the primary database after a write,
+    from setting OMISE_DATABASE_STICKY_SECONDS.
+
+    :returns: The number of seconds.
+    """
+    return setting("OMISE_DATABASE_STICKY_SECONDS", 5)
+
+
+def pin_to_primary(seconds: Optional[float] = None) -> None:
+    """
+    Read from the primary database in the current thread for a number of seconds.
+
+    :param seconds optional: The number of seconds. Default to OMISE_DATABASE_STICKY_SECONDS.
+    """
+    if seconds is None:
+        seconds = get_sticky_seconds()
+
+    pinned_until = time.monotonic() + seconds
+    _local.pinned_until = max(getattr(_local, "pinned_until", 0) or 0, pinned_until)
+
+
+def record_write() -> None:
+    """
+    Record a write of django_omise models in the current thread and pin its reads to the primary database.
+    """
+    pin_to_primary()
+    _local.written = True
+
+
+def is_pinned_to_primary() -> bool:
+    """
+    Check if reads of the current thread go to the primary database.
+    """
+    if getattr(_local, "primary_blocks", 0):
+        return True
+
+    pinned_until = getattr(_local, "pinned_until", None)
+    return pinned_until is not None and time.monotonic() < pinned_until
+
+
+def reset_pinning() -> None:
+    """
+    Forget the writes of the current thread, e.g. at the start of a request.
+    """
+    _local.pinned_until = None
+    _local.written = False
+
+
+def has_written() -> bool:
+    """
+    Check if django_omise models were written in the current thread since the last reset_pinning().
+    """
+    return getattr(_local, "written", False)
+
+
+@contextmanager
+def use_primary():
+    """
+    Read django_omise models from the primary database in this block.
+
+    Can also be used as a decorator, e.g. on views which write.
+    """
+    _local.primary_blocks = getattr(_local, "primary_blocks", 0) + 1
+
+    try:
+        yield
+    finally:
+        _local.primary_blocks -= 1
+
+
+class OmiseRouter:
+    """
+    Database router of django_omise models.
+
+    With setting OMISE_DATABASE, the models are stored in a dedicated database. Only
+    django_omise and contenttypes, needed by the generic relations of events, are
+    migrated on it. The users are referenced by id and read from their own database.
+
+    With setting OMISE_DATABASE_REPLICAS, the models are read from a random replica.
+    Reads stay on the primary database for OMISE_DATABASE_STICKY_SECONDS after a
+    write of the thread, in transactions and in use_primary() blocks. Add
+    OmiseReplicaPinningMiddleware to keep the following requests of the client on
+    the primary database too.
+    """
+
+    def is_omise_model(self, model) -> bool:
+        return model._meta.app_label == APP_LABEL
+
+    def is_user_of_omise_object(self, model, hints: Dict) -> bool:
+        """
+        Check if a user is accessed from a django_omise object, e.g. customer.user.
+        """
+        instance = hints.get("instance")
+
+        return (
+            instance is not None
+            and self.is_omise_model(instance)
+            and model._meta.label == settings.AUTH_USER_MODEL
+        )
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        if not is_routed():
+            return None
+
+        if self.is_user_of_omise_object(model, hints):
+            return router.db_for_read(model)
+
+        if not self.is_omise_model(model):
+            return None
+
+        primary = get_primary_database()
+        replicas = get_replica_databases()
+
+        if (
+            not replicas
+            or model._meta.model_name in PRIMARY_ONLY_MODELS
+            or is_pinned_to_primary()
+            or connections[primary].in_atomic_block
+        ):
+            return primary
+
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        if not is_routed():
+            return None
+
+        if self.is_user_of_omise_object(model, hints):
+            return router.db_for_write(model)
+
+        if not self.is_omise_model(model):
+            return None
+
+        record_write()
+        return get_primary_database()
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        if not is_routed():
+            return None
+
+        if self.is_user_of_omise_object(
+            obj1.__class__, {"instance": obj2}
+        ) or self.is_user_of_omise_object(obj2.__class__, {"instance": obj1}):
+            return True
+
+        databases = {get_primary_database(), *get_replica_databases()}
+
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        if db in get_replica_databases():
+            return False if app_label == APP_LABEL else None
+
+        if not has_dedicated_database():
+            return None
+
+        if db == get_primary_database():
+            return app_label in [APP_LABEL, "contenttypes"]
+
+        if app_label == APP_LABEL:
+            return False
+
+        return None
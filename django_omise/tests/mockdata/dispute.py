@@ -0,0 +1,43 @@
+dispute_response = """{
+  "object": "dispute",
+  "id": "dspt_test_5s1k1g5opc8lvwva73y",
+  "livemode": false,
+  "location": "/disputes/dspt_test_5s1k1g5opc8lvwva73y",
+  "amount": 100000,
+  "currency": "THB",
+  "funding_amount": 100000,
+  "funding_currency": "THB",
+  "status": "open",
+  "reason_code": "goods_or_services_not_provided",
+  "reason_message": "Services not provided or Merchandise not received",
+  "message": null,
+  "admin_message": null,
+  "charge": "chrg_test_5s1kvbjga85m8a8rwu2",
+  "documents": {
+    "object": "list",
+    "data": [],
+    "limit": 20,
+    "offset": 0,
+    "total": 0,
+    "location": "/disputes/dspt_test_5s1k1g5opc8lvwva73y/documents",
+    "order": "chronological",
+    "from": "1970-01-01T00:00:00Z",
+    "to": "2022-05-24T09:00:00Z"
+  },
+  "metadata": {},
+  "closed_at": null,
+  "created_at": "2022-05-24T08:47:11Z"
+}"""
+
+dispute_event_response = (
+    """{
+  "object": "event",
+  "id": "evnt_test_dispute",
+  "livemode": false,
+  "location": "/events/evnt_test_dispute",
+  "key": "dispute.create",
+  "created_at": "2022-05-24T08:47:11Z",
+  "data": %s
+}"""
+    % dispute_response
+)
@@ -0,0 +1,25 @@
+transaction_response = """{
+  "object": "transaction",
+  "id": "trxn_test_5s1k1g5opc8lvwva73y",
+  "livemode": false,
+  "location": "/transactions/trxn_test_5s1k1g5opc8lvwva73y",
+  "amount": 96350,
+  "currency": "THB",
+  "direction": "credit",
+  "key": "charge.payment",
+  "origin": "chrg_test_5s1jz157366mu6wr0ng",
+  "transferable_at": "2022-05-31T08:47:11Z",
+  "created_at": "2022-05-24T08:47:11Z"
+}"""
+
+balance_response = """{
+  "object": "balance",
+  "livemode": false,
+  "location": "/balance",
+  "currency": "THB",
+  "total": 1596350,
+  "transferable": 1500000,
+  "reserve": 0,
+  "on_hold": 96350,
+  "created_at": "2022-05-24T09:00:00Z"
+}"""
@@ -33,3 +33,75 @@ token_response = """{
   },
   "created_at": "2022-06-05T09:44:09Z"
 }"""
+
+new_card_token_response = """{
+  "object": "token",
+  "id": "test_new_card_token_id",
+  "livemode": false,
+  "location": "https://vault.omise.co/tokens/tokn_test_5s1k1g5opc8lvwva73y",
+  "used": false,
+  "charge_status": "unknown",
+  "card": {
+    "object": "card",
+    "id": "card_test_5s1k1g5nl9it6p44new",
+    "livemode": false,
+    "location": null,
+    "deleted": false,
+    "street1": null,
+    "street2": null,
+    "city": "Bangkok",
+    "state": null,
+    "phone_number": null,
+    "postal_code": "10320",
+    "country": "us",
+    "financing": "credit",
+    "bank": "JPMORGAN CHASE BANK N.A.",
+    "brand": "Visa",
+    "fingerprint": "Xv3c7bW2k0Z9mS1qLr8TfYp4NdHgJe6uQa5iOw0yKlE=",
+    "first_digits": null,
+    "last_digits": "4242",
+    "name": "JOHN DOE",
+    "expiration_month": 6,
+    "expiration_year": 2024,
+    "security_code_check": true,
+    "tokenization_method": null,
+    "created_at": "2022-06-05T09:44:09Z"
+  },
+  "created_at": "2022-06-05T09:44:09Z"
+}"""
+
+renewed_card_token_response = """{
+  "object": "token",
+  "id": "test_renewed_card_token_id",
+  "livemode": false,
+  "location": "https://vault.omise.co/tokens/tokn_test_5s1k1g5opc8lvwva73y",
+  "used": false,
+  "charge_status": "unknown",
+  "card": {
+    "object": "card",
+    "id": "card_test_5s1k1g5nl9it6p44ren",
+    "livemode": false,
+    "location": null,
+    "deleted": false,
+    "street1": null,
+    "street2": null,
+    "city": "Bangkok",
+    "state": null,
+    "phone_number": null,
+    "postal_code": "10320",
+    "country": "us",
+    "financing": "credit",
+    "bank": "JPMORGAN CHASE BANK N.A.",
+    "brand": "Visa",
+    "fingerprint": "7jGh9VWw5Dvm/8Zrh9wY/e3VXhdWyg8k8xD1+8sHGhU=",
+    "first_digits": null,
+    "last_digits": "4242",
+    "name": "JOHN DOE",
+    "expiration_month": 6,
+    "expiration_year": 2029,
+    "security_code_check": true,
+    "tokenization_method": null,
+    "created_at": "2022-06-05T09:44:09Z"
+  },
+  "created_at": "2022-06-05T09:44:09Z"
+}"""
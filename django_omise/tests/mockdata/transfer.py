@@ -0,0 +1,73 @@
+recipient_response = """{
+  "object": "recipient",
+  "id": "recp_test_5s1k1g5opc8lvwva73y",
+  "livemode": false,
+  "location": "/recipients/recp_test_5s1k1g5opc8lvwva73y",
+  "verified": true,
+  "active": true,
+  "name": "Somchai Prasert",
+  "email": "somchai@example.com",
+  "description": null,
+  "type": "individual",
+  "tax_id": null,
+  "bank_account": {
+    "object": "bank_account",
+    "brand": "bbl",
+    "last_digits": "7890",
+    "name": "SOMCHAI PRASERT",
+    "created_at": "2022-05-20T08:47:11Z"
+  },
+  "failure_code": null,
+  "metadata": {},
+  "default": false,
+  "deleted": false,
+  "verified_at": "2022-05-20T08:47:11Z",
+  "activated_at": "2022-05-20T08:47:11Z",
+  "created_at": "2022-05-20T08:47:11Z"
+}"""
+
+transfer_response = """{
+  "object": "transfer",
+  "id": "trsf_test_5s1k1g5opc8lvwva73y",
+  "livemode": false,
+  "location": "/transfers/trsf_test_5s1k1g5opc8lvwva73y",
+  "recipient": "recp_test_5s1k1g5opc8lvwva73y",
+  "bank_account": {
+    "object": "bank_account",
+    "brand": "bbl",
+    "last_digits": "7890",
+    "name": "SOMCHAI PRASERT",
+    "created_at": "2022-05-20T08:47:11Z"
+  },
+  "sendable": true,
+  "sent": false,
+  "paid": false,
+  "amount": 500000,
+  "currency": "THB",
+  "fee": 3000,
+  "fee_vat": 210,
+  "net": 496790,
+  "total_fee": 3210,
+  "failure_code": null,
+  "failure_message": null,
+  "transaction": null,
+  "schedule": null,
+  "metadata": {},
+  "deleted": false,
+  "sent_at": null,
+  "paid_at": null,
+  "created_at": "2022-05-24T08:47:11Z"
+}"""
+
+transfer_event_response = (
+    """{
+  "object": "event",
+  "id": "evnt_test_transfer",
+  "livemode": false,
+  "location": "/events/evnt_test_transfer",
+  "key": "transfer.create",
+  "created_at": "2022-05-24T08:47:11Z",
+  "data": %s
+}"""
+    % transfer_response
+)
@@ -0,0 +1,117 @@
+import json
+import requests
+
+from django.contrib.messages import get_messages
+
+from django_omise.models.core import Card, Charge, Refund
+from django_omise.models.choices import ChargeStatus
+
+from django_omise.tests.base import ClientAndUserBaseTestCase, OmiseBaseTestCase
+
+from unittest import mock
+
+from .mockdata.charge import base_charge_response, partially_refunded_response
+from .test_utils import MockResponse
+
+
+def mocked_reload_request(*args, **kwargs):
+    request_url = args[0]
+
+    if "/refunds/" in request_url:
+        charge = json.loads(partially_refunded_response)
+        refund = charge["refunds"]["data"][0]
+        refund["voided"] = True
+        return MockResponse(json.dumps(refund), 200)
+
+    if "/cards/" in request_url:
+        charge = json.loads(base_charge_response)
+        card = charge["card"]
+        card["last_digits"] = "1111"
+        return MockResponse(json.dumps(card), 200)
+
+    charge_id = request_url.rsplit("/", 1)[-1]
+
+    if charge_id == "chrg_test_timeout":
+        raise requests.exceptions.Timeout
+
+    charge = json.loads(base_charge_response)
+    charge["id"] = charge_id
+    return MockResponse(json.dumps(charge), 200)
+
+
+class AdminReloadFromOmiseTestCase(ClientAndUserBaseTestCase, OmiseBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.customer = self.create_customer(id="cust_test_5s1jz157366mu6wr0ng")
+
+        for charge_id in ["chrg_test_1", "chrg_test_2", "chrg_test_timeout"]:
+            self.create_charge(id=charge_id, status=ChargeStatus.PENDING, amount=1)
+
+    @mock.patch("requests.get", side_effect=mocked_reload_request)
+    def test_reload_charges_from_omise(self, mock_get):
+        response = self.client.post(
+            "/admin/django_omise/charge/",
+            {
+                "action": "reload_from_omise",
+                "_selected_action": [
+                    "chrg_test_1",
+                    "chrg_test_2",
+                    "chrg_test_timeout",
+                ],
+            },
+            follow=True,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_get.call_count, 3)
+
+        for charge_id in ["chrg_test_1", "chrg_test_2"]:
+            charge = Charge.objects.get(id=charge_id)
+            self.assertEqual(charge.status, ChargeStatus.SUCCESSFUL)
+            self.assertEqual(charge.amount, 100000)
+
+        self.assertEqual(
+            Charge.objects.get(id="chrg_test_timeout").status, ChargeStatus.PENDING
+        )
+
+        messages = [str(message) for message in get_messages(response.wsgi_request)]
+        self.assertEqual(len(messages), 1)
+        self.assertIn("Reloaded 2 charges from Omise.", messages[0])
+        self.assertIn("Failed to reload 1: chrg_test_timeout", messages[0])
+
+    @mock.patch("requests.get", side_effect=mocked_reload_request)
+    def test_reload_cards_through_customer(self, mock_get):
+        card = self.create_card(
+            id="card_test_5s1jzgw7oda499o8k0y",
+            customer=self.customer,
+            last_digits="4242",
+        )
+
+        reloaded_cards, errors = Card.bulk_reload_from_omise(objects=[card])
+
+        self.assertEqual(errors, {})
+        self.assertEqual(reloaded_cards[0].last_digits, "1111")
+        self.assertEqual(
+            mock_get.call_args[0][0],
+            "https://api.omise.co/customers/cust_test_5s1jz157366mu6wr0ng/cards/card_test_5s1jzgw7oda499o8k0y",
+        )
+
+    @mock.patch("requests.get", side_effect=mocked_reload_request)
+    def test_reload_refunds_through_charge(self, mock_get):
+        charge = self.create_charge(id="test_charge_id")
+        refund = Refund.objects.create(
+            id="rfnd_test_5s1kvj7i16l6lrqco9c",
+            livemode=False,
+            charge=charge,
+            amount=50000,
+            currency="THB",
+            voided=False,
+        )
+
+        refund = refund.reload_from_omise()
+
+        self.assertTrue(refund.voided)
+        self.assertEqual(
+            mock_get.call_args[0][0],
+            "https://api.omise.co/charges/test_charge_id/refunds/rfnd_test_5s1kvj7i16l6lrqco9c",
+        )
@@ -0,0 +1,100 @@
+from django.core.cache import cache
+from django.db import connection
+
+from django_omise.admin import EstimatedCountPaginator
+from django_omise.models.core import Charge
+
+from django_omise.tests.base import ClientAndUserBaseTestCase, OmiseBaseTestCase
+
+from unittest import mock
+
+
+class EstimatedCountPaginatorTestCase(ClientAndUserBaseTestCase, OmiseBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+        for i in range(3):
+            self.create_charge(id=f"test_charge_id_{i}")
+
+    def test_exact_count_by_default(self):
+        paginator = EstimatedCountPaginator(Charge.objects.order_by("id"), 100)
+
+        self.assertEqual(paginator.count, 3)
+        self.assertFalse(paginator.estimated)
+
+    def test_exact_count_cached_without_estimate(self):
+        with self.settings(OMISE_ADMIN_ESTIMATED_COUNT_THRESHOLD=1000):
+            self.assertEqual(
+                EstimatedCountPaginator(Charge.objects.order_by("id"), 100).count, 3
+            )
+            self.create_charge(id="test_charge_id_3")
+
+            # Only the planner estimate is queried, on PostgreSQL.
+            with self.assertNumQueries(int(connection.vendor == "postgresql")):
+                paginator = EstimatedCountPaginator(Charge.objects.order_by("id"), 100)
+                self.assertEqual(paginator.count, 3)
+
+            self.assertFalse(paginator.estimated)
+            self.assertEqual(
+                EstimatedCountPaginator(
+                    Charge.objects.filter(id="test_charge_id_3").order_by("id"), 100
+                ).count,
+                1,
+            )
+
+    def test_exact_count_without_cache(self):
+        with self.settings(
+            OMISE_ADMIN_ESTIMATED_COUNT_THRESHOLD=1000,
+            OMISE_ADMIN_COUNT_CACHE_TIMEOUT=0,
+        ):
+            EstimatedCountPaginator(Charge.objects.order_by("id"), 100).count
+            self.create_charge(id="test_charge_id_3")
+
+            self.assertEqual(
+                EstimatedCountPaginator(Charge.objects.order_by("id"), 100).count, 4
+            )
+
+    @mock.patch.object(EstimatedCountPaginator, "get_estimated_count", return_value=999)
+    def test_exact_count_below_threshold(self, mock_get_estimated_count):
+        with self.settings(OMISE_ADMIN_ESTIMATED_COUNT_THRESHOLD=1000):
+            paginator = EstimatedCountPaginator(Charge.objects.order_by("id"), 100)
+
+            self.assertEqual(paginator.count, 3)
+            self.assertFalse(paginator.estimated)
+
+    @mock.patch.object(
+        EstimatedCountPaginator, "get_estimated_count", return_value=5000000
+    )
+    def test_changelist_uses_estimated_count(self, mock_get_estimated_count):
+        with self.settings(OMISE_ADMIN_ESTIMATED_COUNT_THRESHOLD=1000):
+            response = self.client.get("/admin/django_omise/charge/")
+
+        changelist = response.context["cl"]
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(changelist.result_count, 5000000)
+        self.assertFalse(changelist.can_show_all)
+        self.assertFalse(changelist.show_full_result_count)
+        self.assertIsNone(changelist.full_result_count)
+
+    @mock.patch.object(
+        EstimatedCountPaginator, "get_estimated_count", return_value=5000000
+    )
+    def test_changelist_show_all_disabled(self, mock_get_estimated_count):
+        with self.settings(
+            OMISE_ADMIN_ESTIMATED_COUNT_THRESHOLD=100,
+            OMISE_ADMIN_COUNT_CACHE_TIMEOUT=0,
+        ):
+            response = self.client.get("/admin/django_omise/charge/?all=")
+
+        changelist = response.context["cl"]
+        self.assertFalse(changelist.show_all)
+        self.assertEqual(len(changelist.result_list), 3)
+
+    def test_changelist_exact_count_by_default(self):
+        response = self.client.get("/admin/django_omise/charge/?livemode__exact=0")
+
+        changelist = response.context["cl"]
+        self.assertEqual(changelist.result_count, 3)
+        self.assertEqual(changelist.full_result_count, 3)
+        self.assertTrue(changelist.can_show_all)
@@ -1,19 +1,30 @@
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from django_omise.models.schedule import Schedule
-from django_omise.models.core import Customer
+from django_omise.models.core import Charge, Customer, Refund
 from django_omise.omise import omise
 
+from django_omise.tests.mockdata.customer import customer_response
+from django_omise.tests.mockdata.schedule import base_schedule_response
 from django_omise.tests.mockdata.charge import (
     base_charge_response,
     base_charge_with_metadata_response,
+    charge_with_schedule_response,
+    fully_refunded_response,
 )
 
 from django_omise.tests.test_utils import (
+    MockResponse,
     mocked_base_charge_request,
     mocked_set_charge_metadata_request,
     mocked_schedule_without_next_occurrences_on_request,
 )
 
 from django_omise.tests.base import OmiseBaseTestCase
+from django_omise.utils.core_utils import update_or_create_from_omise_object
 
 from unittest import mock
 
@@ -89,3 +100,115 @@ class BaseModelTestCase(OmiseBaseTestCase):
     def test_str_method(self):
         charge = self.create_charge()
         self.assertIsInstance(str(charge), str)
+
+    def get_update_queries(self, omise_object):
+        with CaptureQueriesContext(connection) as queries:
+            Customer.update_or_create_from_omise_object(omise_object=omise_object)
+
+        return [query["sql"] for query in queries if query["sql"].startswith("UPDATE")]
+
+    def test_update_or_create_skips_unchanged_objects(self):
+        omise_customer = omise.Customer.from_data(json.loads(customer_response))
+        Customer.update_or_create_from_omise_object(omise_object=omise_customer)
+        date_updated = Customer.objects.get().date_updated
+
+        self.assertEqual(self.get_update_queries(omise_customer), [])
+        self.assertEqual(Customer.objects.get().date_updated, date_updated)
+
+    def test_update_or_create_updates_changed_fields(self):
+        data = json.loads(customer_response)
+        Customer.update_or_create_from_omise_object(
+            omise_object=omise.Customer.from_data(data)
+        )
+
+        [query] = self.get_update_queries(
+            omise.Customer.from_data({**data, "email": "jane.doe@example.com"})
+        )
+
+        self.assertIn('"email"', query)
+        self.assertIn('"date_updated"', query)
+        self.assertNotIn('"description"', query)
+        self.assertEqual(Customer.objects.get().email, "jane.doe@example.com")
+
+    def test_unchanged_charge_not_written(self):
+        self.create_customer(id="cust_test_5s1jz157366mu6wr0ng")
+        omise_charge = omise.Charge.from_data(json.loads(base_charge_response))
+        update_or_create_from_omise_object(omise_object=omise_charge)
+
+        with CaptureQueriesContext(connection) as queries:
+            update_or_create_from_omise_object(omise_object=omise_charge)
+
+        self.assertFalse(
+            any(
+                query["sql"].startswith(("UPDATE", "INSERT", "DELETE"))
+                for query in queries
+            )
+        )
+
+    def test_get_changed_fields(self):
+        customer = self.create_customer(id="cust_test_1", email="a@example.com")
+
+        self.assertEqual(
+            Customer.get_changed_fields(
+                instance=customer,
+                values={"email": "a@example.com", "livemode": "False", "user_id": None},
+            ),
+            [],
+        )
+        self.assertEqual(
+            Customer.get_changed_fields(
+                instance=customer, values={"email": "b@example.com"}
+            ),
+            ["email"],
+        )
+
+    @mock.patch("requests.get")
+    def test_bulk_update_or_create_saves_nested_lists_in_bulk(self, mock_get):
+        self.create_customer(id="cust_test_5s1jz157366mu6wr0ng")
+        omise_charge = omise.Charge.from_data(json.loads(fully_refunded_response))
+
+        with CaptureQueriesContext(connection) as queries:
+            Charge.bulk_update_or_create_from_omise_objects(
+                omise_objects=[omise_charge]
+            )
+
+        mock_get.assert_not_called()
+        self.assertEqual(
+            sorted(
+                Refund.objects.filter(charge_id="test_charge_id").values_list(
+                    "id", flat=True
+                )
+            ),
+            ["rfnd_test_5s1kvj7i16l6lrqco9c", "rfnd_test_5s1kvp13mtlmgaftih6"],
+        )
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in queries
+                    if query["sql"].startswith('INSERT INTO "django_omise_refund"')
+                ]
+            ),
+            1,
+        )
+
+    @mock.patch("requests.get")
+    def test_bulk_update_or_create_saves_missing_schedules(self, mock_get):
+        self.create_customer(id="test_customer_id")
+        self.create_card(id="test_card_id")
+        schedule = json.loads(base_schedule_response)
+        schedule["id"] = "schd_test_5s67suxlifb0r6vzqar"
+        mock_get.return_value = MockResponse(json.dumps(schedule), 200)
+        omise_charge = omise.Charge.from_data(json.loads(charge_with_schedule_response))
+
+        [charge] = Charge.bulk_update_or_create_from_omise_objects(
+            omise_objects=[omise_charge]
+        )
+        Charge.bulk_update_or_create_from_omise_objects(omise_objects=[omise_charge])
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(charge.schedule_id, "schd_test_5s67suxlifb0r6vzqar")
+        self.assertEqual(
+            Charge.objects.get(id=charge.id).schedule_id,
+            "schd_test_5s67suxlifb0r6vzqar",
+        )
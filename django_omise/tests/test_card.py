@@ -53,3 +53,25 @@ class CardTestCase(TestCase):
         self.assertEqual(Card.objects.count() - 1, Card.objects.live().count())
 
         self.assertEqual(all_cards_count, Card.objects.count())
+
+    @mock.patch("requests.delete", side_effect=mocked_delete_card_request)
+    def test_delete_card_single_api_call(self, mocked_request):
+        customer, created = Customer.get_or_create(user=self.user)
+        customer.sync_cards()
+        card = customer.cards.live().first()
+
+        with mock.patch(
+            "requests.get", side_effect=mocked_requests_get
+        ) as mocked_get_request, self.assertNumQueries(1):
+            card.delete()
+
+        mocked_get_request.assert_not_called()
+        mocked_request.assert_called_once()
+
+        args, kwargs = mocked_request.call_args
+        self.assertTrue(
+            args[0].endswith(f"/customers/{customer.id}/cards/{card.id}")
+        )
+
+        card.refresh_from_db()
+        self.assertTrue(card.deleted)
@@ -1,8 +1,12 @@
+import json
+
+from django.db import connection
 from django.test import TestCase, RequestFactory
+from django.test.utils import CaptureQueriesContext
 
 from django.contrib.auth import get_user_model
 
-from django_omise.models.core import Customer, Card, Charge
+from django_omise.models.core import Customer, Card, Charge, PendingCharge
 from django_omise.models.choices import Currency
 from django_omise.omise import omise
 
@@ -10,6 +14,8 @@ from django_omise.utils.core_utils import update_or_create_from_omise_object
 
 from unittest import mock
 
+import requests
+
 from .test_utils import (
     mocked_fully_refunded_charge_request,
     mocked_requests_post,
@@ -19,10 +25,24 @@ from .test_utils import (
     mocked_fully_refunded_charge_request,
     mocked_base_charge_request,
     mocked_jpy_charge,
+    MockResponse,
 )
+from .mockdata.charge import base_charge_response
 
 User = get_user_model()
 
+
+def mocked_charge_many_request(*args, **kwargs):
+    idempotency_key = kwargs["headers"]["Idempotency-Key"]
+
+    if idempotency_key == "order-timeout":
+        raise requests.exceptions.Timeout
+
+    charge = json.loads(base_charge_response)
+    charge["id"] = f"chrg_test_{idempotency_key}"
+    return MockResponse(json.dumps(charge), 200)
+
+
 # Create your tests here.
 class ChargeTestCase(TestCase):
     def setUp(self):
@@ -238,3 +258,170 @@ class ChargeTestCase(TestCase):
                     currency=Currency.THB,
                     card=self.customer.cards.live().first(),
                 )
+
+    @mock.patch("requests.post", side_effect=mocked_charge_with_card_request)
+    def test_charge_sends_idempotency_key(self, mock_post_request):
+        charge = Charge.charge(
+            amount=100000,
+            currency=Currency.THB,
+            card=self.customer.cards.live().first(),
+        )
+
+        args, kwargs = mock_post_request.call_args
+        self.assertEqual(kwargs["headers"]["Idempotency-Key"], str(charge.uid))
+        self.assertTrue(PendingCharge.objects.filter(uid=charge.uid).exists())
+
+    def test_charge_retry_with_idempotency_key_after_timeout(self):
+        with mock.patch(
+            "requests.post", side_effect=requests.exceptions.Timeout
+        ), self.assertRaises(requests.exceptions.Timeout):
+            Charge.charge(
+                amount=100000,
+                currency=Currency.THB,
+                card=self.customer.cards.live().first(),
+                idempotency_key="order-1",
+            )
+
+        pending_charge = PendingCharge.objects.get(idempotency_key="order-1")
+        self.assertFalse(Charge.objects.filter(uid=pending_charge.uid).exists())
+
+        with mock.patch(
+            "requests.post", side_effect=mocked_charge_with_card_request
+        ) as mock_post_request:
+            charge = Charge.charge(
+                amount=100000,
+                currency=Currency.THB,
+                card=self.customer.cards.live().first(),
+                idempotency_key="order-1",
+            )
+            retried_charge = Charge.charge(
+                amount=100000,
+                currency=Currency.THB,
+                card=self.customer.cards.live().first(),
+                idempotency_key="order-1",
+            )
+
+        mock_post_request.assert_called_once()
+        args, kwargs = mock_post_request.call_args
+        self.assertEqual(kwargs["headers"]["Idempotency-Key"], "order-1")
+        self.assertEqual(charge.uid, pending_charge.uid)
+        self.assertEqual(retried_charge, charge)
+        self.assertEqual(PendingCharge.objects.count(), 1)
+
+    @mock.patch("requests.post", side_effect=mocked_charge_many_request)
+    def test_charge_many(self, mock_post_request):
+        card = Card.objects.get(id="card_test_5s1jzgw7oda499o8k0y")
+
+        results = Charge.charge_many(
+            charges=[
+                dict(
+                    amount=100000,
+                    currency=Currency.THB,
+                    card=card,
+                    idempotency_key=f"order-{i}",
+                )
+                for i in range(3)
+            ]
+        )
+
+        self.assertEqual(mock_post_request.call_count, 3)
+        self.assertEqual(
+            [result.idempotency_key for result in results],
+            ["order-0", "order-1", "order-2"],
+        )
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(
+            [result.charge.id for result in results],
+            ["chrg_test_order-0", "chrg_test_order-1", "chrg_test_order-2"],
+        )
+
+        for result in results:
+            charge = Charge.objects.get(id=result.charge.id)
+            pending_charge = PendingCharge.objects.get(
+                idempotency_key=result.idempotency_key
+            )
+            self.assertEqual(charge.uid, pending_charge.uid)
+            self.assertEqual(charge.card, card)
+            self.assertEqual(charge.customer, self.customer)
+
+    @mock.patch("requests.post", side_effect=mocked_charge_many_request)
+    def test_charge_many_reports_failures(self, mock_post_request):
+        card = self.customer.cards.live().first()
+
+        results = Charge.charge_many(
+            charges=[
+                dict(amount=100000, currency=Currency.THB, idempotency_key="order-0"),
+                dict(
+                    amount=100000,
+                    currency=Currency.THB,
+                    card=card,
+                    idempotency_key="order-timeout",
+                ),
+                dict(
+                    amount=100000,
+                    currency=Currency.THB,
+                    card=card,
+                    idempotency_key="order-2",
+                ),
+            ],
+            max_workers=2,
+        )
+
+        self.assertEqual([result.ok for result in results], [False, False, True])
+        self.assertIsInstance(results[0].error, ValueError)
+        self.assertIsInstance(results[1].error, requests.exceptions.Timeout)
+        self.assertIsNone(results[1].charge)
+        self.assertEqual(results[2].charge.id, "chrg_test_order-2")
+
+        self.assertFalse(
+            PendingCharge.objects.filter(idempotency_key="order-0").exists()
+        )
+        self.assertTrue(
+            PendingCharge.objects.filter(idempotency_key="order-timeout").exists()
+        )
+        self.assertEqual(Charge.objects.count(), 1)
+
+    @mock.patch("requests.post", side_effect=mocked_charge_many_request)
+    def test_charge_many_retry_skips_saved_charges(self, mock_post_request):
+        card = self.customer.cards.live().first()
+        charges = [
+            dict(
+                amount=100000,
+                currency=Currency.THB,
+                card=card,
+                idempotency_key=f"order-{i}",
+            )
+            for i in range(2)
+        ]
+
+        results = Charge.charge_many(charges=charges)
+        retried_results = Charge.charge_many(charges=charges)
+
+        self.assertEqual(mock_post_request.call_count, 2)
+        self.assertEqual(
+            [result.charge for result in retried_results],
+            [result.charge for result in results],
+        )
+        self.assertEqual(PendingCharge.objects.count(), 2)
+
+    @mock.patch("requests.post", side_effect=mocked_charge_many_request)
+    def test_charge_many_queries_do_not_grow_with_charges(self, mock_post_request):
+        card = self.customer.cards.live().first()
+
+        def charge_many(count, prefix):
+            with CaptureQueriesContext(connection) as context:
+                Charge.charge_many(
+                    charges=(
+                        dict(
+                            amount=100000,
+                            currency=Currency.THB,
+                            card=card,
+                            idempotency_key=f"{prefix}-{i}",
+                        )
+                        for i in range(count)
+                    ),
+                    batch_size=20,
+                )
+            return len(context.captured_queries)
+
+        self.assertEqual(charge_many(2, "small"), charge_many(20, "large"))
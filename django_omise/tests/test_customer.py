@@ -1,12 +1,20 @@
+import datetime
+import uuid
+
+from django.db import connection, models
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from django.contrib.auth import get_user_model
 
 from django_omise.models.core import Customer
+from django_omise.omise import omise, omise_object_cache, retrieve
 from django_omise.models.schedule import Schedule, ChargeSchedule
 from django_omise.models.choices import Currency, SchedulePeriod, ScheduleStatus
+from django_omise.utils.core_utils import update_or_create_from_omise_object
 
 
+from django.core.cache import cache
 from django.utils import timezone
 
 from unittest import mock
@@ -40,6 +48,7 @@ class CustomerTestCase(TestCase):
 
     def tearDown(self):
         mock.patch.stopall()
+        cache.clear()
 
     def test_create_customer(self):
         self.assertTrue(self.created)
@@ -50,6 +59,100 @@ class CustomerTestCase(TestCase):
         self.assertEqual(self.customer.user, self.user)
         self.assertEqual(self.customer.id, self.customer.get_omise_object().id)
 
+    def test_get_or_create_memoized_on_user(self):
+        with self.assertNumQueries(0):
+            customer, created = Customer.get_or_create(user=self.user)
+
+        self.assertFalse(created)
+        self.assertEqual(customer, self.customer)
+
+    def test_get_or_create_cached_across_user_instances(self):
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Customer.get_or_create(user=user)
+
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.assertNumQueries(0):
+            customer, created = Customer.get_or_create(user=user)
+
+        self.assertEqual(customer, self.customer)
+
+    def test_customer_save_clears_cache(self):
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Customer.get_or_create(user=user)
+
+        self.customer.save()
+
+        self.assertIsNone(
+            cache.get(
+                Customer.get_cache_key(
+                    user_id=self.user.pk, livemode=self.customer.livemode
+                )
+            )
+        )
+
+    def test_customer_update_clears_cache(self):
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Customer.get_or_create(user=user)
+
+        Customer.objects.filter(pk=self.customer.pk).update(deleted=True)
+
+        self.assertIsNone(
+            cache.get(
+                Customer.get_cache_key(
+                    user_id=self.user.pk, livemode=self.customer.livemode
+                )
+            )
+        )
+
+    def test_customer_bulk_update_clears_cache(self):
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Customer.get_or_create(user=user)
+
+        Customer.bulk_update_or_create_from_omise_objects(
+            omise_objects=[self.customer.get_omise_object()],
+            defaults={"description": "Updated"},
+        )
+
+        self.assertIsNone(
+            cache.get(
+                Customer.get_cache_key(
+                    user_id=self.user.pk, livemode=self.customer.livemode
+                )
+            )
+        )
+
+    def test_get_or_create_concurrent_creation(self):
+        user = User.objects.create_user(
+            username="test_user2", email="test_user2@email.com"
+        )
+        omise_customer = mock.Mock(id="cust_test_duplicate", livemode=False)
+
+        def create_concurrently(**kwargs):
+            Customer.objects.create(
+                id="cust_test_concurrent", user=user, livemode=False
+            )
+            return omise_customer
+
+        with mock.patch(
+            "django_omise.models.core.omise.Customer.create",
+            side_effect=create_concurrently,
+        ):
+            customer, created = Customer.get_or_create(user=user)
+
+        self.assertFalse(created)
+        self.assertEqual(customer.id, "cust_test_concurrent")
+        omise_customer.destroy.assert_called_once()
+        self.assertEqual(Customer.objects.filter(user=user).count(), 1)
+
     def test_create_customer_wrong_mode(self):
         with self.settings(OMISE_LIVE_MODE=True), self.assertRaises(ValueError):
             customer, created = Customer.get_or_create(user=self.user)
@@ -59,6 +162,65 @@ class CustomerTestCase(TestCase):
 
         self.assertEqual(self.customer.cards.count(), len(omise_customer.cards))
 
+    def test_sync_customer_cards_marks_removed_cards_deleted(self):
+        removed_card = self.customer.cards.first()
+        removed_card.id = "card_test_removed"
+        removed_card.uid = uuid.uuid4()
+        removed_card.save()
+
+        self.customer.sync_cards()
+
+        removed_card.refresh_from_db()
+        self.assertTrue(removed_card.deleted)
+        self.assertEqual(self.customer.cards.live().count(), 2)
+
+    def test_sync_customer_cards_updates_changed_cards(self):
+        omise_customer = self.customer.get_omise_object()
+        omise_customer.cards._attributes["data"][0]["name"] = "Updated Name"
+
+        self.customer.sync_cards(omise_customer=omise_customer)
+
+        card = self.customer.cards.get(id=omise_customer.cards[0].id)
+        self.assertEqual(card.name, "Updated Name")
+        self.assertEqual(card.customer, self.customer)
+
+    def test_sync_customer_cards_without_changes_does_not_write(self):
+        omise_customer = self.customer.get_omise_object()
+
+        with CaptureQueriesContext(connection) as context:
+            self.customer.sync_cards(omise_customer=omise_customer)
+
+        queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if not query["sql"].startswith(("SAVEPOINT", "RELEASE SAVEPOINT"))
+        ]
+
+        self.assertEqual(len(queries), 2)
+        self.assertTrue(queries[0].startswith("SELECT"))
+        self.assertIn('SET "deleted"', queries[1])
+
+    def test_deleted_user_removed_from_customer(self):
+        field = Customer._meta.get_field("user")
+        self.assertTrue(field.db_constraint)
+        self.assertEqual(field.remote_field.on_delete, models.DO_NOTHING)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.user.delete()
+
+        self.customer.refresh_from_db()
+        self.assertIsNone(self.customer.user_id)
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in queries
+                    if query["sql"].startswith('UPDATE "django_omise_customer"')
+                ]
+            ),
+            1,
+        )
+
     def test_customer_str_with_user(self):
         self.assertIn(str(self.user), str(self.customer))
 
@@ -69,9 +231,85 @@ class CustomerTestCase(TestCase):
     @mock.patch("requests.patch", side_effect=mocked_add_card_request)
     def test_add_card_to_customer(self, mocked_request):
         initial_card_count = self.customer.cards.count()
-        self.customer.add_card(token="test_token_id")
+        self.customer.add_card(token="test_new_card_token_id")
         self.assertEqual(initial_card_count + 1, self.customer.cards.count())
 
+    @mock.patch("requests.patch", side_effect=mocked_add_card_request)
+    def test_add_card_with_token_object(self, mocked_request):
+        token = omise.Token.retrieve("test_new_card_token_id")
+
+        with mock.patch(
+            "requests.get", side_effect=mocked_requests_get
+        ) as mocked_get_request:
+            card = self.customer.add_card(token=token)
+
+        mocked_get_request.assert_not_called()
+        mocked_request.assert_called_once()
+        self.assertEqual(card.id, token.card.id)
+        self.assertEqual(card.customer, self.customer)
+        self.assertFalse(card.deleted)
+
+    @mock.patch("requests.patch", side_effect=mocked_add_card_request)
+    def test_add_card_reuses_retrieved_token(self, mocked_request):
+        with mock.patch(
+            "requests.get", side_effect=mocked_requests_get
+        ) as mocked_get_request, omise_object_cache():
+            token = retrieve(omise.Token, "test_new_card_token_id")
+            card = self.customer.add_card(token="test_new_card_token_id")
+
+        mocked_get_request.assert_called_once()
+        self.assertEqual(card.id, token.card.id)
+
+    def test_reload_from_omise_bypasses_object_cache(self):
+        with mock.patch(
+            "requests.get", side_effect=mocked_requests_get
+        ) as mocked_get_request, omise_object_cache():
+            self.customer.reload_from_omise()
+            self.customer.reload_from_omise()
+
+        self.assertEqual(
+            len(
+                [
+                    call
+                    for call in mocked_get_request.call_args_list
+                    if call[0][0].endswith(f"/customers/{self.customer.id}")
+                ]
+            ),
+            2,
+        )
+
+    @mock.patch("requests.patch", side_effect=mocked_add_card_request)
+    def test_add_duplicate_card_returns_existing_card(self, mocked_request):
+        token = omise.Token.retrieve("test_token_id")
+
+        card = self.customer.add_card(token=token)
+
+        mocked_request.assert_not_called()
+        self.assertEqual(card.fingerprint, token.card.fingerprint)
+        self.assertEqual(card.customer, self.customer)
+        self.assertNotEqual(card.id, token.card.id)
+
+    @mock.patch("requests.patch", side_effect=mocked_add_card_request)
+    def test_add_renewed_card(self, mocked_request):
+        token = omise.Token.retrieve("test_renewed_card_token_id")
+
+        card = self.customer.add_card(token=token)
+
+        card.refresh_from_db()
+
+        mocked_request.assert_called_once()
+        self.assertEqual(card.id, token.card.id)
+        self.assertEqual(card.expiration_year, "2029")
+
+    @mock.patch("requests.patch", side_effect=mocked_add_card_request)
+    def test_add_duplicate_card_allowed(self, mocked_request):
+        token = omise.Token.retrieve("test_token_id")
+
+        card = self.customer.add_card(token=token, allow_duplicate=True)
+
+        mocked_request.assert_called_once()
+        self.assertEqual(card.id, token.card.id)
+
     @mock.patch("requests.delete", side_effect=mocked_delete_card_request)
     def test_delete_card(self, mock_request):
         live_cards_count = self.customer.cards.live().count()
@@ -133,6 +371,106 @@ class CustomerTestCase(TestCase):
 
         self.assertIn(schedule, self.customer.schedules.all())
 
+    def create_schedule(self, card_id, next_occurrences_on=None):
+        charge_schedule = ChargeSchedule.objects.create(
+            id="test_charge_schedule_id",
+            amount=100000,
+            currency=Currency.THB,
+            livemode=False,
+            card_id=card_id,
+            customer=self.customer,
+            default_card=True,
+        )
+
+        return Schedule.objects.create(
+            id="test_schedule_id",
+            livemode=False,
+            active=True,
+            charge=charge_schedule,
+            end_on=timezone.now().date(),
+            every=1,
+            period=SchedulePeriod.DAY,
+            start_on=timezone.now().date(),
+            status=ScheduleStatus.RUNNING,
+            next_occurrences_on=next_occurrences_on or [],
+        )
+
+    @mock.patch(
+        "django_omise.models.schedule.Schedule.update_or_create_from_omise_object"
+    )
+    @mock.patch("django_omise.models.schedule.omise.Schedule.retrieve")
+    def test_customer_sync_skips_up_to_date_schedules(
+        self, mock_schedule_retrieve, mock_update_or_create_method
+    ):
+        self.create_schedule(
+            card_id="card_test_5s1jzgw7oda499o8k0y",
+            next_occurrences_on=[str(timezone.localdate())],
+        )
+
+        update_or_create_from_omise_object(
+            omise_object=self.customer.get_omise_object()
+        )
+
+        mock_schedule_retrieve.assert_not_called()
+
+    @mock.patch(
+        "django_omise.models.schedule.Schedule.update_or_create_from_omise_object"
+    )
+    @mock.patch("django_omise.models.schedule.omise.Schedule.retrieve")
+    def test_customer_sync_reloads_schedules_of_changed_default_card(
+        self, mock_schedule_retrieve, mock_update_or_create_method
+    ):
+        schedule = self.create_schedule(card_id="card_test_5s1jzsw6iy9nw4gzmx3")
+        Customer.objects.filter(pk=self.customer.pk).update(date_updated=timezone.now())
+
+        update_or_create_from_omise_object(
+            omise_object=self.customer.get_omise_object()
+        )
+
+        mock_schedule_retrieve.assert_called_once_with(schedule.id)
+        mock_update_or_create_method.assert_called_once()
+
+    @mock.patch(
+        "django_omise.models.schedule.Schedule.update_or_create_from_omise_object"
+    )
+    @mock.patch("django_omise.models.schedule.omise.Schedule.retrieve")
+    def test_customer_sync_reloads_schedules_of_other_card_once(
+        self, mock_schedule_retrieve, mock_update_or_create_method
+    ):
+        schedule = self.create_schedule(card_id="card_test_5s1jzsw6iy9nw4gzmx3")
+        Customer.objects.filter(pk=self.customer.pk).update(date_updated=timezone.now())
+
+        for _ in range(2):
+            update_or_create_from_omise_object(
+                omise_object=self.customer.get_omise_object()
+            )
+
+        mock_schedule_retrieve.assert_called_once_with(schedule.id)
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.get_stale_schedules(), [])
+
+    @mock.patch(
+        "django_omise.models.schedule.Schedule.update_or_create_from_omise_object"
+    )
+    @mock.patch("django_omise.models.schedule.omise.Schedule.retrieve")
+    def test_customer_sync_reloads_schedules_with_passed_occurrence(
+        self, mock_schedule_retrieve, mock_update_or_create_method
+    ):
+        schedule = self.create_schedule(
+            card_id="card_test_5s1jzgw7oda499o8k0y",
+            next_occurrences_on=[
+                str(timezone.localdate() - datetime.timedelta(days=1))
+            ],
+        )
+
+        self.assertEqual(self.customer.get_stale_schedules(), [schedule])
+
+        update_or_create_from_omise_object(
+            omise_object=self.customer.get_omise_object()
+        )
+
+        mock_schedule_retrieve.assert_called_once_with(schedule.id)
+
     @mock.patch(
         "django_omise.models.schedule.Schedule.update_or_create_from_omise_object"
     )
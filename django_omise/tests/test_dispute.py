@@ -0,0 +1,130 @@
+import json
+
+from django.urls import reverse
+
+from django_omise.models.core import Charge, Customer
+from django_omise.models.dispute import Dispute
+from django_omise.models.event import Event
+from django_omise.omise import omise
+
+from django_omise.tests.base import ClientAndUserBaseTestCase, OmiseBaseTestCase
+from django_omise.tests.test_utils import MockResponse
+
+from .mockdata.charge import base_charge_response
+from .mockdata.dispute import dispute_event_response, dispute_response
+
+from unittest import mock
+
+
+def mocked_dispute_requests(*args, **kwargs):
+    request_url = args[0]
+
+    if "/events/" in request_url:
+        return MockResponse(dispute_event_response, 200)
+
+    if "/disputes/" in request_url:
+        return MockResponse(dispute_response, 200)
+
+    if "/charges/" in request_url:
+        return MockResponse(base_charge_response, 200)
+
+    return MockResponse(None, 404)
+
+
+class DisputeTestCase(ClientAndUserBaseTestCase, OmiseBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_customer(id="cust_test_5s1jz157366mu6wr0ng")
+
+    @mock.patch("requests.get", side_effect=mocked_dispute_requests)
+    def test_webhook_saves_dispute_and_charge(self, mock_get):
+        response = self.client.post(
+            reverse("django_omise:webhook"),
+            dispute_event_response,
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        dispute = Dispute.objects.get()
+        self.assertEqual(dispute.status, "open")
+        self.assertEqual(dispute.charge_id, "chrg_test_5s1kvbjga85m8a8rwu2")
+        self.assertEqual(dispute.reason_code, "goods_or_services_not_provided")
+        self.assertEqual(dispute.human_amount, "1,000.00")
+        self.assertEqual(
+            list(dispute.events.values_list("id", flat=True)), ["evnt_test_dispute"]
+        )
+        self.assertEqual(Charge.objects.get().disputes.get(), dispute)
+        self.assertEqual(
+            [args[0].split("/")[-2] for args, kwargs in mock_get.call_args_list],
+            ["events", "disputes", "charges"],
+        )
+
+    @mock.patch("requests.get", side_effect=mocked_dispute_requests)
+    def test_bulk_update_or_create_fetches_missing_charges_once(self, mock_get):
+        omise_disputes = [
+            omise.Dispute.from_data(json.loads(dispute_response)),
+            omise.Dispute.from_data(
+                {**json.loads(dispute_response), "id": "dspt_test_2", "status": "won"}
+            ),
+        ]
+
+        disputes = Dispute.bulk_update_or_create_from_omise_objects(omise_disputes)
+
+        self.assertEqual([dispute.status for dispute in disputes], ["open", "won"])
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertTrue(
+            Charge.objects.filter(id="chrg_test_5s1kvbjga85m8a8rwu2").exists()
+        )
+
+        Dispute.bulk_update_or_create_from_omise_objects(omise_disputes)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @mock.patch("requests.get")
+    def test_webhook_of_object_without_model_not_reloaded(self, mock_get):
+        event = {
+            "object": "event",
+            "id": "evnt_test_link",
+            "livemode": False,
+            "location": "/events/evnt_test_link",
+            "key": "link.create",
+            "created_at": "2022-05-24T08:47:11Z",
+            "data": {
+                "object": "link",
+                "id": "link_test_1",
+                "livemode": False,
+                "location": "/links/link_test_1",
+            },
+        }
+        mock_get.return_value = MockResponse(json.dumps(event), 200)
+
+        response = self.client.post(
+            reverse("django_omise:webhook"),
+            json.dumps(event),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertTrue(Event.objects.filter(id="evnt_test_link").exists())
+
+    @mock.patch("requests.get", side_effect=mocked_dispute_requests)
+    def test_admin_search_by_customer_email(self, mock_get):
+        Dispute.bulk_update_or_create_from_omise_objects(
+            [omise.Dispute.from_data(json.loads(dispute_response))]
+        )
+        customer = Customer.objects.get()
+        customer.user = self.user
+        customer.save()
+
+        response = self.client.get(
+            reverse("admin:django_omise_dispute_changelist"), {"q": "admin@test.com"}
+        )
+        self.assertContains(response, "dspt_test_5s1k1g5opc8lvwva73y")
+
+        response = self.client.get(
+            reverse(
+                "admin:django_omise_charge_change",
+                args=["chrg_test_5s1kvbjga85m8a8rwu2"],
+            )
+        )
+        self.assertContains(response, "goods_or_services_not_provided")
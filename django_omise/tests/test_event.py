@@ -1,8 +1,12 @@
+from django.contrib.contenttypes.models import ContentType
+
+from django_omise.models.core import Charge
+from django_omise.models.event import Event
 from django_omise.models.schedule import Schedule
 from django_omise.omise import omise
 from django_omise.utils.core_utils import update_or_create_from_omise_object
 
-from django_omise.tests.base import OmiseBaseTestCase
+from django_omise.tests.base import ClientAndUserBaseTestCase, OmiseBaseTestCase
 
 from unittest import mock
 
@@ -20,3 +24,73 @@ class EventTestCase(OmiseBaseTestCase):
         event_data = event.data
         schedule = update_or_create_from_omise_object(omise_object=event_data)
         self.assertTrue(Schedule.objects.filter(id=schedule.id).exists())
+
+
+class EventTimelineTestCase(ClientAndUserBaseTestCase, OmiseBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.customer = self.create_customer(id="test_customer_id")
+        self.charges = [
+            self.create_charge(id=f"test_charge_id_{i}", customer=self.customer)
+            for i in range(3)
+        ]
+
+        for i, charge in enumerate(self.charges):
+            for key in ["charge.create", "charge.complete"]:
+                self.create_event(f"test_event_{key}_{i}", key, charge)
+
+        self.create_event("test_event_customer", "customer.create", self.customer)
+
+    def create_event(self, event_id, event_type, event_object):
+        event = Event(id=event_id, livemode=False, event_type=event_type)
+        event.event_object = event_object
+        event.save()
+        return event
+
+    def test_events(self):
+        self.assertEqual(
+            {event.event_type for event in self.charges[0].events.all()},
+            {"charge.create", "charge.complete"},
+        )
+        self.assertEqual(
+            [event.id for event in self.customer.events.all()],
+            ["test_event_customer"],
+        )
+
+    def test_prefetch_events(self):
+        ContentType.objects.get_for_model(Charge)
+
+        with self.assertNumQueries(2):
+            charges = list(Charge.objects.order_by("id").prefetch_related("events"))
+
+            for i, charge in enumerate(charges):
+                self.assertEqual(
+                    sorted(event.id for event in charge.events.all()),
+                    [
+                        f"test_event_charge.complete_{i}",
+                        f"test_event_charge.create_{i}",
+                    ],
+                )
+
+    def test_filter_events_by_object(self):
+        self.assertEqual(
+            Event.objects.filter(charge__customer=self.customer).count(), 6
+        )
+        self.assertEqual(Event.objects.filter(customer=self.customer).count(), 1)
+
+    def test_events_kept_when_object_deleted(self):
+        self.charges[0].delete()
+
+        self.assertEqual(Event.objects.count(), 7)
+
+    def test_admin_timeline(self):
+        response = self.client.get(
+            f"/admin/django_omise/charge/{self.charges[0].pk}/change/"
+        )
+        self.assertContains(response, "test_event_charge.complete_0")
+        self.assertNotContains(response, "test_event_charge.complete_1")
+
+        response = self.client.get(
+            f"/admin/django_omise/customer/{self.customer.pk}/change/"
+        )
+        self.assertContains(response, "test_event_customer")
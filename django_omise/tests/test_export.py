@@ -0,0 +1,134 @@
+import csv
+import datetime
+import json
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from django_omise.models.choices import ChargeStatus
+from django_omise.models.core import Charge, Customer
+from django_omise.utils.export_utils import (
+    filter_export_queryset,
+    get_export_fields,
+    iter_csv,
+    iter_jsonl,
+)
+
+from django_omise.tests.base import ClientAndUserBaseTestCase, OmiseBaseTestCase
+
+
+class ExportTestCase(ClientAndUserBaseTestCase, OmiseBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_charge(id="chrg_test_1", metadata={"order": 1})
+        self.create_charge(id="chrg_test_2", status=ChargeStatus.FAILED)
+        self.create_charge(id="chrg_test_3")
+
+        Charge.objects.filter(id="chrg_test_3").update(
+            date_created=timezone.now() - datetime.timedelta(days=400)
+        )
+
+    def test_export_fields_exclude_raw_data(self):
+        fields = get_export_fields(Charge)
+
+        self.assertIn("id", fields)
+        self.assertIn("customer_id", fields)
+        self.assertNotIn("data", fields)
+
+    def test_iter_csv(self):
+        rows = list(csv.DictReader(iter_csv(Charge.objects.order_by("id"))))
+
+        self.assertEqual(
+            [row["id"] for row in rows], ["chrg_test_1", "chrg_test_2", "chrg_test_3"]
+        )
+        self.assertEqual(json.loads(rows[0]["metadata"]), {"order": 1})
+
+    def test_iter_jsonl_fetches_in_chunks(self):
+        lines = iter_jsonl(Charge.objects.order_by("id"), chunk_size=1)
+
+        with self.assertNumQueries(1):
+            rows = [json.loads(line) for line in lines]
+
+        self.assertEqual(rows[1]["id"], "chrg_test_2")
+        self.assertEqual(rows[1]["status"], ChargeStatus.FAILED)
+
+    def test_filter_export_queryset(self):
+        queryset = filter_export_queryset(
+            Charge.objects.all(),
+            date_from=timezone.localdate() - datetime.timedelta(days=30),
+            statuses=[ChargeStatus.SUCCESSFUL],
+        )
+
+        self.assertEqual(list(queryset.values_list("id", flat=True)), ["chrg_test_1"])
+
+        with self.assertRaises(ValueError):
+            filter_export_queryset(Customer.objects.all(), statuses=["deleted"])
+
+    def test_filter_export_queryset_by_local_day(self):
+        day = datetime.date(2022, 5, 24)
+        start = timezone.make_aware(datetime.datetime(2022, 5, 24))
+        Charge.objects.filter(id="chrg_test_1").update(date_created=start)
+        Charge.objects.filter(id="chrg_test_2").update(
+            date_created=start + datetime.timedelta(days=1, microseconds=-1)
+        )
+        Charge.objects.filter(id="chrg_test_3").update(
+            date_created=start + datetime.timedelta(days=1)
+        )
+
+        queryset = filter_export_queryset(
+            Charge.objects.order_by("id"), date_from=day, date_to=day
+        )
+
+        self.assertEqual(
+            list(queryset.values_list("id", flat=True)), ["chrg_test_1", "chrg_test_2"]
+        )
+
+    def test_export_command(self):
+        stdout = StringIO()
+
+        call_command(
+            "export_omise_objects",
+            "charge",
+            "--format=jsonl",
+            f"--date-from={timezone.localdate() - datetime.timedelta(days=30)}",
+            "--status=successful",
+            "--status=failed",
+            stdout=stdout,
+        )
+
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(
+            sorted(row["id"] for row in rows), ["chrg_test_1", "chrg_test_2"]
+        )
+
+    def test_export_command_rejects_status_filter(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "export_omise_objects",
+                "customer",
+                "--status=deleted",
+                stdout=StringIO(),
+            )
+
+    def test_export_admin_action(self):
+        response = self.client.post(
+            "/admin/django_omise/charge/",
+            {
+                "action": "export_as_csv",
+                "_selected_action": ["chrg_test_1", "chrg_test_2"],
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn("attachment;", response["Content-Disposition"])
+
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual(
+            sorted(row["id"] for row in rows), ["chrg_test_1", "chrg_test_2"]
+        )
@@ -0,0 +1,161 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+from django_omise.forms import CheckoutForm
+from django_omise.models.core import Customer
+from django_omise.models.choices import ChargeSourceType, Currency
+from django_omise.payment_methods import get_enabled_payment_methods
+
+from django_omise.tests.base import OmiseBaseTestCase
+
+User = get_user_model()
+
+
+# Create your tests here.
+class CheckoutFormTestCase(OmiseBaseTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="test_user1", email="test_user1@email.com"
+        )
+        self.customer = self.create_customer(user=self.user)
+        self.card = self.create_card(
+            id="test_card_id", customer=self.customer, last_digits="4242"
+        )
+        self.deleted_card = self.create_card(
+            id="test_deleted_card_id",
+            customer=self.customer,
+            last_digits="1111",
+            deleted=True,
+        )
+
+    def test_get_or_create_with_live_cards_single_query(self):
+        with self.assertNumQueries(1):
+            customer, created = Customer.get_or_create_with_live_cards(user=self.user)
+
+        self.assertFalse(created)
+        self.assertEqual(customer, self.customer)
+        self.assertEqual(customer.live_cards, [self.card])
+
+    def test_get_or_create_with_live_cards_without_cards(self):
+        self.card.deleted = True
+        self.card.save()
+
+        customer, created = Customer.get_or_create_with_live_cards(user=self.user)
+
+        self.assertFalse(created)
+        self.assertEqual(customer, self.customer)
+        self.assertEqual(customer.live_cards, [])
+
+    def test_checkout_form_reuses_loaded_cards(self):
+        customer, created = Customer.get_or_create_with_live_cards(user=self.user)
+
+        with self.assertNumQueries(0):
+            form = CheckoutForm(
+                user=self.user,
+                amount=100000,
+                currency=Currency.THB,
+                omise_customer=customer,
+                data={"payment_method": "old_card", "card": self.card.id},
+            )
+            rendered_card_field = str(form["card"])
+            self.assertTrue(form.is_valid())
+
+        self.assertIn(self.card.id, rendered_card_field)
+        self.assertNotIn(self.deleted_card.id, rendered_card_field)
+        self.assertEqual(form.fields["card"].initial, self.card)
+        self.assertEqual(form.cleaned_data["card"], self.card)
+
+    def test_checkout_form_loads_customer_without_omise_customer(self):
+        with self.assertNumQueries(1):
+            form = CheckoutForm(
+                user=self.user,
+                amount=100000,
+                currency=Currency.THB,
+            )
+
+        self.assertEqual(form.omise_customer, self.customer)
+        self.assertEqual(form.fields["payment_method"].initial, "old_card")
+
+    def test_checkout_form_rejects_deleted_card(self):
+        customer, created = Customer.get_or_create_with_live_cards(user=self.user)
+
+        form = CheckoutForm(
+            user=self.user,
+            amount=100000,
+            currency=Currency.THB,
+            omise_customer=customer,
+            data={"payment_method": "old_card", "card": self.deleted_card.id},
+        )
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("card", form.errors)
+
+    def test_checkout_form_does_not_mutate_payment_methods_setting(self):
+        payment_methods = ["card", "promptpay"]
+
+        with self.settings(OMISE_PAYMENT_METHODS=payment_methods):
+            for i in range(3):
+                CheckoutForm(user=None, amount=100000, currency=Currency.THB)
+
+            self.assertEqual(settings.OMISE_PAYMENT_METHODS, ["card", "promptpay"])
+
+    def test_checkout_form_payment_method_choices(self):
+        with self.settings(OMISE_PAYMENT_METHODS=["card", "truemoney_wallet"]):
+            form = CheckoutForm(user=None, amount=100000, currency=Currency.THB)
+
+        self.assertEqual(
+            [key for key, label in form.fields["payment_method"].choices],
+            ["new_card", "truemoney_wallet"],
+        )
+
+    def test_enabled_payment_methods_cleared_on_setting_change(self):
+        with self.settings(OMISE_PAYMENT_METHODS=["promptpay"]):
+            self.assertEqual(
+                [
+                    payment_method.key
+                    for payment_method in get_enabled_payment_methods()
+                ],
+                [ChargeSourceType.PROMPTPAY],
+            )
+
+        self.assertIn(
+            "new_card",
+            [payment_method.key for payment_method in get_enabled_payment_methods()],
+        )
+
+    def test_checkout_form_source_charge_type_details(self):
+        with self.settings(OMISE_PAYMENT_METHODS=["card", "truemoney_wallet"]):
+            form = CheckoutForm(
+                user=None,
+                amount=100000,
+                currency=Currency.THB,
+                data={
+                    "payment_method": "truemoney_wallet",
+                    "phone_number": "0812345678",
+                },
+            )
+
+            self.assertTrue(form.is_valid())
+
+        self.assertEqual(
+            form.get_charge_type_details(),
+            {
+                "source": {
+                    "type": ChargeSourceType.TRUEMONEY_WALLET,
+                    "phone_number": "0812345678",
+                }
+            },
+        )
+
+    def test_checkout_form_required_field_error(self):
+        with self.settings(OMISE_PAYMENT_METHODS=["card", "truemoney_wallet"]):
+            form = CheckoutForm(
+                user=None,
+                amount=100000,
+                currency=Currency.THB,
+                data={"payment_method": "truemoney_wallet"},
+            )
+
+            self.assertFalse(form.is_valid())
+
+        self.assertIn("phone_number", form.errors)
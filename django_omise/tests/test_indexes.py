@@ -0,0 +1,102 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Value
+
+from django_omise.models.choices import ChargeStatus
+from django_omise.models.core import Card, Charge, Customer
+from django_omise.models.event import Event
+from django_omise.models.schedule import Schedule
+
+from django_omise.tests.base import OmiseBaseTestCase
+
+User = get_user_model()
+
+
+class QueryIndexTestCase(OmiseBaseTestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="test_user1", email="test_user1@email.com"
+        )
+        self.customer = self.create_customer(user=self.user)
+        self.create_card(customer=self.customer)
+        self.create_charge()
+
+        if connection.vendor == "postgresql":
+            # Small test tables are scanned sequentially unless disabled.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertUsesIndex(self, queryset, *index_names):
+        plan = queryset.explain()
+        self.assertTrue(
+            any(index_name in plan for index_name in index_names),
+            f"None of {index_names} used in {plan}",
+        )
+
+    def test_charge_changelist_uses_index(self):
+        self.assertUsesIndex(
+            Charge.objects.order_by("-date_created")[:100], "omise_charge_created"
+        )
+
+    def test_charge_status_filter_uses_index(self):
+        self.assertUsesIndex(
+            Charge.objects.filter(status=ChargeStatus.SUCCESSFUL).order_by(
+                "-date_created"
+            )[:100],
+            "omise_charge_status_created",
+        )
+
+    def test_event_type_filter_uses_index(self):
+        events = Event.objects.filter(event_type="charge.create")
+        self.assertUsesIndex(
+            events.order_by("-date_created")[:100], "omise_event_type_created"
+        )
+
+    def test_default_ordering_uses_index(self):
+        self.assertUsesIndex(Card.objects.all()[:100], "omise_card_created")
+        self.assertUsesIndex(Customer.objects.all()[:100], "omise_customer_created")
+
+    def test_customer_lookup_uses_index(self):
+        # The user is referenced without a database constraint, and its own
+        # index serves the lookup as well.
+        user_index = connection.schema_editor()._create_index_name(
+            Customer._meta.db_table, ["user_id"]
+        )
+
+        self.assertUsesIndex(
+            Customer.objects.filter(user=self.user, livemode=False, deleted=False),
+            "django_omise_unique_live_customer_per_user",
+            user_index,
+        )
+
+    def test_live_cards_use_index(self):
+        self.assertUsesIndex(self.customer.cards.live(), "omise_card_live_customer")
+
+    def test_active_schedules_use_index(self):
+        self.assertUsesIndex(
+            Schedule.objects.live()
+            .filter(
+                active=True,
+                start_on__lte=datetime.date(2022, 7, 1),
+                end_on__gte=datetime.date(2022, 6, 1),
+            )
+            .order_by("start_on", "pk"),
+            "omise_schedule_live_active",
+        )
+
+    def test_livemode_filter_uses_index(self):
+        livemode = False
+
+        if connection.vendor != "postgresql":
+            # PostgreSQL uses the index for NOT livemode, SQLite only for a comparison.
+            livemode = Value(False)
+
+        self.assertUsesIndex(
+            Charge.objects.filter(livemode=livemode).order_by("-date_created")[:100],
+            "omise_charge_live",
+        )
+        self.assertUsesIndex(
+            Event.objects.filter(livemode=livemode)[:100], "omise_event_live"
+        )
@@ -2,7 +2,7 @@ from django.test import TestCase
 from django.utils import timezone
 
 
-from django_omise.models.core import Customer
+from django_omise.models.core import Card, Customer
 from django_omise.models.schedule import Schedule
 
 # Create your tests here.
@@ -57,3 +57,50 @@ class ManagerTestCase(TestCase):
         self.schedule.save()
         self.assertFalse(Schedule.objects.live().filter(id=self.schedule.id).exists())
         self.assertTrue(Schedule.objects.deleted().filter(id=self.schedule.id).exists())
+
+    def test_card_find_duplicates(self):
+        other_customer = Customer.objects.create(
+            id="test_other_customer_id", livemode=False
+        )
+
+        card = Card.objects.create(
+            id="test_card_id",
+            livemode=False,
+            customer=self.customer,
+            fingerprint="test_fingerprint",
+            expiration_month="6",
+            expiration_year="2024",
+        )
+        other_card = Card.objects.create(
+            id="test_other_card_id",
+            livemode=False,
+            customer=other_customer,
+            fingerprint="test_fingerprint",
+            expiration_month="6",
+            expiration_year="2029",
+        )
+        Card.objects.create(
+            id="test_deleted_card_id",
+            livemode=False,
+            customer=self.customer,
+            fingerprint="test_fingerprint",
+            deleted=True,
+        )
+
+        self.assertCountEqual(
+            Card.objects.find_duplicates(fingerprint="test_fingerprint"),
+            [card, other_card],
+        )
+        self.assertCountEqual(
+            Card.objects.find_duplicates(
+                fingerprint="test_fingerprint", customer=self.customer
+            ),
+            [card],
+        )
+        self.assertCountEqual(
+            Card.objects.find_duplicates(
+                fingerprint="test_fingerprint", expiration_month=6, expiration_year=2029
+            ),
+            [other_card],
+        )
+        self.assertFalse(Card.objects.find_duplicates(fingerprint="").exists())
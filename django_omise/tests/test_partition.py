@@ -0,0 +1,381 @@
+import datetime
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection, transaction
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.test import TestCase
+from django.utils import timezone
+
+from django_omise.management.commands.partition_omise_tables import Command
+from django_omise.models.core import Charge, Refund
+from django_omise.models.dispute import Dispute
+from django_omise.models.event import Event
+from django_omise.utils.partition_utils import (
+    add_months,
+    get_convert_sql,
+    get_create_partition_sql,
+    get_detach_partition_sql,
+    get_partition_name,
+    get_partitioned_model,
+    get_referencing_constraints,
+    is_partitioned,
+    iter_months,
+)
+
+from django_omise.tests.base import OmiseBaseTestCase
+from django_omise.tests.test_report import omise_charge
+
+from unittest import mock, skipUnless
+
+# SQLite creates foreign keys with the tables, unlike PostgreSQL.
+postgresql_foreign_keys = mock.patch.object(
+    connection.SchemaEditorClass,
+    "sql_create_fk",
+    BaseDatabaseSchemaEditor.sql_create_fk,
+)
+
+
+class PartitionUtilsTestCase(TestCase):
+    def test_months(self):
+        self.assertEqual(
+            add_months(datetime.date(2023, 11, 15), 3), datetime.date(2024, 2, 1)
+        )
+        self.assertEqual(
+            add_months(datetime.date(2024, 1, 1), -1), datetime.date(2023, 12, 1)
+        )
+        self.assertEqual(
+            list(iter_months(datetime.date(2023, 12, 31), datetime.date(2024, 2, 1))),
+            [
+                datetime.date(2023, 12, 1),
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 2, 1),
+            ],
+        )
+
+    def test_partitioned_models(self):
+        self.assertEqual(get_partitioned_model("charge"), Charge)
+        self.assertEqual(get_partitioned_model("event"), Event)
+
+        with self.assertRaises(ValueError):
+            get_partitioned_model("customer")
+
+    def test_create_partition_sql(self):
+        self.assertEqual(
+            get_partition_name("django_omise_charge", datetime.date(2024, 1, 1)),
+            "django_omise_charge_p202401",
+        )
+        self.assertEqual(
+            get_create_partition_sql(connection, Charge, datetime.date(2024, 1, 1)),
+            [
+                'CREATE TABLE "django_omise_charge_p202401" PARTITION OF "django_omise_charge" '
+                "FOR VALUES FROM ('2024-01-01T00:00:00+07:00') TO ('2024-02-01T00:00:00+07:00')"
+            ],
+        )
+
+    def test_create_partition_sql_moves_default_rows(self):
+        statements = get_create_partition_sql(
+            connection, Event, datetime.date(2023, 12, 1), move_rows=True
+        )
+
+        self.assertEqual(len(statements), 5)
+        self.assertIn(
+            'INSERT INTO "django_omise_event_p202312" SELECT * FROM "django_omise_event_default"',
+            statements[1],
+        )
+        self.assertIn('DELETE FROM "django_omise_event_default"', statements[2])
+        self.assertIn(
+            "ATTACH PARTITION \"django_omise_event_p202312\" FOR VALUES FROM ('2023-12-01T00:00:00+07:00') TO ('2024-01-01T00:00:00+07:00')",
+            statements[3],
+        )
+        self.assertEqual(
+            statements[4],
+            'INSERT INTO "django_omise_event_ids" SELECT "id" FROM "django_omise_event_p202312"',
+        )
+
+    def test_detach_partition_sql(self):
+        self.assertEqual(
+            get_detach_partition_sql(
+                connection, Event, datetime.date(2023, 1, 1), drop=True
+            ),
+            [
+                'ALTER TABLE "django_omise_event" DETACH PARTITION "django_omise_event_p202301"',
+                'DROP TABLE "django_omise_event_p202301"',
+            ],
+        )
+
+    @postgresql_foreign_keys
+    @mock.patch(
+        "django_omise.utils.partition_utils.get_referencing_constraints",
+        return_value=[("django_omise_refund", "refund_charge_fk", "charge_id")],
+    )
+    def test_convert_sql(self, mock_get_referencing_constraints):
+        statements = get_convert_sql(
+            connection, Charge, [datetime.date(2024, 1, 1), datetime.date(2024, 2, 1)]
+        )
+
+        self.assertEqual(
+            statements[:4],
+            [
+                'ALTER TABLE "django_omise_refund" DROP CONSTRAINT "refund_charge_fk"',
+                'ALTER TABLE "django_omise_charge" RENAME TO "django_omise_charge_unpartitioned"',
+                'CREATE TABLE "django_omise_charge" (LIKE "django_omise_charge_unpartitioned" '
+                'INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE ("date_created")',
+                'CREATE TABLE "django_omise_charge_default" PARTITION OF "django_omise_charge" DEFAULT',
+            ],
+        )
+        self.assertIn(
+            'INSERT INTO "django_omise_charge" SELECT * FROM "django_omise_charge_unpartitioned"',
+            statements,
+        )
+        self.assertIn(
+            'ALTER TABLE "django_omise_charge" ADD CONSTRAINT "django_omise_charge_pkey" '
+            'PRIMARY KEY ("id", "date_created")',
+            statements,
+        )
+        self.assertTrue(
+            any(
+                'UNIQUE ("uid", "date_created")' in statement
+                for statement in statements
+            )
+        )
+        self.assertTrue(
+            any(
+                "FOREIGN KEY" in statement and '"customer_id"' in statement
+                for statement in statements
+            )
+        )
+        self.assertTrue(
+            any("omise_charge_status_created" in statement for statement in statements)
+        )
+        self.assertIn(
+            'CREATE TABLE "django_omise_charge_ids" ("id" varchar(255) PRIMARY KEY)',
+            statements,
+        )
+        self.assertIn(
+            'INSERT INTO "django_omise_charge_ids" SELECT "id" FROM "django_omise_charge"',
+            statements,
+        )
+        self.assertTrue(
+            any(
+                statement.startswith('CREATE TRIGGER "django_omise_charge_ids"')
+                for statement in statements
+            )
+        )
+        self.assertEqual(
+            statements[-1],
+            'ALTER TABLE "django_omise_refund" ADD CONSTRAINT "refund_charge_fk" '
+            'FOREIGN KEY ("charge_id") REFERENCES "django_omise_charge_ids" ("id")'
+            + connection.ops.deferrable_sql(),
+        )
+
+
+@mock.patch(
+    "django_omise.management.commands.partition_omise_tables.timezone.localdate",
+    return_value=datetime.date(2024, 1, 20),
+)
+class PartitionCommandTestCase(TestCase):
+    def get_statements(self, **options):
+        return Command().get_statements(
+            Event,
+            "default",
+            {
+                "convert": False,
+                "months_ahead": 2,
+                "detach_before": None,
+                "drop": False,
+                **options,
+            },
+        )
+
+    def test_requires_postgresql(self, mock_localdate):
+        with self.assertRaises(CommandError):
+            call_command("partition_omise_tables", stdout=StringIO())
+
+    @mock.patch(
+        "django_omise.management.commands.partition_omise_tables.has_default_rows",
+        side_effect=lambda connection, model, month: month.month == 3,
+    )
+    @mock.patch(
+        "django_omise.management.commands.partition_omise_tables.get_partition_months",
+        return_value=[
+            datetime.date(2023, 11, 1),
+            datetime.date(2023, 12, 1),
+            datetime.date(2024, 1, 1),
+        ],
+    )
+    @mock.patch(
+        "django_omise.management.commands.partition_omise_tables.is_partitioned",
+        return_value=True,
+    )
+    def test_create_upcoming_and_detach_old_partitions(
+        self,
+        mock_is_partitioned,
+        mock_get_partition_months,
+        mock_has_default_rows,
+        mock_localdate,
+    ):
+        statements = self.get_statements(detach_before=datetime.date(2024, 1, 15))
+
+        self.assertEqual(
+            statements[0],
+            'CREATE TABLE "django_omise_event_p202402" PARTITION OF "django_omise_event" '
+            "FOR VALUES FROM ('2024-02-01T00:00:00+07:00') TO ('2024-03-01T00:00:00+07:00')",
+        )
+        self.assertEqual(len(statements), 1 + 5 + 2)
+        self.assertIn("ATTACH PARTITION", statements[4])
+        self.assertEqual(
+            statements[6:],
+            [
+                'ALTER TABLE "django_omise_event" DETACH PARTITION "django_omise_event_p202311"',
+                'ALTER TABLE "django_omise_event" DETACH PARTITION "django_omise_event_p202312"',
+            ],
+        )
+
+    @postgresql_foreign_keys
+    @mock.patch(
+        "django_omise.management.commands.partition_omise_tables.is_partitioned",
+        return_value=False,
+    )
+    def test_convert_required(self, mock_is_partitioned, mock_localdate):
+        with self.assertRaises(CommandError):
+            self.get_statements()
+
+        with mock.patch(
+            "django_omise.utils.partition_utils.get_referencing_constraints",
+            return_value=[],
+        ):
+            statements = self.get_statements(convert=True)
+
+        self.assertIn("django_omise_event_p202401", statements[3])
+        self.assertIn("django_omise_event_p202403", statements[5])
+
+    @mock.patch(
+        "django_omise.management.commands.partition_omise_tables.get_referencing_constraints",
+        return_value=[("django_omise_refund", "refund_charge_fk", "charge_id")],
+    )
+    def test_convert_warning(self, mock_get_referencing_constraints, mock_localdate):
+        stdout = StringIO()
+        Command(stdout=stdout).confirm_convert(
+            connection, Charge, {"dry_run": True, "interactive": True}
+        )
+
+        self.assertEqual(
+            stdout.getvalue(),
+            "-- Converting django_omise_charge changes its primary key to "
+            "(id, date_created) and makes its unique columns unique with date_created. "
+            "Its ids stay unique in django_omise_charge_ids, which the foreign key "
+            "constraints referencing it (refund_charge_fk of django_omise_refund) "
+            "reference instead.\n",
+        )
+
+        with mock.patch("builtins.input", return_value="no"):
+            with self.assertRaises(CommandError):
+                Command(stdout=StringIO()).confirm_convert(
+                    connection, Charge, {"dry_run": False, "interactive": True}
+                )
+
+
+@skipUnless(connection.vendor == "postgresql", "Partitioning requires PostgreSQL")
+class PartitionPostgreSQLTestCase(OmiseBaseTestCase):
+    def convert(self, table="charge"):
+        stdout = StringIO()
+        call_command(
+            "partition_omise_tables",
+            "--convert",
+            "--no-input",
+            f"--table={table}",
+            stdout=stdout,
+        )
+        return stdout.getvalue()
+
+    def get_foreign_keys(self, table):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+
+        return [constraint["foreign_key"] for constraint in constraints.values()]
+
+    def test_convert_charge_table(self):
+        table = Charge._meta.db_table
+
+        self.assertIn("django_omise_charge_ids", self.convert())
+        self.assertTrue(is_partitioned(connection, table))
+        self.assertEqual(get_referencing_constraints(connection, table), [])
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+
+        self.assertIn(
+            ["id", "date_created"],
+            [
+                constraint["columns"]
+                for constraint in constraints.values()
+                if constraint["primary_key"]
+            ],
+        )
+        self.assertIn(
+            ("django_omise_charge_ids", "id"),
+            self.get_foreign_keys(Refund._meta.db_table),
+        )
+        self.assertIn(
+            ("django_omise_charge_ids", "id"),
+            self.get_foreign_keys(Dispute._meta.db_table),
+        )
+
+    def test_ids_unique_across_partitions(self):
+        self.convert()
+        self.create_customer(id="cust_test_5s1jz157366mu6wr0ng")
+        charge = Charge.update_or_create_from_omise_object(
+            omise_object=omise_charge("chrg_test_1")
+        )
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.create_charge(
+                id=charge.id, date_created=timezone.now() - datetime.timedelta(days=62)
+            )
+
+        Charge.update_or_create_from_omise_object(
+            omise_object=omise_charge("chrg_test_1", status="failed")
+        )
+        Charge.objects.filter(id=charge.id).update(
+            date_created=timezone.now() - datetime.timedelta(days=62)
+        )
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.create_charge(id=charge.id)
+
+        self.assertEqual(Charge.objects.get().status, "failed")
+
+        Charge.objects.all().delete()
+        self.create_charge(id=charge.id)
+
+    def test_move_default_rows(self):
+        self.convert(table="event")
+        month = add_months(timezone.localdate(), 12)
+        event = Event.objects.create(id="evnt_test_1", livemode=False)
+        Event.objects.filter(id=event.id).update(
+            date_created=timezone.make_aware(
+                datetime.datetime(month.year, month.month, 2)
+            )
+        )
+
+        with mock.patch(
+            "django_omise.management.commands.partition_omise_tables.timezone.localdate",
+            return_value=month,
+        ):
+            call_command("partition_omise_tables", "--table=event", stdout=StringIO())
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Event.objects.create(id=event.id, livemode=False)
+
+    def test_migrate_foreign_key_to_partitioned_table(self):
+        self.convert()
+        call_command("migrate", "django_omise", "0014", verbosity=0)
+        call_command("migrate", "django_omise", verbosity=0)
+
+        self.assertIn(
+            ("django_omise_charge_ids", "id"),
+            self.get_foreign_keys(Dispute._meta.db_table),
+        )
@@ -0,0 +1,258 @@
+import datetime
+import json
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from django_omise.models.core import Charge
+from django_omise.omise import omise
+from django_omise.utils.core_utils import format_omise_datetime
+from django_omise.utils.reconcile_utils import (
+    CHECKSUM_DAYS,
+    checksum,
+    get_day_range,
+    reconcile,
+)
+
+from django_omise.tests.base import ClientAndUserBaseTestCase, OmiseBaseTestCase
+from django_omise.tests.test_utils import MockResponse, mocked_list_request
+
+from .mockdata.charge import base_charge_response
+
+from unittest import mock
+
+
+def charge_data(charge_id, **kwargs):
+    charge = json.loads(base_charge_response)
+    charge.update(
+        id=charge_id, created_at=format_omise_datetime(timezone.now()), **kwargs
+    )
+    return charge
+
+
+class ReconcileTestCase(ClientAndUserBaseTestCase, OmiseBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_customer(id="cust_test_5s1jz157366mu6wr0ng")
+        self.today = timezone.localdate()
+
+        Charge.bulk_update_or_create_from_omise_objects(
+            omise_objects=[
+                omise.Charge.from_data(charge_data("chrg_test_1", status="pending")),
+                omise.Charge.from_data(charge_data("chrg_test_2")),
+            ]
+        )
+
+    def reconcile(self, charges, **kwargs):
+        with mock.patch("requests.get", side_effect=mocked_list_request(charges)):
+            return reconcile(
+                "charge", date_from=self.today, date_to=self.today, **kwargs
+            )
+
+    def test_checksum_does_not_depend_on_order(self):
+        rows = [("chrg_test_1", "pending", 100000, 0), ("chrg_test_2", "", 1, 0)]
+
+        self.assertEqual(checksum(rows), checksum(reversed(rows)))
+        self.assertNotEqual(
+            checksum(rows), checksum([("chrg_test_1", "successful", 100000, 0)])
+        )
+
+    def get_payloads(self, mock_get):
+        return [json.loads(kwargs["data"]) for args, kwargs in mock_get.call_args_list]
+
+    @mock.patch.object(Charge, "bulk_update_or_create_from_omise_objects")
+    def test_matched_counts_not_listed(self, mock_bulk_update):
+        charges = [
+            charge_data("chrg_test_1", status="successful"),
+            charge_data("chrg_test_2"),
+        ]
+
+        with mock.patch(
+            "requests.get", side_effect=mocked_list_request(charges)
+        ) as mock_get:
+            [result] = reconcile(
+                "charge", date_from=self.today, date_to=self.today, checksum_days=0
+            )
+
+        self.assertTrue(result.matched)
+        self.assertFalse(result.listed)
+        self.assertEqual((result.remote_count, result.local_count), (2, 2))
+        self.assertEqual(
+            [payload["limit"] for payload in self.get_payloads(mock_get)], [1]
+        )
+        mock_bulk_update.assert_not_called()
+
+    @mock.patch.object(Charge, "bulk_update_or_create_from_omise_objects")
+    def test_matched_day_not_saved(self, mock_bulk_update):
+        [result] = self.reconcile(
+            [charge_data("chrg_test_2"), charge_data("chrg_test_1", status="pending")],
+            checksums=True,
+        )
+
+        self.assertTrue(result.matched)
+        self.assertTrue(result.listed)
+        self.assertEqual((result.remote_count, result.local_count), (2, 2))
+        mock_bulk_update.assert_not_called()
+
+    def test_recent_days_compared_by_checksums(self):
+        date_from = self.today - datetime.timedelta(days=CHECKSUM_DAYS)
+        today_from = format_omise_datetime(get_day_range(self.today)[0])
+        list_today = mocked_list_request(
+            [
+                charge_data("chrg_test_1", status="successful"),
+                charge_data("chrg_test_2"),
+            ]
+        )
+        list_other_days = mocked_list_request([])
+
+        def request(*args, **kwargs):
+            if json.loads(kwargs["data"])["from"] == today_from:
+                return list_today(*args, **kwargs)
+
+            return list_other_days(*args, **kwargs)
+
+        with mock.patch("requests.get", side_effect=request):
+            results = reconcile("charge", date_from=date_from, date_to=self.today)
+
+        self.assertEqual(len(results), CHECKSUM_DAYS + 1)
+        self.assertFalse(results[0].listed)
+        self.assertTrue(all(result.listed for result in results[1:]))
+        self.assertTrue(all(result.matched for result in results[:-1]))
+        self.assertEqual(results[-1].fixed, ["chrg_test_1"])
+
+    def test_checksums_find_changed_objects(self):
+        [result] = self.reconcile(
+            [
+                charge_data("chrg_test_1", status="successful"),
+                charge_data("chrg_test_2"),
+            ],
+            checksums=True,
+        )
+
+        self.assertEqual(result.fixed, ["chrg_test_1"])
+        self.assertEqual(Charge.objects.get(id="chrg_test_1").status, "successful")
+
+    def test_differing_objects_saved(self):
+        charges = [
+            charge_data("chrg_test_1", status="successful"),
+            charge_data("chrg_test_2"),
+            charge_data("chrg_test_3"),
+        ]
+        [result] = self.reconcile(charges, checksum_days=0)
+
+        self.assertFalse(result.matched)
+        self.assertTrue(result.listed)
+        self.assertEqual(result.fixed, ["chrg_test_1", "chrg_test_3"])
+        self.assertEqual(result.local_count, 3)
+        self.assertEqual(Charge.objects.get(id="chrg_test_1").status, "successful")
+
+        [result] = self.reconcile(charges, checksum_days=0)
+        self.assertTrue(result.matched)
+        self.assertFalse(result.listed)
+
+    def test_objects_bucketed_by_omise_creation_time(self):
+        Charge.objects.filter(id="chrg_test_1").update(
+            date_created=timezone.now() - datetime.timedelta(days=3)
+        )
+        Charge.objects.filter(id="chrg_test_2").update(created_at=None)
+
+        [result] = self.reconcile(
+            [charge_data("chrg_test_1", status="pending"), charge_data("chrg_test_2")]
+        )
+
+        self.assertEqual((result.remote_count, result.local_count), (2, 2))
+        self.assertEqual(result.fixed, ["chrg_test_2"])
+        self.assertIsNotNone(Charge.objects.get(id="chrg_test_2").created_at)
+
+    def test_dry_run_not_saved(self):
+        [result] = self.reconcile(
+            [
+                charge_data("chrg_test_1", status="successful"),
+                charge_data("chrg_test_2"),
+            ],
+            fix=False,
+            checksums=True,
+        )
+
+        self.assertEqual(result.fixed, ["chrg_test_1"])
+        self.assertEqual(Charge.objects.get(id="chrg_test_1").status, "pending")
+
+    def test_objects_not_on_omise_reported(self):
+        [result] = self.reconcile([charge_data("chrg_test_2")])
+
+        self.assertEqual(result.fixed, [])
+        self.assertEqual(result.unmatched, ["chrg_test_1"])
+        self.assertTrue(Charge.objects.filter(id="chrg_test_1").exists())
+
+    def test_days_listed_by_page(self):
+        charges = [charge_data(f"chrg_test_{index}") for index in range(1, 151)]
+        date_from = self.today - datetime.timedelta(days=1)
+
+        with mock.patch(
+            "requests.get", side_effect=mocked_list_request(charges)
+        ) as mock_get:
+            results = reconcile(
+                "charge", date_from=date_from, date_to=self.today, checksum_days=0
+            )
+
+        self.assertEqual([result.day for result in results], [date_from, self.today])
+        self.assertEqual(mock_get.call_count, 6)
+
+        start, end = get_day_range(self.today)
+        payloads = self.get_payloads(mock_get)
+
+        self.assertEqual(
+            sorted(
+                (payload["limit"], payload["offset"])
+                for payload in payloads
+                if payload["limit"] > 1
+            ),
+            [(100, 0), (100, 0), (100, 100), (100, 100)],
+        )
+        self.assertIn(
+            format_omise_datetime(start), [payload["from"] for payload in payloads]
+        )
+        self.assertEqual(Charge.objects.count(), 150)
+
+    def test_failed_day_reported(self):
+        error = json.dumps(
+            {
+                "object": "error",
+                "code": "authentication_failure",
+                "message": "authentication failed",
+            }
+        )
+
+        with mock.patch("requests.get", return_value=MockResponse(error, 401)):
+            [result] = reconcile("charge", date_from=self.today, date_to=self.today)
+
+        self.assertFalse(result.matched)
+        self.assertIsInstance(result.error, omise.errors.AuthenticationFailureError)
+
+    def test_command(self):
+        stdout = StringIO()
+
+        with mock.patch(
+            "requests.get",
+            side_effect=mocked_list_request(
+                [
+                    charge_data("chrg_test_1", status="failed"),
+                    charge_data("chrg_test_2"),
+                ]
+            ),
+        ):
+            call_command(
+                "reconcile_omise_objects",
+                "--resource=charge",
+                f"--date-from={self.today}",
+                "--checksums",
+                "--dry-run",
+                stdout=stdout,
+            )
+
+        output = stdout.getvalue()
+        self.assertIn("2 on Omise, 2 on the database, 1 differing", output)
+        self.assertIn("0 matched, 1 listed. Found 1 differing charges", output)
+        self.assertEqual(Charge.objects.get(id="chrg_test_1").status, "pending")
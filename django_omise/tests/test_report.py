@@ -0,0 +1,221 @@
+import datetime
+import json
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from django_omise.models.choices import ChargeStatus, Currency
+from django_omise.models.core import Charge
+from django_omise.models.report import ChargeDailyTotal
+from django_omise.omise import omise
+
+from django_omise.tests.base import ClientAndUserBaseTestCase, OmiseBaseTestCase
+
+from .mockdata.charge import base_charge_response
+
+from unittest import mock
+
+
+def omise_charge(charge_id, **kwargs):
+    charge = json.loads(base_charge_response)
+    charge.update(id=charge_id, **kwargs)
+    return omise.Charge.from_data(charge)
+
+
+class ChargeDailyTotalTestCase(ClientAndUserBaseTestCase, OmiseBaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_customer(id="cust_test_5s1jz157366mu6wr0ng")
+
+    def get_totals(self):
+        return {
+            (total.status, total.source_type): (total.count, total.amount)
+            for total in ChargeDailyTotal.objects.exclude(count=0)
+        }
+
+    def test_totals_updated_when_charge_saved(self):
+        Charge.update_or_create_from_omise_object(
+            omise_object=omise_charge("chrg_test_1", status="pending")
+        )
+        self.assertEqual(self.get_totals(), {("pending", "card"): (1, 100000)})
+
+        Charge.update_or_create_from_omise_object(
+            omise_object=omise_charge("chrg_test_1", status="successful")
+        )
+        self.assertEqual(self.get_totals(), {("successful", "card"): (1, 100000)})
+
+        Charge.update_or_create_from_omise_object(
+            omise_object=omise_charge("chrg_test_1", status="successful")
+        )
+        self.assertEqual(self.get_totals(), {("successful", "card"): (1, 100000)})
+
+    def test_concurrent_first_saves_count_charge_once(self):
+        get = QuerySet.get
+        lookups = []
+
+        def get_after_concurrent_save(queryset, *args, **kwargs):
+            if queryset.model is Charge and not lookups:
+                # Another save inserts the charge after the first lookup.
+                lookups.append(kwargs)
+                Charge.update_or_create_from_omise_object(
+                    omise_object=omise_charge("chrg_test_1", status="pending")
+                )
+                raise Charge.DoesNotExist
+
+            return get(queryset, *args, **kwargs)
+
+        with mock.patch.object(QuerySet, "get", get_after_concurrent_save):
+            Charge.update_or_create_from_omise_object(
+                omise_object=omise_charge("chrg_test_1", status="successful")
+            )
+
+        self.assertEqual(len(lookups), 1)
+        self.assertEqual(Charge.objects.get().status, "successful")
+        self.assertEqual(self.get_totals(), {("successful", "card"): (1, 100000)})
+
+    def test_totals_updated_when_charges_saved_in_bulk(self):
+        Charge.bulk_update_or_create_from_omise_objects(
+            omise_objects=[
+                omise_charge("chrg_test_1", status="pending"),
+                omise_charge("chrg_test_2", status="successful"),
+                omise_charge("chrg_test_3", status="successful", amount=50000),
+            ]
+        )
+        self.assertEqual(
+            self.get_totals(),
+            {("pending", "card"): (1, 100000), ("successful", "card"): (2, 150000)},
+        )
+
+        Charge.bulk_update_or_create_from_omise_objects(
+            omise_objects=[omise_charge("chrg_test_1", status="failed")]
+        )
+        self.assertEqual(
+            self.get_totals(),
+            {("failed", "card"): (1, 100000), ("successful", "card"): (2, 150000)},
+        )
+
+    def test_totals_by_omise_creation_day(self):
+        Charge.update_or_create_from_omise_object(
+            omise_object=omise_charge("chrg_test_1", created_at="2022-06-05T18:00:00Z")
+        )
+        Charge.update_or_create_from_omise_object(
+            omise_object=omise_charge("chrg_test_2", created_at=None)
+        )
+        Charge.update_or_create_from_omise_object(
+            omise_object=omise_charge("chrg_test_2", created_at="2022-06-06T01:00:00Z")
+        )
+
+        # The charges are counted on their local creation day in Asia/Bangkok.
+        self.assertEqual(
+            list(
+                ChargeDailyTotal.objects.exclude(count=0).values_list("date", "count")
+            ),
+            [(datetime.date(2022, 6, 6), 2)],
+        )
+
+        ChargeDailyTotal.rebuild()
+        self.assertEqual(
+            list(ChargeDailyTotal.objects.values_list("date", "count")),
+            [(datetime.date(2022, 6, 6), 2)],
+        )
+
+    def test_rebuild_totals(self):
+        source = self.create_source(id="src_test_1", type="promptpay")
+        self.create_charge(id="chrg_test_1", amount=1000)
+        self.create_charge(id="chrg_test_2", amount=2000)
+        self.create_charge(id="chrg_test_3", amount=4000, source=source)
+        self.create_charge(
+            id="chrg_test_4", amount=8000, currency=Currency.JPY, status="failed"
+        )
+        ChargeDailyTotal.objects.create(
+            date=timezone.localdate(),
+            currency=Currency.THB,
+            status=ChargeStatus.PENDING,
+            source_type="card",
+            count=5,
+        )
+
+        stdout = StringIO()
+        call_command("rebuild_charge_totals", stdout=stdout)
+
+        self.assertIn("Rebuilt 3 daily totals.", stdout.getvalue())
+        self.assertEqual(
+            {
+                (total.currency, total.status, total.source_type): (
+                    total.count,
+                    total.amount,
+                )
+                for total in ChargeDailyTotal.objects.all()
+            },
+            {
+                ("THB", "successful", "card"): (2, 3000),
+                ("THB", "successful", "promptpay"): (1, 4000),
+                ("JPY", "failed", "card"): (1, 8000),
+            },
+        )
+
+    def test_rebuild_totals_by_local_day(self):
+        day = timezone.localdate() - datetime.timedelta(days=1)
+        start = timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+        for charge_id, date_created in [
+            ("chrg_test_1", start - datetime.timedelta(microseconds=1)),
+            ("chrg_test_2", start),
+            ("chrg_test_3", start + datetime.timedelta(days=1, microseconds=-1)),
+            ("chrg_test_4", start + datetime.timedelta(days=1)),
+        ]:
+            self.create_charge(id=charge_id, amount=1000)
+            Charge.objects.filter(id=charge_id).update(date_created=date_created)
+
+        self.assertEqual(ChargeDailyTotal.rebuild(date_from=day, date_to=day), 1)
+        self.assertEqual(
+            list(ChargeDailyTotal.objects.values_list("date", "count")), [(day, 2)]
+        )
+
+        Charge.objects.filter(id="chrg_test_4").update(created_at=start)
+        Charge.objects.filter(id="chrg_test_2").update(
+            created_at=start - datetime.timedelta(microseconds=1)
+        )
+
+        self.assertEqual(ChargeDailyTotal.rebuild(date_from=day, date_to=day), 1)
+        self.assertEqual(
+            list(ChargeDailyTotal.objects.values_list("date", "count")), [(day, 2)]
+        )
+        self.assertEqual(
+            ChargeDailyTotal.get_charge_values(charge_ids=["chrg_test_4"])[
+                "chrg_test_4"
+            ]["created"],
+            start,
+        )
+
+    def test_dashboard_reads_totals_only(self):
+        for currency, amount in [(Currency.THB, 150000), (Currency.JPY, 5000)]:
+            ChargeDailyTotal.objects.create(
+                date=timezone.localdate(),
+                currency=currency,
+                status=ChargeStatus.SUCCESSFUL,
+                source_type="card",
+                count=3,
+                amount=amount,
+            )
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/admin/django_omise/chargedailytotal/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [
+                (total.currency, total.count, total.human_amount)
+                for total in response.context["totals"]
+            ],
+            [("JPY", 3, "5,000.00"), ("THB", 3, "1,500.00")],
+        )
+        self.assertContains(response, "1,500.00")
+
+        for query in context.captured_queries:
+            self.assertNotIn('"django_omise_charge"', query["sql"])
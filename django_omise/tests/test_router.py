@@ -0,0 +1,279 @@
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connections, router
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from django_omise.middleware import OmiseReplicaPinningMiddleware
+from django_omise.models.core import Charge, Customer, PendingCharge
+from django_omise.models.event import Event
+from django_omise.models.schedule import Schedule
+from django_omise.models.report import ChargeDailyTotal
+from django_omise.routers import (
+    PIN_COOKIE_NAME,
+    OmiseRouter,
+    allows_user_constraint,
+    is_pinned_to_primary,
+    reset_pinning,
+    use_primary,
+    uses_separate_database,
+)
+
+from django_omise.tests.base import ClientAndUserBaseTestCase, OmiseBaseTestCase
+from django_omise.tests.test_report import omise_charge
+from django_omise.tests.test_schedule import mocked_create_many_request, subscription
+
+from unittest import mock
+
+User = get_user_model()
+
+
+@override_settings(OMISE_DATABASE_REPLICAS=["replica"])
+class OmiseRouterTestCase(SimpleTestCase):
+    def setUp(self):
+        self.router = OmiseRouter()
+        reset_pinning()
+
+    def tearDown(self):
+        reset_pinning()
+
+    def test_disabled_without_replicas(self):
+        with self.settings(OMISE_DATABASE_REPLICAS=[]):
+            self.assertIsNone(self.router.db_for_read(Charge))
+            self.assertIsNone(self.router.db_for_write(Charge))
+            self.assertIsNone(self.router.allow_migrate("replica", "django_omise"))
+
+        self.assertFalse(is_pinned_to_primary())
+
+    def test_reads_from_replica(self):
+        self.assertEqual(self.router.db_for_read(Charge), "replica")
+
+    def test_other_apps_not_routed(self):
+        self.assertIsNone(self.router.db_for_read(User))
+        self.assertIsNone(self.router.db_for_write(User))
+        self.assertFalse(is_pinned_to_primary())
+
+    def test_pending_objects_read_from_primary(self):
+        self.assertEqual(self.router.db_for_read(PendingCharge), "default")
+
+    def test_reads_stick_to_primary_after_write(self):
+        with mock.patch("django_omise.routers.time.monotonic", return_value=100):
+            self.assertEqual(self.router.db_for_write(Charge), "default")
+            self.assertEqual(self.router.db_for_read(Charge), "default")
+
+        with mock.patch("django_omise.routers.time.monotonic", return_value=104):
+            self.assertEqual(self.router.db_for_read(Charge), "default")
+
+        with mock.patch("django_omise.routers.time.monotonic", return_value=105):
+            self.assertEqual(self.router.db_for_read(Charge), "replica")
+
+    def test_sticky_seconds_setting(self):
+        with self.settings(OMISE_DATABASE_STICKY_SECONDS=30):
+            with mock.patch("django_omise.routers.time.monotonic", return_value=100):
+                self.router.db_for_write(Charge)
+
+            with mock.patch("django_omise.routers.time.monotonic", return_value=129):
+                self.assertEqual(self.router.db_for_read(Charge), "default")
+
+    def test_use_primary(self):
+        with use_primary():
+            with use_primary():
+                self.assertEqual(self.router.db_for_read(Charge), "default")
+
+            self.assertEqual(self.router.db_for_read(Charge), "default")
+
+        self.assertEqual(self.router.db_for_read(Charge), "replica")
+
+        @use_primary()
+        def view():
+            return self.router.db_for_read(Charge)
+
+        self.assertEqual(view(), "default")
+        self.assertEqual(self.router.db_for_read(Charge), "replica")
+
+    def test_reads_in_transaction_from_primary(self):
+        with mock.patch.object(connections["default"], "in_atomic_block", True):
+            self.assertEqual(self.router.db_for_read(Charge), "default")
+
+    def test_allow_relation(self):
+        charge, other_charge = Charge(), Charge()
+        charge._state.db = "default"
+        other_charge._state.db = "replica"
+
+        self.assertTrue(self.router.allow_relation(charge, other_charge))
+
+        other_charge._state.db = "other"
+        self.assertIsNone(self.router.allow_relation(charge, other_charge))
+
+    def test_no_migrations_on_replicas(self):
+        self.assertFalse(self.router.allow_migrate("replica", "django_omise"))
+        self.assertIsNone(self.router.allow_migrate("default", "django_omise"))
+        self.assertIsNone(self.router.allow_migrate("replica", "auth"))
+
+
+@override_settings(OMISE_DATABASE_REPLICAS=["replica"])
+class OmiseReplicaPinningMiddlewareTestCase(SimpleTestCase):
+    def setUp(self):
+        self.router = OmiseRouter()
+        self.factory = RequestFactory()
+        reset_pinning()
+
+    def tearDown(self):
+        reset_pinning()
+
+    def test_cookie_set_after_write(self):
+        def get_response(request):
+            self.router.db_for_write(Charge)
+            return HttpResponse()
+
+        response = OmiseReplicaPinningMiddleware(get_response)(
+            self.factory.post("/checkout/")
+        )
+
+        self.assertEqual(response.cookies[PIN_COOKIE_NAME]["max-age"], 5)
+        self.assertFalse(is_pinned_to_primary())
+
+    def test_no_cookie_without_write(self):
+        def get_response(request):
+            self.assertEqual(self.router.db_for_read(Charge), "replica")
+            return HttpResponse()
+
+        response = OmiseReplicaPinningMiddleware(get_response)(
+            self.factory.get("/charge_status/")
+        )
+
+        self.assertNotIn(PIN_COOKIE_NAME, response.cookies)
+
+    def test_pinned_with_cookie(self):
+        def get_response(request):
+            self.assertEqual(self.router.db_for_read(Charge), "default")
+            return HttpResponse()
+
+        request = self.factory.get("/charge_status/")
+        request.COOKIES[PIN_COOKIE_NAME] = "1"
+
+        response = OmiseReplicaPinningMiddleware(get_response)(request)
+
+        self.assertNotIn(PIN_COOKIE_NAME, response.cookies)
+        self.assertFalse(is_pinned_to_primary())
+
+    def test_previous_request_writes_forgotten(self):
+        self.router.db_for_write(Charge)
+
+        def get_response(request):
+            self.assertEqual(self.router.db_for_read(Charge), "replica")
+            return HttpResponse()
+
+        response = OmiseReplicaPinningMiddleware(get_response)(
+            self.factory.get("/charge_status/")
+        )
+
+        self.assertNotIn(PIN_COOKIE_NAME, response.cookies)
+
+
+@override_settings(
+    DATABASE_ROUTERS=["django_omise.routers.OmiseRouter"],
+    OMISE_DATABASE="omise",
+)
+class OmiseDatabaseTestCase(ClientAndUserBaseTestCase, OmiseBaseTestCase):
+    databases = {"default", "omise"}
+
+    def _should_check_constraints(self, connection):
+        # The test databases are created without OMISE_DATABASE, so the customer
+        # table of the omise database keeps its foreign key constraint to the users.
+        if connection.alias == "omise":
+            return False
+
+        return super()._should_check_constraints(connection)
+
+    def setUp(self):
+        super().setUp()
+        self.customer = self.create_customer(
+            id="cust_test_5s1jz157366mu6wr0ng", user=self.user
+        )
+
+    def test_objects_stored_in_omise_database(self):
+        self.assertTrue(uses_separate_database())
+        self.assertEqual(self.customer._state.db, "omise")
+        self.assertTrue(Customer.objects.using("omise").exists())
+        self.assertFalse(Customer.objects.using("default").exists())
+
+        Charge.update_or_create_from_omise_object(
+            omise_object=omise_charge("chrg_test_1")
+        )
+
+        self.assertEqual(Charge.objects.using("omise").count(), 1)
+        self.assertEqual(ChargeDailyTotal.objects.using("omise").count(), 1)
+        self.assertFalse(Charge.objects.using("default").exists())
+
+    @mock.patch("requests.post", side_effect=mocked_create_many_request)
+    def test_schedule_batch_saved_in_omise_database(self, mock_create_schedule):
+        savepoints = len(connections["omise"].savepoint_ids)
+        savepoints_on_save = []
+
+        def save_and_fail(omise_schedules):
+            savepoints_on_save.append(len(connections["omise"].savepoint_ids))
+            raise IntegrityError
+
+        with mock.patch.object(
+            Schedule, "save_omise_schedules", side_effect=save_and_fail
+        ):
+            results = Schedule.create_many(schedules=[subscription("subscription-1")])
+
+        self.assertFalse(results[0].ok)
+        self.assertEqual(savepoints_on_save, [savepoints + 1, savepoints + 1])
+
+    def test_user_referenced_by_id(self):
+        customer = Customer.objects.get(id=self.customer.id)
+
+        self.assertEqual(customer.user, self.user)
+        self.assertEqual(customer.user._state.db, "default")
+        self.assertEqual(list(self.user.omise_customers.all()), [customer])
+
+    def test_deleted_user_removed_from_customers(self):
+        self.user.delete()
+        self.customer.refresh_from_db()
+
+        self.assertIsNone(self.customer.user_id)
+
+    def test_event_object(self):
+        charge = self.create_charge()
+        event = Event.objects.create(id="evnt_test_1", livemode=False)
+        event.event_object = charge
+        event.save()
+
+        self.assertEqual(Event.objects.get(id=event.id).event_object, charge)
+
+    def test_admin_search_users(self):
+        response = self.client.get("/admin/django_omise/customer/", {"q": "admin@test"})
+        self.assertEqual(list(response.context["cl"].result_list), [self.customer])
+
+        response = self.client.get("/admin/django_omise/customer/", {"q": "nobody"})
+        self.assertEqual(list(response.context["cl"].result_list), [])
+
+        response = self.client.get(
+            "/admin/django_omise/customer/", {"q": self.customer.id}
+        )
+        self.assertEqual(list(response.context["cl"].result_list), [self.customer])
+
+    def test_admin_prefetches_users(self):
+        self.create_card(customer=self.customer)
+
+        response = self.client.get("/admin/django_omise/card/")
+        card = response.context["cl"].result_list[0]
+
+        with self.assertNumQueries(0, using="default"):
+            self.assertEqual(card.customer.user, self.user)
+
+    def test_migrations(self):
+        self.assertTrue(router.allow_migrate("omise", "django_omise"))
+        self.assertTrue(router.allow_migrate("omise", "contenttypes"))
+        self.assertFalse(router.allow_migrate("omise", "auth"))
+        self.assertFalse(router.allow_migrate("default", "django_omise"))
+        self.assertTrue(router.allow_migrate("default", "auth"))
+
+    def test_user_constraint_only_with_users(self):
+        self.assertFalse(allows_user_constraint("omise"))
+        self.assertTrue(allows_user_constraint("default"))
+
+        with self.settings(OMISE_DATABASE=None):
+            self.assertTrue(allows_user_constraint("default"))
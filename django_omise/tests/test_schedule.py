@@ -3,7 +3,15 @@ from django.test import TestCase
 import code
 import readline
 
-from django_omise.models.schedule import Schedule, Occurrence
+import datetime
+import json
+import requests
+
+from django.core.management import call_command
+from django.db import IntegrityError
+
+from django_omise.models.schedule import Schedule, Occurrence, PendingSchedule
+from django_omise.models.choices import Currency, SchedulePeriod, ScheduleStatus
 from django_omise.omise import omise
 from django_omise.utils.core_utils import update_or_create_from_omise_object
 
@@ -11,7 +19,85 @@ from django_omise.tests.base import OmiseBaseTestCase
 
 from unittest import mock
 
-from .test_utils import mocked_base_schedule_request
+from .mockdata.schedule import base_schedule_response
+from .test_utils import mocked_base_schedule_request, MockResponse
+
+
+def occurrence_data(occurrence_id, schedule_id, scheduled_on):
+    return {
+        "object": "occurrence",
+        "livemode": False,
+        "location": f"/occurrences/{occurrence_id}",
+        "id": occurrence_id,
+        "result": None,
+        "schedule": schedule_id,
+        "message": None,
+        "status": "successful",
+        "processed_at": f"{scheduled_on}T01:01:47Z",
+        "created_at": f"{scheduled_on}T01:01:47Z",
+        "scheduled_on": scheduled_on,
+        "retry_on": None,
+    }
+
+
+def mocked_schedule_occurrences_request(*args, **kwargs):
+    request_url = args[0]
+    schedule_id = request_url.split("/schedules/")[1].split("/")[0]
+
+    if request_url.endswith("/occurrences"):
+        data = [
+            occurrence_data(f"{schedule_id}_occurrence_1", schedule_id, "2022-06-17"),
+            occurrence_data(f"{schedule_id}_occurrence_2", schedule_id, "2022-07-17"),
+        ]
+
+        return MockResponse(
+            json.dumps(
+                {
+                    "object": "list",
+                    "data": data,
+                    "limit": 100,
+                    "offset": 0,
+                    "total": len(data),
+                }
+            ),
+            200,
+        )
+
+    schedule = json.loads(base_schedule_response)
+    schedule["occurrences"]["total"] = 2
+    return MockResponse(json.dumps(schedule), 200)
+
+
+def mocked_create_many_request(*args, **kwargs):
+    idempotency_key = kwargs["headers"]["Idempotency-Key"]
+
+    if idempotency_key == "subscription-timeout":
+        raise requests.exceptions.Timeout
+
+    schedule = json.loads(base_schedule_response)
+    schedule["id"] = f"schd_test_{idempotency_key}"
+    schedule["charge"]["id"] = f"schd_charge_test_{idempotency_key}"
+    schedule["occurrences"]["data"] = []
+    schedule["occurrences"]["total"] = 0
+
+    return MockResponse(json.dumps(schedule), 200)
+
+
+def subscription(idempotency_key, **kwargs):
+    return {
+        "customer": "test_customer_id",
+        "card": "test_card_id",
+        "amount": 200000,
+        "currency": Currency.THB,
+        "every": 1,
+        "period": SchedulePeriod.MONTH,
+        "start_date": datetime.date(2022, 6, 17),
+        "end_date": datetime.date(2023, 6, 17),
+        "on": {"days_of_month": [17]},
+        "idempotency_key": idempotency_key,
+        **kwargs,
+    }
+
 
 # Create your tests here.
 class CustomerTestCase(OmiseBaseTestCase):
@@ -32,3 +118,229 @@ class CustomerTestCase(OmiseBaseTestCase):
         self.assertEqual(
             schedule.occurrences.all().count(), len(omise_schedule.occurrences)
         )
+
+    @mock.patch("requests.get", side_effect=mocked_base_schedule_request)
+    def test_schedule_on(self, mock_get_schedule):
+        omise_schedule = omise.Schedule.retrieve("test_schedule_id")
+        schedule = update_or_create_from_omise_object(omise_object=omise_schedule)
+        schedule.refresh_from_db()
+
+        self.assertEqual(schedule.on, {"days_of_month": [17]})
+
+    @mock.patch("requests.get", side_effect=mocked_base_schedule_request)
+    def test_schedule_local_occurrences_match_omise(self, mock_get_schedule):
+        omise_schedule = omise.Schedule.retrieve("test_schedule_id")
+        schedule = update_or_create_from_omise_object(omise_object=omise_schedule)
+        schedule.refresh_from_db()
+
+        self.assertEqual(
+            [
+                str(date)
+                for date in schedule.get_next_occurrences(
+                    count=20, date_from=datetime.date(2022, 6, 18)
+                )
+            ],
+            omise_schedule.next_occurrences_on,
+        )
+
+    def test_occurrences_between(self):
+        monthly_schedule = Schedule.objects.create(
+            id="test_monthly_schedule_id",
+            livemode=False,
+            active=True,
+            every=1,
+            period=SchedulePeriod.MONTH,
+            on={"days_of_month": [1, 15]},
+            start_on=datetime.date(2024, 1, 1),
+            end_on=datetime.date(2024, 12, 31),
+            status=ScheduleStatus.RUNNING,
+        )
+        weekly_schedule = Schedule.objects.create(
+            id="test_weekly_schedule_id",
+            livemode=False,
+            active=True,
+            every=1,
+            period=SchedulePeriod.WEEK,
+            on={"weekdays": ["monday"]},
+            start_on=datetime.date(2024, 1, 1),
+            end_on=datetime.date(2024, 12, 31),
+            status=ScheduleStatus.RUNNING,
+        )
+        Schedule.objects.create(
+            id="test_expired_schedule_id",
+            livemode=False,
+            active=False,
+            every=1,
+            period=SchedulePeriod.DAY,
+            start_on=datetime.date(2024, 1, 1),
+            end_on=datetime.date(2024, 12, 31),
+            status=ScheduleStatus.EXPIRED,
+        )
+
+        with self.assertNumQueries(1):
+            occurrences = list(
+                Schedule.objects.occurrences_between(
+                    date_from=datetime.date(2024, 3, 1),
+                    date_to=datetime.date(2024, 3, 15),
+                )
+            )
+
+        self.assertCountEqual(
+            occurrences,
+            [
+                (monthly_schedule, datetime.date(2024, 3, 1)),
+                (monthly_schedule, datetime.date(2024, 3, 15)),
+                (weekly_schedule, datetime.date(2024, 3, 4)),
+                (weekly_schedule, datetime.date(2024, 3, 11)),
+            ],
+        )
+
+    @mock.patch("requests.get", side_effect=mocked_schedule_occurrences_request)
+    def test_schedule_occurrences_fetched_page_by_page(self, mock_get_schedule):
+        omise_schedule = omise.Schedule.retrieve("test_schedule_id")
+        schedule = update_or_create_from_omise_object(omise_object=omise_schedule)
+
+        self.assertEqual(
+            sorted(schedule.occurrences.values_list("id", flat=True)),
+            ["test_schedule_id_occurrence_1", "test_schedule_id_occurrence_2"],
+        )
+
+    @mock.patch("requests.get", side_effect=mocked_schedule_occurrences_request)
+    def test_sync_occurrences_of_active_schedules(self, mock_get_schedule):
+        for schedule_id, active in [
+            ("test_schedule_id", True),
+            ("test_other_schedule_id", True),
+            ("test_inactive_schedule_id", False),
+        ]:
+            Schedule.objects.create(
+                id=schedule_id,
+                livemode=False,
+                active=active,
+                every=1,
+                period=SchedulePeriod.MONTH,
+                start_on=datetime.date(2022, 6, 17),
+                end_on=datetime.date(2023, 6, 17),
+                status=ScheduleStatus.RUNNING,
+            )
+
+        count = Schedule.objects.sync_occurrences(max_workers=2, batch_size=1)
+
+        self.assertEqual(count, 4)
+        self.assertEqual(
+            Occurrence.objects.filter(schedule_id="test_other_schedule_id").count(), 2
+        )
+        self.assertFalse(
+            Occurrence.objects.filter(schedule_id="test_inactive_schedule_id").exists()
+        )
+
+        call_command("sync_schedule_occurrences", stdout=open("/dev/null", "w"))
+
+        self.assertEqual(Occurrence.objects.count(), 4)
+
+    @mock.patch("requests.post", side_effect=mocked_create_many_request)
+    def test_create_many_schedules(self, mock_create_schedule):
+        results = Schedule.create_many(
+            schedules=[
+                subscription("subscription-1"),
+                subscription("subscription-timeout"),
+                {
+                    key: value
+                    for key, value in subscription("subscription-invalid").items()
+                    if key != "period"
+                },
+                subscription("subscription-2"),
+            ],
+            max_workers=2,
+            batch_size=3,
+        )
+
+        self.assertEqual([result.ok for result in results], [True, False, False, True])
+        self.assertIsInstance(results[1].error, requests.exceptions.Timeout)
+        self.assertIsInstance(results[2].error, TypeError)
+        self.assertEqual(results[0].schedule.id, "schd_test_subscription-1")
+        self.assertEqual(
+            results[3].schedule.charge.id, "schd_charge_test_subscription-2"
+        )
+        self.assertEqual(Schedule.objects.count(), 2)
+        self.assertEqual(mock_create_schedule.call_count, 3)
+
+        args, kwargs = mock_create_schedule.call_args_list[0]
+        data = json.loads(kwargs["data"])
+        self.assertEqual(data["charge"]["card"], "test_card_id")
+        self.assertEqual(data["start_date"], "2022-06-17")
+
+        pending_schedule = PendingSchedule.objects.get(
+            idempotency_key="subscription-timeout"
+        )
+        self.assertIsNone(pending_schedule.schedule)
+        self.assertNotEqual(pending_schedule.error, "")
+
+    @mock.patch("requests.post", side_effect=mocked_create_many_request)
+    def test_create_many_schedules_database_error(self, mock_create_schedule):
+        save_omise_schedules = Schedule.save_omise_schedules
+
+        def save_or_fail(omise_schedules):
+            omise_schedules = list(omise_schedules)
+
+            if any(
+                omise_schedule.id == "schd_test_subscription-unsaved"
+                for omise_schedule in omise_schedules
+            ):
+                raise IntegrityError
+
+            return save_omise_schedules(omise_schedules=omise_schedules)
+
+        with mock.patch.object(
+            Schedule, "save_omise_schedules", side_effect=save_or_fail
+        ) as mock_save:
+            results = Schedule.create_many(
+                schedules=[
+                    subscription("subscription-1"),
+                    subscription("subscription-unsaved"),
+                    subscription("subscription-2"),
+                ]
+            )
+
+        self.assertEqual(mock_save.call_count, 4)
+
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertIsInstance(results[1].error, IntegrityError)
+        self.assertEqual(Schedule.objects.count(), 2)
+
+        pending_schedule = PendingSchedule.objects.get(
+            idempotency_key="subscription-unsaved"
+        )
+        self.assertIsNone(pending_schedule.schedule)
+        self.assertNotEqual(pending_schedule.error, "")
+        self.assertEqual(
+            PendingSchedule.objects.get(idempotency_key="subscription-2").schedule_id,
+            "schd_test_subscription-2",
+        )
+
+    @mock.patch("requests.post", side_effect=mocked_create_many_request)
+    def test_create_many_schedules_resumes(self, mock_create_schedule):
+        Schedule.create_many(
+            schedules=[
+                subscription("subscription-1"),
+                subscription("subscription-timeout"),
+            ]
+        )
+        mock_create_schedule.reset_mock()
+
+        PendingSchedule.objects.filter(idempotency_key="subscription-timeout").update(
+            idempotency_key="subscription-2"
+        )
+
+        results = Schedule.create_many(
+            schedules=[
+                subscription("subscription-1"),
+                subscription("subscription-2"),
+            ]
+        )
+
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(mock_create_schedule.call_count, 1)
+        self.assertEqual(
+            PendingSchedule.objects.get(idempotency_key="subscription-2").error, ""
+        )
+        self.assertEqual(Schedule.objects.count(), 2)
@@ -0,0 +1,149 @@
+import datetime
+
+from django.test import SimpleTestCase
+
+from django_omise.utils.schedule_utils import (
+    get_occurrences_between,
+    get_weekday_of_month,
+    iter_occurrences,
+)
+
+
+# Create your tests here.
+class ScheduleUtilTestCase(SimpleTestCase):
+    def test_daily_occurrences(self):
+        self.assertEqual(
+            get_occurrences_between(
+                every=3,
+                period="day",
+                start_on="2024-01-01",
+                date_from="2024-01-05",
+                date_to="2024-01-14",
+            ),
+            [
+                datetime.date(2024, 1, 7),
+                datetime.date(2024, 1, 10),
+                datetime.date(2024, 1, 13),
+            ],
+        )
+
+    def test_weekly_occurrences(self):
+        self.assertEqual(
+            get_occurrences_between(
+                every=2,
+                period="week",
+                start_on="2024-01-03",
+                date_from="2024-01-01",
+                date_to="2024-01-31",
+                on={"weekdays": ["monday", "friday"]},
+            ),
+            [
+                datetime.date(2024, 1, 5),
+                datetime.date(2024, 1, 15),
+                datetime.date(2024, 1, 19),
+                datetime.date(2024, 1, 29),
+            ],
+        )
+
+    def test_monthly_days_of_month_occurrences(self):
+        self.assertEqual(
+            get_occurrences_between(
+                every=2,
+                period="month",
+                start_on="2024-01-20",
+                date_from="2024-01-01",
+                date_to="2024-06-30",
+                on={"days_of_month": [10, 20]},
+            ),
+            [
+                datetime.date(2024, 1, 20),
+                datetime.date(2024, 3, 10),
+                datetime.date(2024, 3, 20),
+                datetime.date(2024, 5, 10),
+                datetime.date(2024, 5, 20),
+            ],
+        )
+
+    def test_monthly_days_after_end_of_month(self):
+        self.assertEqual(
+            get_occurrences_between(
+                every=1,
+                period="month",
+                start_on="2024-01-31",
+                date_from="2024-01-01",
+                date_to="2024-04-30",
+                on={"days_of_month": [31]},
+            ),
+            [
+                datetime.date(2024, 1, 31),
+                datetime.date(2024, 2, 29),
+                datetime.date(2024, 3, 31),
+                datetime.date(2024, 4, 30),
+            ],
+        )
+
+    def test_monthly_weekday_of_month_occurrences(self):
+        self.assertEqual(
+            get_occurrences_between(
+                every=1,
+                period="month",
+                start_on="2024-01-01",
+                date_from="2024-01-01",
+                date_to="2024-03-31",
+                on={"weekday_of_month": "last_friday"},
+            ),
+            [
+                datetime.date(2024, 1, 26),
+                datetime.date(2024, 2, 23),
+                datetime.date(2024, 3, 29),
+            ],
+        )
+
+    def test_monthly_weekday_of_month_occurrences_response_format(self):
+        self.assertEqual(
+            get_occurrences_between(
+                every=1,
+                period="month",
+                start_on="2024-01-01",
+                date_from="2024-01-01",
+                date_to="2024-03-31",
+                on={"weekday_of_month": "2nd_monday"},
+            ),
+            [
+                datetime.date(2024, 1, 8),
+                datetime.date(2024, 2, 12),
+                datetime.date(2024, 3, 11),
+            ],
+        )
+
+    def test_get_weekday_of_month(self):
+        self.assertEqual(
+            get_weekday_of_month(2024, 9, "second_monday"), datetime.date(2024, 9, 9)
+        )
+        self.assertEqual(
+            get_weekday_of_month(2024, 9, "2nd_monday"), datetime.date(2024, 9, 9)
+        )
+        self.assertEqual(
+            get_weekday_of_month(2024, 9, "4th_friday"), datetime.date(2024, 9, 27)
+        )
+
+    def test_occurrences_stop_at_end_on(self):
+        self.assertEqual(
+            list(
+                iter_occurrences(
+                    every=1,
+                    period="day",
+                    start_on="2024-01-01",
+                    end_on="2024-01-03",
+                )
+            ),
+            [
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 1, 2),
+                datetime.date(2024, 1, 3),
+            ],
+        )
+
+    def test_unsupported_period(self):
+        with self.assertRaises(ValueError):
+            iter_occurrences(every=1, period="year", start_on="2024-01-01")
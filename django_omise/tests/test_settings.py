@@ -1,19 +1,32 @@
+import os
+
 DEBUG = True
 ROOT_URLCONF = "urls"
 ALLOWED_HOSTS = ["localhost", "example.com", "127.0.0.1", ".localhost", "[::1]"]
 
-# DATABASES = {
-#     "default": {
-#         "ENGINE": "django.db.backends.postgresql",
-#         "NAME": "django_omise",
-#         "USER": "django_omise",
-#         "PASSWORD": "django_omise",
-#         "HOST": "localhost",
-#         "PORT": "5431",
-#     }
-# }
+DATABASES = {
+    "default": {"ENGINE": "django.db.backends.sqlite3"},
+    # Used by the tests of setting OMISE_DATABASE.
+    "omise": {"ENGINE": "django.db.backends.sqlite3"},
+}
 
-DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3"}}
+# Run the tests on the PostgreSQL database of docker-compose.yml, e.g. for the
+# tests of partitioning, with DJANGO_OMISE_TEST_DATABASE=postgresql.
+if os.environ.get("DJANGO_OMISE_TEST_DATABASE") == "postgresql":
+    DATABASES = {
+        alias: {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": name,
+            "USER": "django_omise",
+            "PASSWORD": "django_omise",
+            "HOST": "localhost",
+            "PORT": "5431",
+        }
+        for alias, name in [
+            ("default", "django_omise"),
+            ("omise", "django_omise_omise"),
+        ]
+    }
 
 USE_TZ = True
 TIME_ZONE = "Asia/Bangkok"
@@ -41,6 +54,7 @@ MIDDLEWARE = (
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "django_omise.middleware.OmiseObjectCacheMiddleware",
 )
 
 TEMPLATES = [
@@ -0,0 +1,173 @@
+import datetime
+import json
+
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from django_omise.models.settlement import Balance, Transaction
+from django_omise.omise import omise
+from django_omise.utils.core_utils import format_omise_datetime
+
+from django_omise.tests.test_utils import MockResponse, mocked_list_request
+
+from .mockdata.settlement import balance_response, transaction_response
+
+from unittest import mock
+
+
+def transaction_data(transaction_id, **kwargs):
+    transaction = json.loads(transaction_response)
+    transaction.update(id=transaction_id, **kwargs)
+    return transaction
+
+
+class TransactionTestCase(TestCase):
+    def test_create_from_omise_object(self):
+        transaction = Transaction.update_or_create_from_omise_object(
+            omise_object=omise.Transaction.from_data(json.loads(transaction_response))
+        )
+        transaction.refresh_from_db()
+
+        self.assertEqual(transaction.amount, 96350)
+        self.assertEqual(transaction.direction, "credit")
+        self.assertEqual(transaction.key, "charge.payment")
+        self.assertEqual(transaction.origin, "chrg_test_5s1jz157366mu6wr0ng")
+        self.assertEqual(
+            transaction.created_at,
+            datetime.datetime(2022, 5, 24, 8, 47, 11, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(transaction.human_amount, "963.50")
+
+    def test_create_from_old_api_version(self):
+        data = transaction_data("trxn_test_old", type="debit")
+        data["transferable"] = data.pop("transferable_at")
+        del data["direction"]
+
+        transaction = Transaction.update_or_create_from_omise_object(
+            omise_object=omise.Transaction.from_data(data)
+        )
+        transaction.refresh_from_db()
+
+        self.assertEqual(transaction.direction, "debit")
+        self.assertEqual(
+            transaction.transferable_at,
+            datetime.datetime(2022, 5, 31, 8, 47, 11, tzinfo=datetime.timezone.utc),
+        )
+
+    def test_import_from_omise(self):
+        transactions = [transaction_data(f"trxn_test_{index}") for index in range(150)]
+
+        with mock.patch(
+            "requests.get", side_effect=mocked_list_request(transactions)
+        ) as mock_get:
+            count = Transaction.import_from_omise(
+                date_from=datetime.date(2022, 5, 1),
+                date_to=datetime.date(2022, 5, 2),
+            )
+
+        self.assertEqual(count, 300)
+        self.assertEqual(Transaction.objects.count(), 150)
+        self.assertEqual(mock_get.call_count, 4)
+
+        payloads = [
+            json.loads(kwargs["data"]) for args, kwargs in mock_get.call_args_list
+        ]
+
+        self.assertEqual([payload["offset"] for payload in payloads], [0, 100, 0, 100])
+        self.assertEqual(payloads[0]["from"], "2022-04-30T17:00:00Z")
+        self.assertEqual(payloads[0]["to"], "2022-05-01T16:59:59Z")
+        self.assertEqual(payloads[2]["from"], "2022-05-01T17:00:00Z")
+        self.assertEqual(payloads[2]["to"], "2022-05-02T16:59:59Z")
+
+    def test_import_from_omise_by_window(self):
+        with mock.patch(
+            "requests.get", side_effect=mocked_list_request([])
+        ) as mock_get:
+            count = Transaction.import_from_omise(
+                date_from=datetime.date(2022, 5, 1),
+                date_to=datetime.date(2022, 5, 10),
+                window_days=7,
+            )
+
+        self.assertEqual(count, 0)
+        payloads = [
+            json.loads(kwargs["data"]) for args, kwargs in mock_get.call_args_list
+        ]
+        self.assertEqual(
+            [(payload["from"], payload["to"]) for payload in payloads],
+            [
+                ("2022-04-30T17:00:00Z", "2022-05-07T16:59:59Z"),
+                ("2022-05-07T17:00:00Z", "2022-05-10T16:59:59Z"),
+            ],
+        )
+
+    @mock.patch("requests.get")
+    def test_import_from_omise_invalid_window(self, mock_get):
+        for window_days in [0, -1]:
+            with self.assertRaises(ValueError):
+                Transaction.import_from_omise(
+                    date_from=datetime.date(2022, 5, 1),
+                    date_to=datetime.date(2022, 5, 2),
+                    window_days=window_days,
+                )
+
+            with self.assertRaises(CommandError):
+                call_command(
+                    "import_omise_transactions",
+                    f"--window-days={window_days}",
+                    stdout=StringIO(),
+                )
+
+        mock_get.assert_not_called()
+
+    def test_format_omise_datetime(self):
+        self.assertEqual(
+            format_omise_datetime(
+                datetime.datetime(
+                    2022, 5, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=7))
+                )
+            ),
+            "2022-04-30T17:00:00Z",
+        )
+
+
+class BalanceTestCase(TestCase):
+    @mock.patch("requests.get", return_value=MockResponse(balance_response, 200))
+    def test_create_snapshot(self, mock_get):
+        balance = Balance.create_snapshot()
+
+        self.assertEqual(mock_get.call_args[0][0], "https://api.omise.co/balance")
+        self.assertEqual(balance.currency, "THB")
+        self.assertEqual(balance.total, 1596350)
+        self.assertEqual(balance.transferable, 1500000)
+        self.assertEqual(balance.on_hold, 96350)
+        self.assertEqual(balance.human_total, "15,963.50")
+
+    @mock.patch("requests.get")
+    def test_command(self, mock_get):
+        def request(*args, **kwargs):
+            if args[0].endswith("/balance"):
+                return MockResponse(balance_response, 200)
+
+            return mocked_list_request([transaction_data("trxn_test_1")])(
+                *args, **kwargs
+            )
+
+        mock_get.side_effect = request
+        stdout = StringIO()
+
+        call_command(
+            "import_omise_transactions",
+            "--date-from=2022-05-24",
+            "--date-to=2022-05-24",
+            "--balance",
+            stdout=stdout,
+        )
+
+        output = stdout.getvalue()
+        self.assertIn("Imported 1 transactions from 2022-05-24 to 2022-05-24.", output)
+        self.assertIn("Saved the balance: 15,963.50 THB", output)
+        self.assertEqual(Transaction.objects.get().id, "trxn_test_1")
+        self.assertEqual(Balance.objects.count(), 1)
@@ -0,0 +1,97 @@
+import json
+
+from django.test import TestCase
+from django.urls import reverse
+
+from django_omise.models.transfer import Recipient, Transfer
+from django_omise.omise import omise
+
+from django_omise.tests.test_utils import MockResponse
+
+from .mockdata.transfer import (
+    recipient_response,
+    transfer_event_response,
+    transfer_response,
+)
+
+from unittest import mock
+
+
+def mocked_transfer_requests(*args, **kwargs):
+    request_url = args[0]
+
+    if "/events/" in request_url:
+        return MockResponse(transfer_event_response, 200)
+
+    if "/transfers/" in request_url:
+        return MockResponse(transfer_response, 200)
+
+    if "/recipients/" in request_url:
+        return MockResponse(recipient_response, 200)
+
+    return MockResponse(None, 404)
+
+
+class TransferTestCase(TestCase):
+    @mock.patch("requests.get", side_effect=mocked_transfer_requests)
+    def test_webhook_saves_transfer_and_recipient(self, mock_get):
+        response = self.client.post(
+            reverse("django_omise:webhook"),
+            transfer_event_response,
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        transfer = Transfer.objects.get()
+        self.assertEqual(transfer.recipient.name, "Somchai Prasert")
+        self.assertEqual(transfer.recipient.bank_account["last_digits"], "7890")
+        self.assertEqual(transfer.net, 496790)
+        self.assertTrue(transfer.sendable)
+        self.assertFalse(transfer.sent)
+        self.assertEqual(transfer.human_amount, "5,000.00")
+        self.assertEqual(transfer.events.get().id, "evnt_test_transfer")
+
+    @mock.patch("requests.get", side_effect=mocked_transfer_requests)
+    def test_bulk_update_or_create(self, mock_get):
+        Recipient.update_or_create_from_omise_object(
+            omise_object=omise.Recipient.from_data(json.loads(recipient_response))
+        )
+
+        transfers = Transfer.bulk_update_or_create_from_omise_objects(
+            [
+                omise.Transfer.from_data(json.loads(transfer_response)),
+                omise.Transfer.from_data(
+                    {**json.loads(transfer_response), "id": "trsf_test_2", "paid": True}
+                ),
+            ]
+        )
+
+        self.assertEqual([transfer.paid for transfer in transfers], [False, True])
+        mock_get.assert_not_called()
+
+    @mock.patch("requests.get")
+    def test_webhook_recipient_destroy(self, mock_get):
+        Recipient.update_or_create_from_omise_object(
+            omise_object=omise.Recipient.from_data(json.loads(recipient_response))
+        )
+        event = {
+            "object": "event",
+            "id": "evnt_test_recipient_destroy",
+            "livemode": False,
+            "location": "/events/evnt_test_recipient_destroy",
+            "key": "recipient.destroy",
+            "created_at": "2022-05-24T08:47:11Z",
+            "data": {**json.loads(recipient_response), "deleted": True},
+        }
+        mock_get.return_value = MockResponse(json.dumps(event), 200)
+
+        response = self.client.post(
+            reverse("django_omise:webhook"),
+            json.dumps(event),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertTrue(Recipient.objects.get().deleted)
+        self.assertFalse(Recipient.objects.live().exists())
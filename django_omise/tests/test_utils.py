@@ -15,7 +15,11 @@ from .mockdata.schedule import (
     base_schedule_response,
     schedule_response_no_next_occurrences_on,
 )
-from .mockdata.token import token_response
+from .mockdata.token import (
+    new_card_token_response,
+    renewed_card_token_response,
+    token_response,
+)
 
 
 class MockResponse:
@@ -27,8 +31,59 @@ class MockResponse:
         return json.loads(self.raw_response)
 
 
-def mocked_requests_post(*args, **kwargs):
+def mocked_list_request(objects):
+    """
+    Mock an Omise list of objects, paged by the offset and limit of the request.
+    """
+
+    def request(*args, **kwargs):
+        data = json.loads(kwargs["data"])
+        page = objects[data["offset"] : data["offset"] + data["limit"]]
+        return MockResponse(
+            json.dumps(
+                {
+                    "object": "list",
+                    "data": page,
+                    "limit": data["limit"],
+                    "offset": data["offset"],
+                    "total": len(objects),
+                }
+            ),
+            200,
+        )
+
+    return request
+
+
+def mocked_search_request(objects):
+    """
+    Mock an Omise search, returning the objects whose metadata contains the query.
+    """
+
+    def request(*args, **kwargs):
+        query = args[0].split("query=")[1].split("&")[0]
+        data = [
+            omise_object
+            for omise_object in objects
+            if query in json.dumps(omise_object.get("metadata") or {})
+        ]
+        return MockResponse(
+            json.dumps(
+                {
+                    "object": "search",
+                    "scope": "charge",
+                    "query": query,
+                    "data": data,
+                    "total": len(data),
+                }
+            ),
+            200,
+        )
+
+    return request
+
 
+def mocked_requests_post(*args, **kwargs):
     request_url = args[0]
 
     if request_url == "https://api.omise.co/customers":  # omise.Customer.create
@@ -52,6 +107,12 @@ def mocked_requests_get(*args, **kwargs):
     ):  # omise.Token.retrieve
         return MockResponse(token_response, 200)
 
+    if request_url == "https://vault.omise.co/tokens/test_new_card_token_id":
+        return MockResponse(new_card_token_response, 200)
+
+    if request_url == "https://vault.omise.co/tokens/test_renewed_card_token_id":
+        return MockResponse(renewed_card_token_response, 200)
+
     return MockResponse(None, 404)
 
 
@@ -4,7 +4,13 @@ from django.urls import reverse
 from django_omise.tests.base import ClientAndUserBaseTestCase, OmiseBaseTestCase
 
 from django_omise.tests.mockdata.event import schedule_with_one_charge_event_response
-from django_omise.tests.test_utils import mocked_requests_event_schedule
+from django_omise.tests.mockdata.charge import base_charge_response
+from django_omise.tests.test_utils import (
+    mocked_requests_event_schedule,
+    mocked_search_request,
+)
+
+from django_omise.models.core import CHARGE_UID_METADATA_KEY, Charge, PendingCharge
 
 from django_omise.omise import omise
 
@@ -45,3 +51,51 @@ class ViewTestCase(ClientAndUserBaseTestCase, OmiseBaseTestCase):
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
+
+    @mock.patch("requests.post")
+    def test_return_uri_finds_pending_charge(self, mock_post_request):
+        self.create_customer(id="cust_test_5s1jz157366mu6wr0ng")
+        pending_charge = PendingCharge.objects.create(
+            uid="6b8f3c3e-3f7a-4a57-9b7f-2d4c3c8f6b1a",
+            idempotency_key="order-1",
+            parameters={"amount": 100000, "currency": "THB", "card": "card_id"},
+        )
+        other_charge = json.loads(base_charge_response)
+        other_charge.update(id="chrg_test_other", metadata={})
+        omise_charge = json.loads(base_charge_response)
+        omise_charge["metadata"] = {CHARGE_UID_METADATA_KEY: str(pending_charge.uid)}
+
+        with mock.patch(
+            "requests.get",
+            side_effect=mocked_search_request([other_charge, omise_charge]),
+        ) as mock_get:
+            response = self.client.get(
+                reverse("django_omise:return_uri", kwargs={"uid": pending_charge.uid})
+            )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertIn(
+            f"search/?scope=charge&query={pending_charge.uid}", mock_get.call_args[0][0]
+        )
+        mock_post_request.assert_not_called()
+        self.assertEqual(
+            Charge.objects.get(uid=pending_charge.uid).id, omise_charge["id"]
+        )
+
+    @mock.patch("requests.post")
+    def test_return_uri_pending_charge_not_on_omise(self, mock_post_request):
+        pending_charge = PendingCharge.objects.create(
+            uid="6b8f3c3e-3f7a-4a57-9b7f-2d4c3c8f6b1a",
+            idempotency_key="order-1",
+            parameters={"amount": 100000, "currency": "THB", "card": "card_id"},
+        )
+
+        with mock.patch("requests.get", side_effect=mocked_search_request([])):
+            response = self.client.get(
+                reverse("django_omise:return_uri", kwargs={"uid": pending_charge.uid})
+            )
+
+        self.assertEqual(response.status_code, 404)
+        mock_post_request.assert_not_called()
+        self.assertFalse(Charge.objects.filter(uid=pending_charge.uid).exists())
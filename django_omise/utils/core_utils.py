@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import datetime
 import omise
+import threading
+import time
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor
+
 from django.apps import apps
 from django.conf import settings
+from django.utils import timezone
 
-from typing import Optional, Any, TYPE_CHECKING, List, Dict
+from typing import Optional, Any, TYPE_CHECKING, Iterable, Iterator, List, Dict
 
 if TYPE_CHECKING:
     from django.db import models
@@ -25,7 +31,7 @@ def get_payment_methods_for_form(
         payment_methods = get_payment_methods()
 
     if "card" in payment_methods:
-        payment_methods += ["old_card", "new_card"]
+        payment_methods = payment_methods + ["old_card", "new_card"]
 
     return payment_methods
 
@@ -36,7 +42,7 @@ def get_payment_methods() -> List[str]:
 
     :returns: List of payment methods by setting OMISE_PAYMENT_METHODS or default to credit card only.
     """
-    payment_methods = setting("OMISE_PAYMENT_METHODS", ["card"])
+    payment_methods = list(setting("OMISE_PAYMENT_METHODS", ["card"]))
     return payment_methods
 
 
@@ -161,7 +167,7 @@ def before_update_or_create_from_omise_object_action(
     """
     This method is run before the function update_or_create_from_omise_object_action,
     allowing an action before the object is created to to database.
-    e.g. Saving schedule object without occurences so that there is no contraint error.
+    e.g. Saving the charge of a refund before the refund.
 
     :param omise_object: An instance of Omise object to perform the action on.
     """
@@ -179,12 +185,18 @@ def before_update_or_create_from_omise_object_action(
             ],
         )
 
-    if omise_object.object == "schedule":
-        update_or_create_from_omise_object_action(
-            omise_object=omise_object,
-            ignore_fields=[
-                "occurrences",
-            ],
+    if omise_object.object == "dispute":
+        save_missing_related_objects(
+            model=get_current_app_model(model_name="Dispute"),
+            omise_objects=[omise_object],
+            field_name="charge",
+        )
+
+    if omise_object.object == "transfer":
+        save_missing_related_objects(
+            model=get_current_app_model(model_name="Transfer"),
+            omise_objects=[omise_object],
+            field_name="recipient",
         )
 
 
@@ -218,15 +230,53 @@ def after_update_or_create_from_omise_object_action(
             )
 
         charge = saved_object
-        charge.schedule = schedule
-        charge.save()
+
+        if charge.schedule_id != getattr(schedule, "pk", None):
+            charge.schedule = schedule
+            charge.save(update_fields=["schedule", "date_updated"])
 
     if omise_object.object == "customer":
 
         customer = saved_object
+        stale_schedules = customer.get_stale_schedules()
+
+        reload_from_omise_many(objects=stale_schedules)
+
+        # A schedule whose card still differs is not reloaded again until the customer changes.
+        ChargeSchedule = apps.get_model(
+            app_label="django_omise", model_name="ChargeSchedule"
+        )
+        ChargeSchedule.objects.filter(
+            pk__in=[schedule.charge_id for schedule in stale_schedules]
+        ).update(date_updated=timezone.now())
+
+
+def reload_from_omise_many(
+    objects: Iterable[OmiseBaseModel],
+    max_workers: int = 4,
+) -> List[OmiseBaseModel]:
+    """
+    Reload many objects from Omise's server, retrieving them from a bounded pool of threads.
+
+    The objects are retrieved concurrently and saved one by one on the calling thread.
+
+    :param objects: Iterable of model instances to reload.
+    :param max_workers: The maximum number of concurrent requests to Omise.
+
+    :returns: List of the saved objects in the same order as objects.
+    """
+    objects = list(objects)
+
+    if not objects:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        omise_objects = list(executor.map(lambda obj: obj.get_omise_object(), objects))
 
-        for schedule in customer.schedules:
-            schedule.reload_from_omise()
+    return [
+        obj.__class__.update_or_create_from_omise_object(omise_object=omise_object)
+        for obj, omise_object in zip(objects, omise_objects)
+    ]
 
 
 def update_or_create_from_omise_object_action(
@@ -258,6 +308,44 @@ def update_or_create_from_omise_object_action(
     return new_object
 
 
+def save_missing_related_objects(
+    model: models.Model,
+    omise_objects: Iterable[omise.Base],
+    field_name: str,
+) -> List[models.Model]:
+    """
+    Retrieve and save the related objects which Omise objects reference by id, when they are not on the database yet.
+
+    e.g. Saving the charge of a dispute, which only contains the id of its charge.
+
+    :param model: The model class of the Omise objects.
+    :param omise_objects: Iterable of Omise objects.
+    :param field_name: The name of the foreign key of the model to the related objects.
+
+    :returns: List of the saved related objects.
+    """
+    related_model = model._meta.get_field(field_name).related_model
+    related_ids = {
+        value
+        for value in (
+            getattr(omise_object, field_name, None) for omise_object in omise_objects
+        )
+        if type(value) is str
+    }
+    existing_ids = set(
+        related_model._base_manager.filter(pk__in=related_ids).values_list(
+            "pk", flat=True
+        )
+    )
+
+    return [
+        update_or_create_from_omise_object_action(
+            omise_object=related_model.omise_class.retrieve(related_id)
+        )
+        for related_id in sorted(related_ids - existing_ids)
+    ]
+
+
 def get_model_from_omise_object(
     omise_object: omise.Base,
     raise_if_not_implemented: bool = False,
@@ -280,6 +368,10 @@ def get_model_from_omise_object(
         "scheduled_charge": get_current_app_model(model_name="ChargeSchedule"),
         "occurrence": get_current_app_model(model_name="Occurrence"),
         "schedule": get_current_app_model(model_name="Schedule"),
+        "transaction": get_current_app_model(model_name="Transaction"),
+        "dispute": get_current_app_model(model_name="Dispute"),
+        "recipient": get_current_app_model(model_name="Recipient"),
+        "transfer": get_current_app_model(model_name="Transfer"),
     }
 
     if (
@@ -303,3 +395,133 @@ def get_current_app_model(model_name: str) -> models.Model:
     """
     app_label = "django_omise"
     return apps.get_model(app_label=app_label, model_name=model_name)
+
+
+class RateLimiter:
+    """
+    Space out calls made from any number of threads to a maximum rate.
+
+    :param rate optional: Maximum number of calls per second. No limit if None.
+    """
+
+    def __init__(self, rate: Optional[float] = None):
+        self.interval = 1 / rate if rate else 0
+        self.next_call = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        """
+        Block until the next call is allowed.
+        """
+        if not self.interval:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            call_at = max(now, self.next_call)
+            self.next_call = call_at + self.interval
+
+        if call_at > now:
+            time.sleep(call_at - now)
+
+
+def get_start_of_day(day: datetime.date) -> datetime.datetime:
+    """
+    Get the start of a day in the current time zone.
+
+    Filter with date_created__gte=get_start_of_day(date_from) and
+    date_created__lt=get_start_of_day(date_to + 1 day) rather than with
+    date_created__date, which cannot use the indexes on date_created.
+
+    :returns: An aware datetime.
+    """
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+def format_omise_datetime(value: datetime.datetime) -> str:
+    """
+    Format an aware datetime for the from and to parameters of Omise lists.
+
+    :returns: The time in UTC in ISO 8601 format, e.g. 2024-01-31T17:00:00Z.
+    """
+    return value.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def iter_omise_list_pages(
+    path: str,
+    date_from: datetime.datetime,
+    date_to: datetime.datetime,
+    rate_limiter: Optional[RateLimiter] = None,
+    limit: int = 100,
+) -> Iterator[List[omise.Base]]:
+    """
+    Iterate the pages of an Omise list of objects created in a time window, oldest first.
+
+    Each page is requested when the previous one has been consumed, so the objects
+    can be saved page by page without holding the whole list in memory.
+
+    :param path: The path of the Omise list, e.g. charges or transactions.
+    :param date_from: The start of the window, inclusive.
+    :param date_to: The end of the window, inclusive.
+    :param rate_limiter optional: The RateLimiter shared by the requests to Omise.
+    :param limit optional: The number of objects per page, at most 100.
+
+    :returns: Iterator of lists of Omise objects.
+    """
+    payload = {
+        "from": format_omise_datetime(date_from),
+        "to": format_omise_datetime(date_to),
+        "limit": limit,
+        "order": "chronological",
+    }
+    offset = 0
+
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.wait()
+
+        page = omise.Request(omise.api_secret, omise.api_main, omise.api_version).send(
+            "get", path, payload={**payload, "offset": offset}
+        )
+        omise_objects = [omise._as_object(data) for data in page["data"]]
+        offset += len(omise_objects)
+
+        if omise_objects:
+            yield omise_objects
+
+        if not omise_objects or offset >= page.get("total", 0):
+            return
+
+
+def count_omise_list(
+    path: str,
+    date_from: datetime.datetime,
+    date_to: datetime.datetime,
+    rate_limiter: Optional[RateLimiter] = None,
+) -> int:
+    """
+    Count the objects of an Omise list created in a time window, with one request.
+
+    The list is requested with a limit of one object and its total is returned.
+
+    :param path: The path of the Omise list, e.g. charges or refunds.
+    :param date_from: The start of the window, inclusive.
+    :param date_to: The end of the window, inclusive.
+    :param rate_limiter optional: The RateLimiter shared by the requests to Omise.
+
+    :returns: The number of objects.
+    """
+    if rate_limiter is not None:
+        rate_limiter.wait()
+
+    page = omise.Request(omise.api_secret, omise.api_main, omise.api_version).send(
+        "get",
+        path,
+        payload={
+            "from": format_omise_datetime(date_from),
+            "to": format_omise_datetime(date_to),
+            "limit": 1,
+            "offset": 0,
+        },
+    )
+    return page["total"]
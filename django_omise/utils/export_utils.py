@@ -0,0 +1,198 @@
+import csv
+import datetime
+import json
+
+from django.apps import apps
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from django_omise.utils.core_utils import get_start_of_day
+
+from typing import Dict, Iterator, List, Optional
+
+EXPORT_FORMATS = ["csv", "jsonl"]
+
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+
+# The model and the field filtered by status of each exportable object.
+EXPORT_MODELS = {
+    "charge": ("Charge", "status"),
+    "refund": ("Refund", None),
+    "event": ("Event", "event_type"),
+    "customer": ("Customer", None),
+}
+
+
+class Echo:
+    """
+    File-like object which returns what is written to it, to stream csv rows.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def get_export_model(name: str) -> models.Model:
+    """
+    Get the model of an exportable object.
+
+    :param name: One of charge, refund, event or customer.
+
+    :returns: The model class.
+    """
+    if name not in EXPORT_MODELS:
+        raise ValueError(f"The object {name} cannot be exported")
+
+    return apps.get_model(app_label="django_omise", model_name=EXPORT_MODELS[name][0])
+
+
+def get_export_fields(model: models.Model) -> List[str]:
+    """
+    Get the columns exported for a model.
+
+    The raw Omise data of the objects is not exported.
+
+    :param model: The model class.
+
+    :returns: List of field attribute names.
+    """
+    return [
+        field.attname for field in model._meta.concrete_fields if field.name != "data"
+    ]
+
+
+def filter_export_queryset(
+    queryset: models.QuerySet,
+    date_from: Optional[datetime.date] = None,
+    date_to: Optional[datetime.date] = None,
+    statuses: Optional[List[str]] = None,
+) -> models.QuerySet:
+    """
+    Filter the objects to export by creation date and status.
+
+    :param queryset: The queryset of an exportable model.
+    :param date_from optional: The first creation date, inclusive.
+    :param date_to optional: The last creation date, inclusive.
+    :param statuses optional: List of statuses. The event type for events.
+
+    :returns: The filtered queryset.
+    """
+    if date_from is not None:
+        queryset = queryset.filter(date_created__gte=get_start_of_day(date_from))
+
+    if date_to is not None:
+        queryset = queryset.filter(
+            date_created__lt=get_start_of_day(date_to + datetime.timedelta(days=1))
+        )
+
+    if statuses:
+        status_fields = {
+            model_name.lower(): status_field
+            for model_name, status_field in EXPORT_MODELS.values()
+        }
+        status_field = status_fields.get(queryset.model._meta.model_name)
+
+        if status_field is None:
+            raise ValueError(
+                f"The object {queryset.model._meta.model_name} cannot be filtered by status"
+            )
+
+        queryset = queryset.filter(**{f"{status_field}__in": statuses})
+
+    return queryset
+
+
+def iter_export_rows(
+    queryset: models.QuerySet,
+    fields: List[str],
+    chunk_size: int = 2000,
+) -> Iterator[Dict]:
+    """
+    Iterate the values of the objects to export, without loading the whole queryset.
+
+    :param queryset: The queryset to export.
+    :param fields: List of field attribute names.
+    :param chunk_size: The number of rows fetched from the database at a time.
+
+    :returns: Iterator of dictionaries of field names and values.
+    """
+    for row in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+        yield dict(zip(fields, row))
+
+
+def iter_csv(
+    queryset: models.QuerySet,
+    fields: Optional[List[str]] = None,
+    chunk_size: int = 2000,
+) -> Iterator[str]:
+    """
+    Export the objects of a queryset as csv lines, one row at a time.
+
+    :param queryset: The queryset to export.
+    :param fields optional: List of field attribute names. Default to all fields but data.
+    :param chunk_size: The number of rows fetched from the database at a time.
+
+    :returns: Iterator of csv lines, starting with the header.
+    """
+    fields = fields or get_export_fields(queryset.model)
+    writer = csv.writer(Echo())
+
+    yield writer.writerow(fields)
+
+    for row in iter_export_rows(queryset, fields=fields, chunk_size=chunk_size):
+        yield writer.writerow(
+            [
+                json.dumps(value, cls=DjangoJSONEncoder)
+                if isinstance(value, (dict, list))
+                else value
+                for value in row.values()
+            ]
+        )
+
+
+def iter_jsonl(
+    queryset: models.QuerySet,
+    fields: Optional[List[str]] = None,
+    chunk_size: int = 2000,
+) -> Iterator[str]:
+    """
+    Export the objects of a queryset as JSON lines, one row at a time.
+
+    :param queryset: The queryset to export.
+    :param fields optional: List of field attribute names. Default to all fields but data.
+    :param chunk_size: The number of rows fetched from the database at a time.
+
+    :returns: Iterator of JSON objects, one per line.
+    """
+    fields = fields or get_export_fields(queryset.model)
+
+    for row in iter_export_rows(queryset, fields=fields, chunk_size=chunk_size):
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def iter_export(
+    queryset: models.QuerySet,
+    export_format: str,
+    fields: Optional[List[str]] = None,
+    chunk_size: int = 2000,
+) -> Iterator[str]:
+    """
+    Export the objects of a queryset in a given format, one row at a time.
+
+    :param queryset: The queryset to export.
+    :param export_format: csv or jsonl.
+    :param fields optional: List of field attribute names. Default to all fields but data.
+    :param chunk_size: The number of rows fetched from the database at a time.
+
+    :returns: Iterator of lines.
+    """
+    if export_format == "csv":
+        return iter_csv(queryset, fields=fields, chunk_size=chunk_size)
+
+    if export_format == "jsonl":
+        return iter_jsonl(queryset, fields=fields, chunk_size=chunk_size)
+
+    raise ValueError(f"The format {export_format} is not supported")
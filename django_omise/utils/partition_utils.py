@@ -0,0 +1,445 @@
+import copy
+import datetime
+import re
+
+from django.apps import apps
+from django.db import migrations, models
+from django.db.backends.ddl_references import Table
+from django.utils import timezone
+
+from typing import List, Optional
+
+# The models which can be partitioned by month of creation, by name.
+PARTITIONED_MODELS = {
+    "charge": "Charge",
+    "event": "Event",
+}
+
+PARTITION_KEY = "date_created"
+
+
+def get_partitioned_model(name: str) -> models.Model:
+    """
+    Get a model which can be partitioned.
+
+    :param name: One of charge or event.
+
+    :returns: The model class.
+    """
+    if name not in PARTITIONED_MODELS:
+        raise ValueError(f"The object {name} cannot be partitioned")
+
+    return apps.get_model(app_label="django_omise", model_name=PARTITIONED_MODELS[name])
+
+
+def month_start(value: datetime.date) -> datetime.date:
+    """
+    Get the first day of the month of a date.
+    """
+    return value.replace(day=1)
+
+
+def add_months(month: datetime.date, months: int) -> datetime.date:
+    """
+    Get the first day of the month a number of months after a month.
+
+    :param month: A date in the month.
+    :param months: The number of months, negative for previous months.
+
+    :returns: The first day of the month.
+    """
+    year, month_index = divmod(month.year * 12 + month.month - 1 + months, 12)
+    return datetime.date(year, month_index + 1, 1)
+
+
+def iter_months(first_month: datetime.date, last_month: datetime.date):
+    """
+    Iterate the months between two months, inclusive.
+
+    :returns: Iterator of the first days of the months.
+    """
+    month = month_start(first_month)
+
+    while month <= last_month:
+        yield month
+        month = add_months(month, 1)
+
+
+def get_month_bound(month: datetime.date) -> str:
+    """
+    Get the start of a month in the current time zone, as a timestamp literal.
+
+    :param month: The first day of the month.
+
+    :returns: The quoted timestamp in ISO 8601 format.
+    """
+    start = timezone.make_aware(datetime.datetime(month.year, month.month, 1))
+    return f"'{start.isoformat()}'"
+
+
+def get_partition_name(table: str, month: datetime.date) -> str:
+    """
+    Get the table name of the partition of a month, e.g. django_omise_charge_p202401.
+    """
+    return f"{table}_p{month:%Y%m}"
+
+
+def get_default_partition_name(table: str) -> str:
+    """
+    Get the table name of the partition of rows without a monthly partition.
+    """
+    return f"{table}_default"
+
+
+def get_ids_table_name(table: str) -> str:
+    """
+    Get the name of the table of the ids of a partitioned table, e.g. django_omise_charge_ids.
+    """
+    return f"{table}_ids"
+
+
+def is_partitioned(connection, table: str) -> bool:
+    """
+    Check if a table is a partitioned table.
+
+    :param connection: A PostgreSQL database connection.
+    :param table: The table name.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [table]
+        )
+        row = cursor.fetchone()
+
+    return row is not None and row[0] == "p"
+
+
+def get_partition_months(connection, table: str) -> List[datetime.date]:
+    """
+    Get the months of the monthly partitions of a table.
+
+    :param connection: A PostgreSQL database connection.
+    :param table: The table name of the partitioned table.
+
+    :returns: Sorted list of the first days of the months.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(%s)",
+            [table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})(\d{{2}})$")
+
+    return sorted(
+        datetime.date(int(match.group(1)), int(match.group(2)), 1)
+        for match in map(pattern.match, names)
+        if match
+    )
+
+
+def get_referencing_constraints(connection, table: str) -> List[tuple]:
+    """
+    Get the foreign key constraints of other tables which reference a table.
+
+    :param connection: A PostgreSQL database connection.
+    :param table: The table name.
+
+    :returns: List of (table name, constraint name, column name) tuples.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conrelid::regclass::text, conname, attname FROM pg_constraint "
+            "JOIN pg_attribute ON attrelid = conrelid AND attnum = conkey[1] "
+            "WHERE contype = 'f' AND confrelid = to_regclass(%s)",
+            [table],
+        )
+        return cursor.fetchall()
+
+
+def get_ids_sql(connection, model: models.Model) -> List[str]:
+    """
+    Get the statements creating the table of the ids of a partitioned table.
+
+    The primary key of a partitioned table includes the partition key, so the ids
+    are only unique in the table of ids. Triggers insert the id of every new row,
+    which fails for an existing id, and delete the id of every deleted row.
+
+    :param connection: A PostgreSQL database connection.
+    :param model: The model class of the partitioned table.
+
+    :returns: List of SQL statements.
+    """
+    quote_name = connection.ops.quote_name
+    table = model._meta.db_table
+    ids_table = quote_name(get_ids_table_name(table))
+    function = quote_name(f"{get_ids_table_name(table)}_sync")
+    pk = quote_name(model._meta.pk.column)
+
+    return [
+        f"CREATE TABLE {ids_table} ({pk} {model._meta.pk.db_type(connection)} PRIMARY KEY)",
+        f"INSERT INTO {ids_table} SELECT {pk} FROM {quote_name(table)}",
+        f"CREATE FUNCTION {function}() RETURNS trigger LANGUAGE plpgsql AS $$ BEGIN "
+        f"IF TG_OP = 'INSERT' THEN INSERT INTO {ids_table} VALUES (NEW.{pk}); "
+        f"ELSE DELETE FROM {ids_table} WHERE {pk} = OLD.{pk}; END IF; "
+        f"RETURN NULL; END $$",
+        f"CREATE TRIGGER {quote_name(get_ids_table_name(table))} "
+        f"AFTER INSERT OR DELETE ON {quote_name(table)} "
+        f"FOR EACH ROW EXECUTE FUNCTION {function}()",
+    ]
+
+
+def get_foreign_key_sql(schema_editor, model: models.Model, field) -> str:
+    """
+    Get the statement creating the constraint of a foreign key.
+
+    A foreign key to a partitioned table references the table of its ids instead.
+
+    :param schema_editor: A schema editor of the database.
+    :param model: The model class of the field.
+    :param field: The foreign key field.
+
+    :returns: The SQL statement.
+    """
+    statement = schema_editor._create_fk_sql(
+        model, field, "_fk_%(to_table)s_%(to_column)s"
+    )
+    to_table = field.target_field.model._meta.db_table
+
+    if schema_editor.connection.vendor == "postgresql" and is_partitioned(
+        schema_editor.connection, to_table
+    ):
+        statement.parts["to_table"] = Table(
+            get_ids_table_name(to_table), schema_editor.quote_name
+        )
+
+    return str(statement)
+
+
+class AddPartitionedForeignKey(migrations.AddField):
+    """
+    Add a foreign key to a model whose table can be partitioned.
+
+    Migrations adding a foreign key to a partitioned model use it instead of AddField,
+    because the table of a converted model has no unique id to reference.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        to_model = to_state.apps.get_model(app_label, self.model_name)
+
+        if not self.allow_migrate_model(schema_editor.connection.alias, to_model):
+            return
+
+        field = to_model._meta.get_field(self.name)
+        to_table = field.target_field.model._meta.db_table
+
+        if schema_editor.connection.vendor != "postgresql" or not is_partitioned(
+            schema_editor.connection, to_table
+        ):
+            return super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+        from_model = from_state.apps.get_model(app_label, self.model_name)
+        column_field = copy.copy(field)
+        column_field.db_constraint = False
+        schema_editor.add_field(from_model, column_field)
+        schema_editor.execute(get_foreign_key_sql(schema_editor, to_model, field))
+
+
+def get_convert_sql(
+    connection, model: models.Model, months: List[datetime.date]
+) -> List[str]:
+    """
+    Get the statements converting the table of a model to a table partitioned by month.
+
+    The rows are copied to the new partitions, so the table is locked while they run.
+    The primary key and the unique columns of the model are unique with the creation
+    date, as required by PostgreSQL. The ids stay unique in the table of ids, which
+    the foreign keys of other tables to the model reference instead. Rows outside of
+    the monthly partitions go to a default partition.
+
+    :param connection: A PostgreSQL database connection.
+    :param model: The model class.
+    :param months: The months to create a partition for.
+
+    :returns: List of SQL statements.
+    """
+    quote_name = connection.ops.quote_name
+    schema_editor = connection.schema_editor()
+    table = model._meta.db_table
+    unpartitioned_table = f"{table}_unpartitioned"
+    partition_key = quote_name(model._meta.get_field(PARTITION_KEY).column)
+
+    ids_table = quote_name(get_ids_table_name(table))
+    referencing_constraints = get_referencing_constraints(connection, table)
+
+    statements = [
+        f"ALTER TABLE {quote_name(referencing_table)} DROP CONSTRAINT {quote_name(name)}"
+        for referencing_table, name, column in referencing_constraints
+    ]
+
+    statements += [
+        f"ALTER TABLE {quote_name(table)} RENAME TO {quote_name(unpartitioned_table)}",
+        f"CREATE TABLE {quote_name(table)} (LIKE {quote_name(unpartitioned_table)} "
+        f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE ({partition_key})",
+        f"CREATE TABLE {quote_name(get_default_partition_name(table))} "
+        f"PARTITION OF {quote_name(table)} DEFAULT",
+    ]
+
+    for month in months:
+        statements += get_create_partition_sql(connection, model, month)
+
+    statements += [
+        f"INSERT INTO {quote_name(table)} SELECT * FROM {quote_name(unpartitioned_table)}",
+        f"DROP TABLE {quote_name(unpartitioned_table)}",
+        f"ALTER TABLE {quote_name(table)} ADD CONSTRAINT {quote_name(f'{table}_pkey')} "
+        f"PRIMARY KEY ({quote_name(model._meta.pk.column)}, {partition_key})",
+    ]
+
+    for field in model._meta.local_concrete_fields:
+        if field.unique and not field.primary_key:
+            name = schema_editor._create_index_name(
+                table, [field.column, PARTITION_KEY], suffix="_uniq"
+            )
+            statements.append(
+                f"ALTER TABLE {quote_name(table)} ADD CONSTRAINT {quote_name(name)} "
+                f"UNIQUE ({quote_name(field.column)}, {partition_key})"
+            )
+
+        if field.remote_field is not None and field.db_constraint:
+            statements.append(
+                str(
+                    schema_editor._create_fk_sql(
+                        model, field, "_fk_%(to_table)s_%(to_column)s"
+                    )
+                )
+            )
+
+    statements += [
+        str(statement) for statement in schema_editor._model_indexes_sql(model)
+    ]
+    statements += get_ids_sql(connection, model)
+    statements += [
+        f"ALTER TABLE {quote_name(referencing_table)} ADD CONSTRAINT {quote_name(name)} "
+        f"FOREIGN KEY ({quote_name(column)}) REFERENCES {ids_table} "
+        f"({quote_name(model._meta.pk.column)}){connection.ops.deferrable_sql()}"
+        for referencing_table, name, column in referencing_constraints
+    ]
+
+    return statements
+
+
+def get_create_partition_sql(
+    connection, model: models.Model, month: datetime.date, move_rows: bool = False
+) -> List[str]:
+    """
+    Get the statements creating the partition of a month.
+
+    :param connection: A database connection.
+    :param model: The model class of the partitioned table.
+    :param month: The first day of the month.
+    :param move_rows optional: Whether to move the rows of the month out of the
+        default partition, which would prevent creating the partition. Their ids are
+        deleted from the table of ids with the rows, and inserted again once moved.
+
+    :returns: List of SQL statements.
+    """
+    quote_name = connection.ops.quote_name
+    table = model._meta.db_table
+    partition = quote_name(get_partition_name(table, month))
+    default_partition = quote_name(get_default_partition_name(table))
+    partition_key = quote_name(model._meta.get_field(PARTITION_KEY).column)
+    start, end = get_month_bound(month), get_month_bound(add_months(month, 1))
+
+    if not move_rows:
+        return [
+            f"CREATE TABLE {partition} PARTITION OF {quote_name(table)} "
+            f"FOR VALUES FROM ({start}) TO ({end})"
+        ]
+
+    condition = f"{partition_key} >= {start} AND {partition_key} < {end}"
+
+    return [
+        f"CREATE TABLE {partition} (LIKE {quote_name(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        f"INSERT INTO {partition} SELECT * FROM {default_partition} WHERE {condition}",
+        f"DELETE FROM {default_partition} WHERE {condition}",
+        f"ALTER TABLE {quote_name(table)} ATTACH PARTITION {partition} "
+        f"FOR VALUES FROM ({start}) TO ({end})",
+        f"INSERT INTO {quote_name(get_ids_table_name(table))} "
+        f"SELECT {quote_name(model._meta.pk.column)} FROM {partition}",
+    ]
+
+
+def has_default_rows(connection, model: models.Model, month: datetime.date) -> bool:
+    """
+    Check if the default partition of a table has rows in a month.
+
+    :param connection: A PostgreSQL database connection.
+    :param model: The model class of the partitioned table.
+    :param month: The first day of the month.
+    """
+    quote_name = connection.ops.quote_name
+    partition_key = quote_name(model._meta.get_field(PARTITION_KEY).column)
+    default_partition = quote_name(get_default_partition_name(model._meta.db_table))
+    start, end = get_month_bound(month), get_month_bound(add_months(month, 1))
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {default_partition} "
+            f"WHERE {partition_key} >= {start} AND {partition_key} < {end})"
+        )
+        return cursor.fetchone()[0]
+
+
+def get_detach_partition_sql(
+    connection, model: models.Model, month: datetime.date, drop: bool = False
+) -> List[str]:
+    """
+    Get the statements detaching the partition of a month.
+
+    The detached partition is kept as a regular table unless it is dropped. The ids of
+    its rows stay in the table of ids, so that its objects are not created again and
+    the foreign keys of other tables to them stay valid.
+
+    :param connection: A database connection.
+    :param model: The model class of the partitioned table.
+    :param month: The first day of the month.
+    :param drop optional: Whether to drop the detached partition.
+
+    :returns: List of SQL statements.
+    """
+    quote_name = connection.ops.quote_name
+    table = model._meta.db_table
+    partition = quote_name(get_partition_name(table, month))
+
+    statements = [f"ALTER TABLE {quote_name(table)} DETACH PARTITION {partition}"]
+
+    if drop:
+        statements.append(f"DROP TABLE {partition}")
+
+    return statements
+
+
+def get_first_month(model: models.Model, using: str) -> Optional[datetime.date]:
+    """
+    Get the month of the oldest row of a model.
+
+    :param model: The model class.
+    :param using: The database alias.
+
+    :returns: The first day of the month, None if there are no rows.
+    """
+    first_created = (
+        model._base_manager.using(using)
+        .order_by()
+        .aggregate(first_created=models.Min(PARTITION_KEY))["first_created"]
+    )
+
+    if first_created is None:
+        return None
+
+    return month_start(timezone.localtime(first_created).date())
@@ -0,0 +1,365 @@
+import datetime
+import hashlib
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from django_omise.omise import omise
+from django_omise.utils.core_utils import (
+    RateLimiter,
+    count_omise_list,
+    iter_omise_list_pages,
+)
+
+from typing import Iterable, List, NamedTuple, Optional
+
+# The model, the Omise list path and the fields compared of each reconciled object.
+RECONCILED_RESOURCES = {
+    "charge": ("Charge", "charges", ["status", "amount", "refunded_amount"]),
+    "refund": ("Refund", "refunds", ["amount", "voided"]),
+}
+
+PAGE_LIMIT = 100
+
+# The number of recent days, up to today, whose objects are listed and compared by
+# checksums by default, as objects mostly change on Omise shortly after their creation.
+CHECKSUM_DAYS = 7
+
+
+class DayResult(NamedTuple):
+    """
+    The result of the reconciliation of the objects created on a day.
+
+    :param day: The day.
+    :param remote_count: The number of objects on Omise.
+    :param local_count: The number of objects on the database.
+    :param fixed: The ids of the objects missing or different on the database, which were saved.
+    :param unmatched: The ids of the objects on the database which Omise did not list on that day.
+    :param error: The error raised while requesting the objects on Omise, None if it succeeded.
+    :param listed: Whether the objects of the day were listed on Omise, or only counted.
+    """
+
+    day: datetime.date
+    remote_count: int
+    local_count: int
+    fixed: List[str]
+    unmatched: List[str]
+    error: Optional[Exception] = None
+    listed: bool = True
+
+    @property
+    def matched(self) -> bool:
+        return self.error is None and not self.fixed and not self.unmatched
+
+
+def get_reconciled_model(name: str) -> models.Model:
+    """
+    Get the model of a reconciled object.
+
+    :param name: One of charge or refund.
+
+    :returns: The model class.
+    """
+    if name not in RECONCILED_RESOURCES:
+        raise ValueError(f"The object {name} cannot be reconciled")
+
+    return apps.get_model(
+        app_label="django_omise", model_name=RECONCILED_RESOURCES[name][0]
+    )
+
+
+def get_day_range(day: datetime.date) -> tuple:
+    """
+    Get the start and the end of a day in the current time zone.
+
+    :returns: Tuple of aware datetimes, the end is exclusive.
+    """
+    start = timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+    end = timezone.make_aware(
+        datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time.min)
+    )
+    return start, end
+
+
+def normalize_value(value):
+    return "" if value is None else value
+
+
+def checksum(rows: Iterable[tuple]) -> int:
+    """
+    Compute a checksum of rows which does not depend on their order.
+
+    :param rows: Iterable of tuples of values.
+
+    :returns: The sum of the hashes of the rows, modulo 2 ** 64.
+    """
+    total = 0
+
+    for row in rows:
+        digest = hashlib.md5(repr(row).encode()).digest()
+        total = (total + int.from_bytes(digest[:8], "big")) % 2**64
+
+    return total
+
+
+def get_remote_row(omise_object: omise.Base, fields: List[str]) -> tuple:
+    """
+    Get the compared values of an Omise object.
+    """
+    return (omise_object.id,) + tuple(
+        normalize_value(getattr(omise_object, field, None)) for field in fields
+    )
+
+
+def get_local_rows(fields: List[str], queryset: models.QuerySet) -> dict:
+    """
+    Get the compared values of the objects of a queryset.
+
+    :returns: Dictionary of tuples of values by object id.
+    """
+    return {
+        row[0]: (row[0],) + tuple(normalize_value(value) for value in row[1:])
+        for row in queryset.values_list("id", *fields).iterator()
+    }
+
+
+def get_day_queryset(model: models.Model, day: datetime.date) -> models.QuerySet:
+    """
+    Get the objects of the current mode created on Omise on a day.
+    """
+    start, end = get_day_range(day)
+    return model._base_manager.filter(
+        livemode=settings.OMISE_LIVE_MODE,
+        created_at__gte=start,
+        created_at__lt=end,
+    )
+
+
+def count_omise_objects(
+    path: str, day: datetime.date, rate_limiter: Optional[RateLimiter] = None
+) -> int:
+    """
+    Count the objects created on Omise on a day, with one request.
+
+    :param path: The path of the Omise list, e.g. charges.
+    :param day: The day in the current time zone.
+    :param rate_limiter optional: The RateLimiter shared by the requests to Omise.
+
+    :returns: The number of objects.
+    """
+    start, end = get_day_range(day)
+
+    return count_omise_list(
+        path,
+        date_from=start,
+        date_to=end - datetime.timedelta(seconds=1),
+        rate_limiter=rate_limiter,
+    )
+
+
+def list_omise_objects(
+    path: str, day: datetime.date, rate_limiter: Optional[RateLimiter] = None
+) -> List[omise.Base]:
+    """
+    List the objects created on Omise on a day, one page of PAGE_LIMIT objects per request.
+
+    :param path: The path of the Omise list, e.g. charges.
+    :param day: The day in the current time zone.
+    :param rate_limiter optional: The RateLimiter shared by the requests to Omise.
+
+    :returns: List of Omise objects.
+    """
+    start, end = get_day_range(day)
+
+    return [
+        omise_object
+        for page in iter_omise_list_pages(
+            path,
+            date_from=start,
+            date_to=end - datetime.timedelta(seconds=1),
+            rate_limiter=rate_limiter,
+            limit=PAGE_LIMIT,
+        )
+        for omise_object in page
+    ]
+
+
+def reconcile_day(
+    model: models.Model,
+    fields: List[str],
+    day: datetime.date,
+    omise_objects: List[omise.Base],
+    fix: bool = True,
+) -> DayResult:
+    """
+    Compare the objects created on a day on Omise with the database, and save the differing objects.
+
+    The objects are matched to the day by their creation time on Omise. The checksums
+    of the day are compared first, and the objects are only compared one by one when
+    they differ. Objects missing from the day on the database are saved, which also
+    sets the creation time of the objects saved before it was stored.
+
+    :param model: The model class.
+    :param fields: The compared fields.
+    :param day: The day.
+    :param omise_objects: The objects created on Omise on that day.
+    :param fix optional: Whether to save the missing and different objects.
+
+    :returns: DayResult.
+    """
+    queryset = get_day_queryset(model, day)
+
+    remote_rows = {
+        omise_object.id: get_remote_row(omise_object, fields)
+        for omise_object in omise_objects
+    }
+    local_rows = get_local_rows(fields, queryset)
+
+    if len(remote_rows) == len(local_rows) and checksum(
+        remote_rows.values()
+    ) == checksum(local_rows.values()):
+        return DayResult(
+            day=day,
+            remote_count=len(remote_rows),
+            local_count=len(local_rows),
+            fixed=[],
+            unmatched=[],
+        )
+
+    differing_objects = [
+        omise_object
+        for omise_object in omise_objects
+        if local_rows.get(omise_object.id) != remote_rows[omise_object.id]
+    ]
+
+    if fix and differing_objects:
+        model.bulk_update_or_create_from_omise_objects(differing_objects)
+
+    return DayResult(
+        day=day,
+        remote_count=len(remote_rows),
+        local_count=queryset.count(),
+        fixed=[omise_object.id for omise_object in differing_objects],
+        unmatched=sorted(
+            object_id for object_id in local_rows if object_id not in remote_rows
+        ),
+    )
+
+
+def reconcile(
+    name: str,
+    date_from: datetime.date,
+    date_to: datetime.date,
+    fix: bool = True,
+    max_workers: int = 4,
+    rate_limit: Optional[float] = None,
+    checksums: bool = False,
+    checksum_days: int = CHECKSUM_DAYS,
+) -> List[DayResult]:
+    """
+    Reconcile the objects created in a date range on Omise with the database, day by day.
+
+    The objects of the recent days are listed, and their checksums compared with the
+    database, which finds the objects which changed on Omise, e.g. their status.
+    The objects of each older day are counted on Omise with one request first, and
+    only the days whose counts differ from the database are listed and compared, so
+    their changed objects are only found when checksums is set to list every day.
+
+    The requests are sent from a bounded pool of threads, and the days are compared
+    and fixed on the calling thread. A day failing to be requested does not stop the
+    others.
+
+    :param name: One of charge or refund.
+    :param date_from: The first day, inclusive.
+    :param date_to: The last day, inclusive.
+    :param fix optional: Whether to save the missing and different objects.
+    :param max_workers optional: The maximum number of concurrent requests to Omise.
+    :param rate_limit optional: The maximum number of requests to Omise per second.
+    :param checksums optional: Whether to list every day, and compare the checksums of the matching counts.
+    :param checksum_days optional: The number of recent days, up to today, to list
+        and compare by checksums, 0 to count every day first.
+
+    :returns: List of DayResult, one per day in order.
+    """
+    model = get_reconciled_model(name)
+    path, fields = RECONCILED_RESOURCES[name][1:]
+    rate_limiter = RateLimiter(rate=rate_limit)
+    days = [
+        date_from + datetime.timedelta(days=offset)
+        for offset in range((date_to - date_from).days + 1)
+    ]
+    checksums_from = timezone.localdate() - datetime.timedelta(days=checksum_days - 1)
+    listed_days = [day for day in days if checksums or day >= checksums_from]
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        listings = []
+        counts = [
+            (day, executor.submit(count_omise_objects, path, day, rate_limiter))
+            for day in days
+            if day not in listed_days
+        ]
+
+        for day, future in counts:
+            try:
+                remote_count = future.result()
+            except Exception as e:
+                results[day] = get_error_result(day, e)
+                continue
+
+            local_count = get_day_queryset(model, day).count()
+
+            if remote_count == local_count:
+                results[day] = DayResult(
+                    day=day,
+                    remote_count=remote_count,
+                    local_count=local_count,
+                    fixed=[],
+                    unmatched=[],
+                    listed=False,
+                )
+                continue
+
+            listings.append(
+                (day, executor.submit(list_omise_objects, path, day, rate_limiter))
+            )
+
+        listings += [
+            (day, executor.submit(list_omise_objects, path, day, rate_limiter))
+            for day in listed_days
+        ]
+
+        for day, future in listings:
+            try:
+                omise_objects = future.result()
+            except Exception as e:
+                results[day] = get_error_result(day, e)
+                continue
+
+            results[day] = reconcile_day(
+                model=model,
+                fields=fields,
+                day=day,
+                omise_objects=omise_objects,
+                fix=fix,
+            )
+
+    return [results[day] for day in days]
+
+
+def get_error_result(day: datetime.date, error: Exception) -> DayResult:
+    """
+    Get the result of a day whose objects failed to be requested on Omise.
+    """
+    return DayResult(
+        day=day,
+        remote_count=0,
+        local_count=0,
+        fixed=[],
+        unmatched=[],
+        error=error,
+    )
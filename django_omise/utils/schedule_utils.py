@@ -0,0 +1,244 @@
+import calendar
+import datetime
+
+from itertools import takewhile
+
+from typing import Dict, Iterator, List, Optional, Union
+
+WEEKDAYS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+
+# Omise returns the short forms, e.g. "2nd_monday", and accepts the long forms.
+WEEKS_OF_MONTH = {
+    "first": 0,
+    "second": 1,
+    "third": 2,
+    "fourth": 3,
+    "1st": 0,
+    "2nd": 1,
+    "3rd": 2,
+    "4th": 3,
+    "last": -1,
+}
+
+
+def to_date(value: Union[datetime.date, str]) -> datetime.date:
+    """
+    Convert a date in ISO 8601 format to a date.
+
+    :param value: A date or a string in ISO 8601 format.
+
+    :returns: The date.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date()
+
+    if isinstance(value, datetime.date):
+        return value
+
+    return datetime.date.fromisoformat(value[:10])
+
+
+def get_weekday_of_month(year: int, month: int, weekday_of_month: str) -> datetime.date:
+    """
+    Get the date of a weekday of month rule. e.g. "2nd_monday", "second_monday", "last_friday".
+
+    :param year: The year.
+    :param month: The month.
+    :param weekday_of_month: The weekday of month rule of Omise schedule.
+
+    :returns: The date in the given month.
+    """
+    week, weekday = weekday_of_month.split("_")
+    weekday = WEEKDAYS.index(weekday)
+
+    days = [
+        day
+        for day in calendar.Calendar().itermonthdates(year, month)
+        if day.month == month and day.weekday() == weekday
+    ]
+
+    return days[WEEKS_OF_MONTH[week]]
+
+
+def get_month_dates(
+    year: int, month: int, on: Dict, start_on: datetime.date
+) -> List[datetime.date]:
+    """
+    Get the dates of a monthly schedule in a given month.
+
+    :param year: The year.
+    :param month: The month.
+    :param on: The on rules of the schedule.
+    :param start_on: The start date of the schedule. Its day is used when there is no rule.
+
+    Days after the end of the month fall on the last day of the month.
+
+    :returns: Sorted list of dates.
+    """
+    if on.get("weekday_of_month"):
+        return [get_weekday_of_month(year, month, on["weekday_of_month"])]
+
+    days_in_month = calendar.monthrange(year, month)[1]
+    days_of_month = [day for day in on.get("days_of_month") or [] if day >= 1] or [
+        start_on.day
+    ]
+
+    return [
+        datetime.date(year, month, day)
+        for day in sorted(set(min(day, days_in_month) for day in days_of_month))
+    ]
+
+
+def iter_occurrences(
+    every: Optional[int],
+    period: str,
+    start_on: Union[datetime.date, str],
+    end_on: Optional[Union[datetime.date, str]] = None,
+    on: Optional[Dict] = None,
+    date_from: Optional[Union[datetime.date, str]] = None,
+) -> Iterator[datetime.date]:
+    """
+    Compute the occurrence dates of an Omise schedule, in order.
+
+    The iterator is endless when end_on is not given.
+
+    :param every: How often the schedule runs in its period. e.g. every 2 weeks.
+    :param period: "day", "week" or "month".
+    :param start_on: The start date of the schedule.
+    :param end_on optional: The end date of the schedule, inclusive.
+    :param on optional: The on rules of the schedule. weekdays for weekly schedules,
+        days_of_month or weekday_of_month for monthly schedules.
+    :param date_from optional: Only compute the occurrences on or after this date.
+
+    :returns: Iterator of dates.
+    """
+    start_on = to_date(start_on)
+    end_on = to_date(end_on) if end_on else None
+    date_from = max(start_on, to_date(date_from)) if date_from else start_on
+    every = every or 1
+    on = on or {}
+
+    if period == "day":
+        dates = iter_daily_dates(every=every, start_on=start_on, date_from=date_from)
+    elif period == "week":
+        dates = iter_weekly_dates(
+            every=every, start_on=start_on, date_from=date_from, on=on
+        )
+    elif period == "month":
+        dates = iter_monthly_dates(
+            every=every, start_on=start_on, date_from=date_from, on=on
+        )
+    else:
+        raise ValueError(f"The period {period} is not supported")
+
+    dates = (date for date in dates if date >= date_from)
+
+    if end_on is None:
+        return dates
+
+    return takewhile(lambda date: date <= end_on, dates)
+
+
+def iter_daily_dates(
+    every: int, start_on: datetime.date, date_from: datetime.date
+) -> Iterator[datetime.date]:
+    """
+    Iterate the dates of a daily schedule from the period of date_from.
+    """
+    periods = -(-(date_from - start_on).days // every)
+    date = start_on + datetime.timedelta(days=periods * every)
+
+    while True:
+        yield date
+        date += datetime.timedelta(days=every)
+
+
+def iter_weekly_dates(
+    every: int, start_on: datetime.date, date_from: datetime.date, on: Dict
+) -> Iterator[datetime.date]:
+    """
+    Iterate the dates of a weekly schedule from the period of date_from.
+    """
+    weekdays = sorted(
+        set(WEEKDAYS.index(weekday) for weekday in on.get("weekdays") or [])
+    ) or [start_on.weekday()]
+
+    first_week = start_on - datetime.timedelta(days=start_on.weekday())
+    periods = (date_from - first_week).days // 7 // every
+    week = first_week + datetime.timedelta(weeks=periods * every)
+
+    while True:
+        for weekday in weekdays:
+            date = week + datetime.timedelta(days=weekday)
+
+            if date >= start_on:
+                yield date
+
+        week += datetime.timedelta(weeks=every)
+
+
+def iter_monthly_dates(
+    every: int, start_on: datetime.date, date_from: datetime.date, on: Dict
+) -> Iterator[datetime.date]:
+    """
+    Iterate the dates of a monthly schedule from the period of date_from.
+    """
+    first_month = start_on.year * 12 + start_on.month - 1
+    month = date_from.year * 12 + date_from.month - 1
+    month = first_month + (month - first_month) // every * every
+
+    while True:
+        year, month_index = divmod(month, 12)
+
+        for date in get_month_dates(year, month_index + 1, on, start_on):
+            if date >= start_on:
+                yield date
+
+        month += every
+
+
+def get_occurrences_between(
+    every: Optional[int],
+    period: str,
+    start_on: Union[datetime.date, str],
+    date_from: Union[datetime.date, str],
+    date_to: Union[datetime.date, str],
+    end_on: Optional[Union[datetime.date, str]] = None,
+    on: Optional[Dict] = None,
+) -> List[datetime.date]:
+    """
+    Compute the occurrence dates of an Omise schedule in a date range.
+
+    :param every: How often the schedule runs in its period.
+    :param period: "day", "week" or "month".
+    :param start_on: The start date of the schedule.
+    :param date_from: The first date of the range, inclusive.
+    :param date_to: The last date of the range, inclusive.
+    :param end_on optional: The end date of the schedule, inclusive.
+    :param on optional: The on rules of the schedule.
+
+    :returns: List of dates.
+    """
+    date_to = to_date(date_to)
+
+    return list(
+        takewhile(
+            lambda date: date <= date_to,
+            iter_occurrences(
+                every=every,
+                period=period,
+                start_on=start_on,
+                end_on=end_on,
+                on=on,
+                date_from=date_from,
+            ),
+        )
+    )
@@ -5,26 +5,31 @@ from django.contrib import messages
 from django.contrib.messages.views import SuccessMessageMixin
 from django.urls import reverse_lazy, reverse
 from django.utils.translation import gettext_lazy as _
-from django.shortcuts import redirect
+from django.shortcuts import redirect, get_object_or_404
 
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import FormView, UpdateView, View, DetailView, TemplateView
 
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
 
 from .forms import AddCardForm
 from .mixins import CheckoutMixin
-from .models.core import Customer, Card, Charge
+from .models.core import Customer, Card, Charge, PendingCharge
 from .models.event import Event, EventType
 from .models.choices import ChargeStatus, Currency
 from .omise import omise
-from .utils.core_utils import update_or_create_from_omise_object
+from .routers import use_primary
+from .utils.core_utils import (
+    get_model_from_omise_object,
+    update_or_create_from_omise_object,
+)
 from .utils.event_utils import pre_event_handle, post_event_handle
 
 from typing import Dict
 
 # Create your views here.
 @csrf_exempt
+@use_primary()
 def omise_webhook_view(request):
 
     try:
@@ -59,7 +64,13 @@ def omise_webhook_view(request):
     )
 
     event_data = omise_event.data
-    if omise_event.key not in [EventType.CARD_DESTROY.value]:
+
+    # Deleted objects cannot be retrieved, and objects without a model would be discarded.
+    if omise_event.key not in [
+        EventType.CARD_DESTROY.value,
+        EventType.RECIPIENT_DESTROY.value,
+        EventType.TRANSFER_DESTROY.value,
+    ] and get_model_from_omise_object(omise_object=event_data):
         event_data.reload()
 
     related_object = update_or_create_from_omise_object(
@@ -100,9 +111,19 @@ class OmiseReturnURIView(View):
 
     def get(self, request, uid):
 
-        charge = Charge.objects.get(uid=uid)
-        omise_charge = omise.Charge.retrieve(charge.id)
-        charge = Charge.update_or_create_from_omise_object(omise_object=omise_charge)
+        charge = Charge.objects.filter(uid=uid).first()
+
+        if charge is None:
+            pending_charge = get_object_or_404(PendingCharge, uid=uid)
+            charge = pending_charge.find_charge()
+
+            if charge is None:
+                raise Http404("No charge found for this request.")
+        else:
+            omise_charge = omise.Charge.retrieve(charge.id)
+            charge = Charge.update_or_create_from_omise_object(
+                omise_object=omise_charge
+            )
 
         max_try = 5
         try_count = 0